@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Protocol, runtime_checkable
 
@@ -43,11 +44,12 @@ class RateLimiterProtocol(Protocol):
         ...
 
 
-@dataclass
+@dataclass(slots=True)
 class _BucketState:
     """Tracks attempts and lockout state for a single key (e.g. IP)."""
 
-    attempts: list[float] = field(default_factory=list)
+    # Oldest first; expired timestamps are popped from the left in place.
+    attempts: deque[float] = field(default_factory=deque)
     consecutive_failures: int = 0
     locked_until: float = 0.0
 
@@ -65,14 +67,17 @@ class InMemoryRateLimiter:
         self._buckets: dict[str, _BucketState] = {}
 
     def _get_bucket(self, key: str) -> _BucketState:
-        if key not in self._buckets:
-            self._buckets[key] = _BucketState()
-        return self._buckets[key]
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _BucketState()
+        return bucket
 
     def _prune(self, bucket: _BucketState, now: float) -> None:
         """Remove attempts outside the sliding window."""
         cutoff = now - self.config.window_seconds
-        bucket.attempts = [t for t in bucket.attempts if t > cutoff]
+        attempts = bucket.attempts
+        while attempts and attempts[0] <= cutoff:
+            attempts.popleft()
 
     def is_rate_limited(self, key: str) -> bool:
         """Return True if *key* should be rejected (429)."""
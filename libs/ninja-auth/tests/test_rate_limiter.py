@@ -123,3 +123,19 @@ def test_custom_rate_limiter_protocol():
     assert isinstance(limiter, RateLimiterProtocol)
     assert limiter.is_rate_limited("blocked")
     assert not limiter.is_rate_limited("allowed")
+
+
+def test_window_expiry_drops_only_old_attempts():
+    limiter = _make_limiter(max_attempts=2, window_seconds=10)
+    start = time.monotonic()
+    with patch("ninja_auth.rate_limiter.time") as mock_time:
+        mock_time.monotonic.return_value = start
+        limiter.record_attempt("1.2.3.4", success=True)
+        mock_time.monotonic.return_value = start + 5
+        limiter.record_attempt("1.2.3.4", success=True)
+        assert limiter.is_rate_limited("1.2.3.4")
+
+        # First attempt has left the window, the second has not
+        mock_time.monotonic.return_value = start + 11
+        assert not limiter.is_rate_limited("1.2.3.4")
+        assert list(limiter._buckets["1.2.3.4"].attempts) == [start + 5]
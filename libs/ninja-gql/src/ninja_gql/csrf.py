@@ -13,14 +13,18 @@ include the required header automatically.
 from __future__ import annotations
 
 import hmac
+import json
 import logging
+import re
 import secrets
 from typing import Any
 
 from pydantic import BaseModel, Field
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.responses import Response
+
+from ninja_gql.responses import encode_graphql_errors, graphql_error_response
 
 logger = logging.getLogger(__name__)
 
@@ -58,12 +62,13 @@ class CSRFConfig(BaseModel):
         default_factory=lambda: secrets.token_urlsafe(32),
         description="Secret for CSRF token generation.",
     )
-    exempt_paths: list[str] = Field(
-        default_factory=list,
+    exempt_paths: tuple[str, ...] = Field(
+        default=(),
         description="Paths exempt from CSRF checks.",
     )
 
-    model_config = {"extra": "forbid"}
+    # Frozen (and therefore hashable) so apps can be memoized per config.
+    model_config = {"extra": "forbid", "frozen": True}
 
 
 # ---------------------------------------------------------------------------
@@ -71,6 +76,11 @@ class CSRFConfig(BaseModel):
 # ---------------------------------------------------------------------------
 
 
+def _sign(secret: str, nonce: str) -> bytes:
+    """Return the truncated hex HMAC-SHA256 signature of *nonce* as ASCII bytes."""
+    return hmac.new(secret.encode(), nonce.encode(), "sha256").hexdigest()[:16].encode()
+
+
 def generate_csrf_token(secret: str) -> str:
     """Generate a signed CSRF token.
 
@@ -85,8 +95,7 @@ def generate_csrf_token(secret: str) -> str:
         A URL-safe token string.
     """
     nonce = secrets.token_urlsafe(24)
-    signature = hmac.new(secret.encode(), nonce.encode(), "sha256").hexdigest()[:16]
-    return f"{nonce}.{signature}"
+    return f"{nonce}.{_sign(secret, nonce).decode()}"
 
 
 def verify_csrf_token(token: str, secret: str) -> bool:
@@ -108,8 +117,9 @@ def verify_csrf_token(token: str, secret: str) -> bool:
     if len(parts) != 2:
         return False
     nonce, signature = parts
-    expected = hmac.new(secret.encode(), nonce.encode(), "sha256").hexdigest()[:16]
-    return hmac.compare_digest(signature, expected)
+    # Compare bytes: ``compare_digest`` raises TypeError on non-ASCII str input,
+    # and a tampered token must be rejected, not crash the request.
+    return hmac.compare_digest(signature.encode(), _sign(secret, nonce))
 
 
 # ---------------------------------------------------------------------------
@@ -117,6 +127,13 @@ def verify_csrf_token(token: str, secret: str) -> bool:
 # ---------------------------------------------------------------------------
 
 _MUTATION_INDICATORS = frozenset({"mutation"})
+# Anchored match: skips leading whitespace in place instead of copying the
+# whole (possibly multi-KB) query via ``strip().lower()``.
+_MUTATION_PREFIX = re.compile(r"\s*mutation", re.IGNORECASE)
+# Raw-body fast path for the usual ``{"query": "mutation ...`` layout.  Only a
+# match is trusted: duplicate or escaped ``query`` keys mean a miss must still
+# fall back to parsing the whole body.
+_MUTATION_BODY = re.compile(rb'\s*\{\s*"query"\s*:\s*"\s*(?i:mutation)')
 
 
 def _is_mutation_request(body: dict[str, Any]) -> bool:
@@ -134,11 +151,13 @@ def _is_mutation_request(body: dict[str, Any]) -> bool:
     """
     query = body.get("query", "")
     if isinstance(query, str):
-        stripped = query.strip().lower()
-        return stripped.startswith("mutation")
+        return _MUTATION_PREFIX.match(query) is not None
     return False
 
 
+_INVALID_TOKEN_BODY = encode_graphql_errors("CSRF validation failed: invalid token")
+
+
 # ---------------------------------------------------------------------------
 # ASGI Middleware
 # ---------------------------------------------------------------------------
@@ -158,6 +177,9 @@ class CSRFMiddleware(BaseHTTPMiddleware):
 
     def __init__(self, app: Any, config: CSRFConfig | None = None) -> None:
         self.csrf_config = config or CSRFConfig()
+        self._missing_header_body = encode_graphql_errors(
+            f"CSRF validation failed: missing required header '{self.csrf_config.header_name}'"
+        )
         super().__init__(app)
 
     async def dispatch(self, request: Request, call_next: Any) -> Response:
@@ -177,13 +199,18 @@ class CSRFMiddleware(BaseHTTPMiddleware):
         # Try to determine if this is a mutation
         content_type = request.headers.get("content-type", "")
         if "application/json" in content_type:
-            try:
-                body = await request.json()
-            except Exception:
-                # Can't parse body — let downstream handle it
-                return await call_next(request)
-
-            if _is_mutation_request(body):
+            raw = await request.body()
+            if _MUTATION_BODY.match(raw):
+                is_mutation = True
+            else:
+                try:
+                    body = json.loads(raw)
+                except (ValueError, RecursionError):
+                    # Can't parse body — let downstream handle it
+                    return await call_next(request)
+                is_mutation = isinstance(body, dict) and _is_mutation_request(body)
+
+            if is_mutation:
                 # Check for required custom header
                 header_value = request.headers.get(self.csrf_config.header_name)
                 if not header_value:
@@ -192,27 +219,12 @@ class CSRFMiddleware(BaseHTTPMiddleware):
                         self.csrf_config.header_name,
                         request.client.host if request.client else "unknown",
                     )
-                    return JSONResponse(
-                        status_code=403,
-                        content={
-                            "errors": [
-                                {
-                                    "message": (
-                                        f"CSRF validation failed: "
-                                        f"missing required header '{self.csrf_config.header_name}'"
-                                    ),
-                                }
-                            ]
-                        },
-                    )
+                    return graphql_error_response(403, self._missing_header_body)
 
                 # If a specific value is expected, validate it
                 if self.csrf_config.header_value is not None and header_value != self.csrf_config.header_value:
                     logger.warning("CSRF check failed: invalid header value")
-                    return JSONResponse(
-                        status_code=403,
-                        content={"errors": [{"message": "CSRF validation failed: invalid token"}]},
-                    )
+                    return graphql_error_response(403, _INVALID_TOKEN_BODY)
 
         response = await call_next(request)
 
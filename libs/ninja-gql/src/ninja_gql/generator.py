@@ -54,6 +54,10 @@ class GqlGenerator:
         self.schema = schema
         self._types: dict[str, type] = {}
         self._input_types: dict[str, type] = {}
+        # Explicit flags rather than dict truthiness so an entity-less ASD is memoized too.
+        self._types_ready = False
+        self._input_types_ready = False
+        self._embeddable: dict[str, bool] = {}
         self._entity_map: dict[str, EntitySchema] = {e.name: e for e in schema.entities}
         self._rel_by_source: dict[str, list[RelationshipSchema]] = {}
         for rel in schema.relationships:
@@ -66,7 +70,7 @@ class GqlGenerator:
 
         Returns a mapping ``{EntityName: StrawberryType}``.
         """
-        if self._types:
+        if self._types_ready:
             return self._types
 
         # First pass: create basic types (no relationships yet)
@@ -77,6 +81,7 @@ class GqlGenerator:
         for entity in self.schema.entities:
             self._attach_relationships(entity)
 
+        self._types_ready = True
         return self._types
 
     def generate_input_types(self) -> dict[str, tuple[type, type]]:
@@ -84,23 +89,27 @@ class GqlGenerator:
 
         Returns ``{EntityName: (CreateInput, UpdateInput)}``.
         """
-        if self._input_types:
+        if self._input_types_ready:
             return self._input_types
 
         for entity in self.schema.entities:
             create_cls, update_cls = self._make_input_types(entity)
             self._input_types[entity.name] = (create_cls, update_cls)
+        self._input_types_ready = True
         return self._input_types
 
     def get_type(self, entity_name: str) -> type:
         """Return the generated Strawberry type for *entity_name*."""
-        if not self._types:
+        if not self._types_ready:
             self.generate_types()
         return self._types[entity_name]
 
     def has_embeddable_fields(self, entity: EntitySchema) -> bool:
         """Return True if the entity has any field with embedding config."""
-        return any(f.embedding is not None for f in entity.fields)
+        cached = self._embeddable.get(entity.name)
+        if cached is None:
+            cached = self._embeddable[entity.name] = any(f.embedding is not None for f in entity.fields)
+        return cached
 
     # -- internals -----------------------------------------------------------
 
@@ -7,14 +7,18 @@ with stricter limits configurable for mutations.
 
 from __future__ import annotations
 
+import json
 import logging
+import re
 from typing import Any
 
 from ninja_auth.rate_limiter import RateLimitConfig, RateLimiter
 from pydantic import BaseModel, Field
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.responses import Response
+
+from ninja_gql.responses import encode_graphql_errors, graphql_error_response
 
 logger = logging.getLogger(__name__)
 
@@ -61,7 +65,8 @@ class GraphQLRateLimitConfig(BaseModel):
         description="Path to the GraphQL endpoint.",
     )
 
-    model_config = {"extra": "forbid"}
+    # Frozen (and therefore hashable) so apps can be memoized per config.
+    model_config = {"extra": "forbid", "frozen": True}
 
 
 # ---------------------------------------------------------------------------
@@ -79,14 +84,27 @@ def _client_ip(request: Request) -> str:
     return "unknown"
 
 
+_MUTATION_PREFIX = re.compile(r"\s*mutation", re.IGNORECASE)
+# Raw-body fast path, see ``ninja_gql.csrf._MUTATION_BODY``.
+_MUTATION_BODY = re.compile(rb'\s*\{\s*"query"\s*:\s*"\s*(?i:mutation)')
+
+
 def _is_mutation(body: dict[str, Any]) -> bool:
     """Check if the GraphQL request body contains a mutation."""
     query = body.get("query", "")
     if isinstance(query, str):
-        return query.strip().lower().startswith("mutation")
+        return _MUTATION_PREFIX.match(query) is not None
     return False
 
 
+# Rejection bodies never vary per request, so encode them once at import.
+_LIMIT_EXCEEDED_BODIES = {
+    op_type: encode_graphql_errors(f"Rate limit exceeded for {op_type} operations. Please try again later.")
+    for op_type in ("query", "mutation")
+}
+_USER_LIMIT_EXCEEDED_BODY = encode_graphql_errors("Per-user rate limit exceeded. Please try again later.")
+
+
 # ---------------------------------------------------------------------------
 # Middleware
 # ---------------------------------------------------------------------------
@@ -146,11 +164,15 @@ class GraphQLRateLimitMiddleware(BaseHTTPMiddleware):
         is_mutation = False
         content_type = request.headers.get("content-type", "")
         if "application/json" in content_type:
-            try:
-                body = await request.json()
-                is_mutation = _is_mutation(body)
-            except Exception:
-                pass
+            raw = await request.body()
+            if _MUTATION_BODY.match(raw):
+                is_mutation = True
+            else:
+                try:
+                    body = json.loads(raw)
+                    is_mutation = isinstance(body, dict) and _is_mutation(body)
+                except (ValueError, RecursionError):
+                    pass
 
         # Select limiter based on operation type
         limiter = self._mutation_limiter if is_mutation else self._query_limiter
@@ -163,16 +185,7 @@ class GraphQLRateLimitMiddleware(BaseHTTPMiddleware):
                 ip,
                 op_type,
             )
-            return JSONResponse(
-                status_code=429,
-                content={
-                    "errors": [
-                        {
-                            "message": (f"Rate limit exceeded for {op_type} operations. Please try again later."),
-                        }
-                    ]
-                },
-            )
+            return graphql_error_response(429, _LIMIT_EXCEEDED_BODIES[op_type])
 
         # Per-user check (if enabled and user is authenticated)
         if self._config.per_user_enabled:
@@ -184,16 +197,7 @@ class GraphQLRateLimitMiddleware(BaseHTTPMiddleware):
                         "GraphQL per-user rate limit exceeded for user %s",
                         user_id,
                     )
-                    return JSONResponse(
-                        status_code=429,
-                        content={
-                            "errors": [
-                                {
-                                    "message": "Per-user rate limit exceeded. Please try again later.",
-                                }
-                            ]
-                        },
-                    )
+                    return graphql_error_response(429, _USER_LIMIT_EXCEEDED_BODY)
 
         # Record the attempt and proceed
         limiter.record_attempt(limit_key, success=True)
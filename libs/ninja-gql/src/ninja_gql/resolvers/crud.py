@@ -10,6 +10,7 @@ bridge: the caller must have ``write:<domain>.<entity>`` (create/update) or
 ``delete:<domain>.<entity>`` permission for the target entity.
 """
 
+from functools import lru_cache
 from typing import Any, Callable, Optional
 
 import strawberry
@@ -18,6 +19,7 @@ from ninja_persistence.protocols import Repository
 
 from ninja_gql.validation import (
     InputValidationError,
+    _plan_for,
     validate_create_input,
     validate_update_input,
 )
@@ -62,10 +64,17 @@ def make_list_resolver(
     entity: EntitySchema,
     gql_type: type,
     repo_getter: Callable[[str], Repository[Any]],
+    max_limit: int | None = None,
 ) -> Callable:
-    """Return an async resolver: ``list_{entity}(limit, offset) -> [GqlType]``."""
+    """Return an async resolver: ``list_{entity}(limit, offset) -> [GqlType]``.
+
+    A *limit* above *max_limit* is capped to it, so a page never holds more
+    rows than the complexity rule assumed when it clamped the page size.
+    """
 
     async def resolver(limit: int = 100, offset: int = 0) -> list[gql_type]:  # type: ignore[valid-type]
+        if max_limit is not None and limit > max_limit:
+            limit = max_limit
         repo = repo_getter(entity.name)
         rows = await repo.find_many(limit=limit)
         return [gql_type(**r) for r in rows[offset:]]
@@ -88,6 +97,7 @@ def make_create_resolver(
 
     Authorization: requires ``write:<domain>.<entity>`` permission.
     """
+    _plan_for(entity)  # build the validation plan with the schema, not on the first mutation
 
     async def resolver(input: strawberry.scalars.JSON) -> gql_type:  # type: ignore[valid-type]
         _check_mutation_auth("write", domain, entity.name)
@@ -117,6 +127,7 @@ def make_update_resolver(
 
     Authorization: requires ``write:<domain>.<entity>`` permission.
     """
+    _plan_for(entity)  # build the validation plan with the schema, not on the first mutation
 
     async def resolver(id: str, patch: strawberry.scalars.JSON) -> Optional[gql_type]:  # type: ignore[valid-type]
         _check_mutation_auth("write", domain, entity.name)
@@ -153,6 +164,7 @@ def make_delete_resolver(
     return resolver
 
 
+@lru_cache(maxsize=4096)
 def _snake(name: str) -> str:
     """PascalCase → snake_case."""
     out: list[str] = []
@@ -0,0 +1,27 @@
+"""GraphQL-over-HTTP error responses shared by the ASGI middlewares.
+
+The middlewares reject requests before they reach Strawberry, so they build
+the ``{"errors": [...]}`` envelope themselves.  Bodies are encoded to bytes
+up front and returned through a plain ``Response``, which skips the
+``JSONResponse.render`` step on every rejection.
+"""
+
+from __future__ import annotations
+
+import json
+
+from starlette.responses import Response
+
+
+def encode_graphql_errors(*messages: str) -> bytes:
+    """Encode *messages* as a compact GraphQL error envelope.
+
+    Produces the same bytes as Starlette's ``JSONResponse`` would.
+    """
+    envelope = {"errors": [{"message": message} for message in messages]}
+    return json.dumps(envelope, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode()
+
+
+def graphql_error_response(status_code: int, body: bytes) -> Response:
+    """Wrap a pre-encoded error envelope in an ``application/json`` response."""
+    return Response(body, status_code=status_code, media_type="application/json")
@@ -5,11 +5,14 @@ optional repository-getter callback, and returns a fully executable
 ``strawberry.Schema`` with configurable security extensions.
 """
 
+import hashlib
+from functools import partial
 from typing import Any, Callable
 
 import strawberry
 from ninja_core.schema.project import AgenticSchema
 from ninja_persistence.protocols import Repository
+from strawberry.extensions import ParserCache, SchemaExtension, ValidationCache
 
 from ninja_gql.generator import GqlGenerator
 from ninja_gql.resolvers.agent import AgentRouter, make_agent_query_resolver
@@ -25,6 +28,10 @@ from ninja_gql.resolvers.semantic import make_search_resolver
 from ninja_gql.resolvers.subscription import make_subscription_resolver
 from ninja_gql.security import GraphQLSecurityConfig, build_security_extensions
 
+# ASD digest -> SDL string, populated by :func:`build_schema_sdl`.
+_SDL_CACHE: dict[str, str] = {}
+_SDL_CACHE_MAX = 64
+
 
 def build_schema(
     asd: AgenticSchema,
@@ -48,6 +55,61 @@ def build_schema(
         settings are applied (introspection enabled, depth limit 10,
         complexity limit 1000).
     """
+    max_list_size = (security_config or GraphQLSecurityConfig()).max_list_size
+    query, mutation, subscription = _build_root_types(asd, repo_getter, agent_router, max_list_size)
+
+    return strawberry.Schema(
+        query=query,
+        mutation=mutation,
+        subscription=subscription,
+        extensions=[*_document_cache_extensions(security_config), *build_security_extensions(security_config)],
+    )
+
+
+def _document_cache_extensions(
+    security_config: GraphQLSecurityConfig | None = None,
+) -> list[Callable[[], SchemaExtension]]:
+    """Return parse/validate cache factories sized by *security_config*.
+
+    Repeated operations (the normal case for a generated client) skip
+    re-parsing and re-validating, including the depth and complexity rules.
+    Both caches are needed: validation results are keyed by document
+    identity, which only the parser cache keeps stable across requests.
+    """
+    size = (security_config or GraphQLSecurityConfig()).document_cache_size
+    if size == 0:
+        return []
+    return [partial(ParserCache, maxsize=size), partial(ValidationCache, maxsize=size)]
+
+
+def build_schema_sdl(asd: AgenticSchema) -> str:
+    """Return the generated schema as an SDL string (no resolvers needed).
+
+    Security extensions only affect execution, so they are skipped here.
+    Results are cached by a digest of the serialized ASD, making repeated
+    calls for an unchanged schema (e.g. CI validation) effectively free.
+    """
+    key = hashlib.blake2b(asd.model_dump_json().encode(), digest_size=16).hexdigest()
+    sdl = _SDL_CACHE.get(key)
+    if sdl is None:
+        query, mutation, subscription = _build_root_types(asd)
+        sdl = str(strawberry.Schema(query=query, mutation=mutation, subscription=subscription))
+        if len(_SDL_CACHE) >= _SDL_CACHE_MAX:
+            _SDL_CACHE.clear()
+        _SDL_CACHE[key] = sdl
+    return sdl
+
+
+def _build_root_types(
+    asd: AgenticSchema,
+    repo_getter: Callable[[str], Repository[Any]] | None = None,
+    agent_router: AgentRouter | None = None,
+    max_list_size: int | None = None,
+) -> tuple[type, type, type]:
+    """Generate the root ``Query``, ``Mutation`` and ``Subscription`` types for *asd*.
+
+    *max_list_size* caps the ``limit`` argument of the generated list queries.
+    """
     gen = GqlGenerator(asd)
     types = gen.generate_types()
     gen.generate_input_types()
@@ -59,54 +121,28 @@ def build_schema(
 
         repo_getter = _no_repo
 
-    # -- build Query fields --------------------------------------------------
-    query_annotations: dict[str, Any] = {}
-    query_ns: dict[str, Any] = {"__annotations__": query_annotations}
+    # -- entity→domain lookup for mutation authorization ---------------------
+    entity_domain = {ent_name: domain.name for domain in asd.domains for ent_name in domain.entities}
+
+    # -- build Query / Mutation / Subscription fields in a single pass ---------
+    query_ns: dict[str, Any] = {"__annotations__": {}}
+    mutation_ns: dict[str, Any] = {"__annotations__": {}}
+    sub_ns: dict[str, Any] = {"__annotations__": {}}
 
     for entity in asd.entities:
         gql_type = types[entity.name]
         snake = _snake(entity.name)
+        domain = entity_domain.get(entity.name)
 
-        # get
-        get_name = f"get_{snake}"
-        get_fn = make_get_resolver(entity, gql_type, repo_getter)
-        query_ns[get_name] = strawberry.field(resolver=get_fn)
-
-        # list
-        list_name = f"list_{snake}"
-        list_fn = make_list_resolver(entity, gql_type, repo_getter)
-        query_ns[list_name] = strawberry.field(resolver=list_fn)
-
-        # semantic search (only for entities with embeddable fields)
+        # queries: get / list / semantic search (only for entities with embeddable fields)
+        query_ns[f"get_{snake}"] = strawberry.field(resolver=make_get_resolver(entity, gql_type, repo_getter))
+        list_fn = make_list_resolver(entity, gql_type, repo_getter, max_limit=max_list_size)
+        query_ns[f"list_{snake}"] = strawberry.field(resolver=list_fn)
         if gen.has_embeddable_fields(entity):
-            search_name = f"search_{snake}"
             search_fn = make_search_resolver(entity, gql_type, repo_getter)
-            query_ns[search_name] = strawberry.field(resolver=search_fn)
-
-    # agent queries per domain
-    for domain in asd.domains:
-        ask_name = f"ask_{domain.name.lower().replace(' ', '_')}"
-        ask_fn = make_agent_query_resolver(domain.name, agent_router)
-        query_ns[ask_name] = strawberry.field(resolver=ask_fn)
-
-    query_cls = type("Query", (), query_ns)
-    Query = strawberry.type(query_cls, description="Auto-generated root Query")
-
-    # -- build entity→domain lookup for authorization -------------------------
-    entity_domain: dict[str, str] = {}
-    for domain in asd.domains:
-        for ent_name in domain.entities:
-            entity_domain[ent_name] = domain.name
-
-    # -- build Mutation fields -----------------------------------------------
-    mutation_annotations: dict[str, Any] = {}
-    mutation_ns: dict[str, Any] = {"__annotations__": mutation_annotations}
-
-    for entity in asd.entities:
-        gql_type = types[entity.name]
-        snake = _snake(entity.name)
-        domain = entity_domain.get(entity.name)
+            query_ns[f"search_{snake}"] = strawberry.field(resolver=search_fn)
 
+        # mutations
         create_fn = make_create_resolver(entity, gql_type, repo_getter, domain=domain)
         mutation_ns[f"create_{snake}"] = strawberry.mutation(resolver=create_fn)
 
@@ -116,33 +152,22 @@ def build_schema(
         delete_fn = make_delete_resolver(entity, repo_getter, domain=domain)
         mutation_ns[f"delete_{snake}"] = strawberry.mutation(resolver=delete_fn)
 
-    mutation_cls = type("Mutation", (), mutation_ns)
-    Mutation = strawberry.type(mutation_cls, description="Auto-generated root Mutation")
+        # subscriptions
+        sub_ns[f"on_{snake}_changed"] = strawberry.subscription(resolver=make_subscription_resolver(entity))
+
+    # agent queries per domain
+    for domain in asd.domains:
+        ask_name = f"ask_{domain.name.lower().replace(' ', '_')}"
+        ask_fn = make_agent_query_resolver(domain.name, agent_router)
+        query_ns[ask_name] = strawberry.field(resolver=ask_fn)
 
-    # -- build Subscription fields -------------------------------------------
-    sub_annotations: dict[str, Any] = {}
-    sub_ns: dict[str, Any] = {"__annotations__": sub_annotations}
+    query_cls = type("Query", (), query_ns)
+    Query = strawberry.type(query_cls, description="Auto-generated root Query")
 
-    for entity in asd.entities:
-        snake = _snake(entity.name)
-        sub_fn = make_subscription_resolver(entity)
-        sub_ns[f"on_{snake}_changed"] = strawberry.subscription(resolver=sub_fn)
+    mutation_cls = type("Mutation", (), mutation_ns)
+    Mutation = strawberry.type(mutation_cls, description="Auto-generated root Mutation")
 
     sub_cls = type("Subscription", (), sub_ns)
     Subscription = strawberry.type(sub_cls, description="Auto-generated root Subscription")
 
-    # -- build security extensions -------------------------------------------
-    extensions = build_security_extensions(security_config)
-
-    return strawberry.Schema(
-        query=Query,
-        mutation=Mutation,
-        subscription=Subscription,
-        extensions=extensions,
-    )
-
-
-def build_schema_sdl(asd: AgenticSchema) -> str:
-    """Return the generated schema as an SDL string (no resolvers needed)."""
-    schema = build_schema(asd)
-    return str(schema)
+    return Query, Mutation, Subscription
@@ -1,20 +1,31 @@
 """GraphQL security extensions — introspection control, depth & complexity limiting.
 
-Provides Strawberry schema extensions that enforce configurable security
+Provides graphql-core validation rules, installed through Strawberry's
+``AddValidationRules`` extension, that enforce configurable security
 policies on incoming GraphQL operations.
 """
 
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any
-
-from graphql import parse as gql_parse
+from functools import cache, partial
+from typing import Any, Callable, Mapping
+
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    InlineFragmentNode,
+    IntValueNode,
+    OperationDefinitionNode,
+    ValidationContext,
+    ValidationRule,
+)
+from graphql.validation import ASTValidationRule
 from pydantic import BaseModel, Field
-from strawberry.extensions import SchemaExtension
-
-if TYPE_CHECKING:
-    from strawberry.types import ExecutionContext
+from strawberry.extensions import AddValidationRules, SchemaExtension
 
 logger = logging.getLogger(__name__)
 
@@ -24,11 +35,17 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 
+# Depth/complexity limits at or above this value are treated as "no limit"
+# and the corresponding check is not installed at all.
+UNLIMITED = 2**31 - 1
+
+
 class GraphQLSecurityConfig(BaseModel):
     """Security configuration for the generated GraphQL layer.
 
-    Controls introspection visibility, query depth limits, and query
-    complexity thresholds.
+    Controls introspection visibility, query depth limits, query
+    complexity thresholds, and the size of the document caches.  Setting a limit to :data:`UNLIMITED` removes
+    that check entirely, e.g. behind a persisted-query gateway.
     """
 
     introspection_enabled: bool = Field(
@@ -53,50 +70,95 @@ class GraphQLSecurityConfig(BaseModel):
     list_field_multiplier: int = Field(
         default=10,
         ge=1,
-        description="Cost multiplier for fields that return lists.",
+        description=(
+            "Cost multiplier for fields that return lists when no explicit page size (first/last/limit) is given."
+        ),
+    )
+    max_list_size: int = Field(
+        default=100,
+        ge=1,
+        description="Upper bound applied to an explicit page size argument when estimating fan-out.",
+    )
+    document_cache_size: int = Field(
+        default=128,
+        ge=0,
+        description=(
+            "Entries kept in the LRU caches for parsed and validated documents, keyed by query text. "
+            "Bounded so unique queries cannot grow memory without limit; 0 disables caching."
+        ),
     )
 
     model_config = {"extra": "forbid"}
 
 
 # ---------------------------------------------------------------------------
-# Introspection control extension
+# Introspection control rule
 # ---------------------------------------------------------------------------
 
 _INTROSPECTION_FIELDS = frozenset({"__schema", "__type"})
 
 
-class IntrospectionControlExtension(SchemaExtension):
-    """Blocks introspection queries when disabled via configuration.
+class IntrospectionControlRule(ValidationRule):
+    """Rejects operations that select ``__schema`` or ``__type``.
 
-    Strawberry extension that inspects the raw query string for
-    ``__schema`` or ``__type`` keywords and rejects the request when
-    introspection is disabled.
+    Installed only when introspection is disabled.  As a validation rule it
+    runs on the document Strawberry has already parsed, and its verdict is
+    cached with the rest of validation.  Fields selected through fragments
+    are visited too, while names that merely appear in string arguments,
+    comments, or aliases are not.  ``__typename`` is not treated as
+    introspection: clients routinely request it and it exposes nothing
+    beyond the concrete type name.
     """
 
-    def __init__(self, *, enabled: bool = True, **kwargs: Any) -> None:
-        self._enabled = enabled
-        super().__init__(**kwargs)
-
-    def on_operation(self) -> Any:
-        """Check for introspection fields before execution."""
-        execution_context: ExecutionContext = self.execution_context
-        if not self._enabled and execution_context.query:
-            # Fast-path: check raw query string for introspection keywords
-            if "__schema" in execution_context.query or "__type" in execution_context.query:
-                logger.warning("Introspection query blocked by security policy")
-                raise PermissionError("Introspection is disabled. Set NINJASTACK_ENV=development to enable.")
-        yield
+    def enter_field(self, node: FieldNode, *_args: Any) -> None:
+        if node.name.value in _INTROSPECTION_FIELDS:
+            logger.warning("Introspection query blocked by security policy")
+            self.report_error(
+                GraphQLError("Introspection is disabled. Set NINJASTACK_ENV=development to enable.", node)
+            )
 
 
 # ---------------------------------------------------------------------------
-# Query depth validation extension
+# Query depth validation rule
 # ---------------------------------------------------------------------------
 
 
-def _measure_depth(node: Any, current: int = 0) -> int:
+def _fragment_map(document: DocumentNode) -> dict[str, FragmentDefinitionNode]:
+    """Index the fragment definitions of *document* by name."""
+    return {d.name.value: d for d in document.definitions if isinstance(d, FragmentDefinitionNode)}
+
+
+def _resolve_spread(
+    spread: FragmentSpreadNode,
+    fragments: Mapping[str, FragmentDefinitionNode] | None,
+    visited: frozenset[str],
+) -> FragmentDefinitionNode | None:
+    """Return the fragment a spread refers to, or ``None`` if unknown or cyclic.
+
+    graphql-core's own rules report unknown and cyclic fragments; this guard
+    only keeps the walkers below from recursing forever.  Repeated spreads
+    of the same fragment are handled by the walkers' per-document memo.
+    """
+    name = spread.name.value
+    if fragments is None or name in visited:
+        return None
+    return fragments.get(name)
+
+
+def _measure_depth(
+    node: Any,
+    current: int = 0,
+    fragments: Mapping[str, FragmentDefinitionNode] | None = None,
+    _visited: frozenset[str] = frozenset(),
+    _memo: dict[str, int] | None = None,
+) -> int:
     """Recursively measure the deepest selection depth in a parsed AST node.
 
+    Inline fragments and fragment spreads are expanded in place: they do
+    not add a level themselves, but the fields they select do.  Each named
+    fragment is measured once per *_memo* and its depth reused for every
+    further spread, so a fragment spread many times is not walked again.
+
     Parameters
     ----------
     node:
@@ -104,6 +166,9 @@ def _measure_depth(node: Any, current: int = 0) -> int:
         ``FieldNode``).
     current:
         Current nesting depth.
+    fragments:
+        Fragment definitions of the document, keyed by name.  Spreads of
+        fragments not found here are ignored.
 
     Returns
     -------
@@ -114,66 +179,100 @@ def _measure_depth(node: Any, current: int = 0) -> int:
     if selection_set is None or not selection_set.selections:
         return current
 
+    if _memo is None:
+        _memo = {}
     max_child = current
     for selection in selection_set.selections:
-        child_depth = _measure_depth(selection, current + 1)
+        if isinstance(selection, FieldNode):
+            child_depth = _measure_depth(selection, current + 1, fragments, _visited, _memo)
+        elif isinstance(selection, InlineFragmentNode):
+            child_depth = _measure_depth(selection, current, fragments, _visited, _memo)
+        else:
+            fragment = _resolve_spread(selection, fragments, _visited)
+            if fragment is None:
+                continue
+            name = fragment.name.value
+            relative = _memo.get(name)
+            if relative is None:
+                relative = _memo[name] = _measure_depth(fragment, 0, fragments, _visited | {name}, _memo)
+            child_depth = current + relative
         if child_depth > max_child:
             max_child = child_depth
     return max_child
 
 
-class QueryDepthExtension(SchemaExtension):
-    """Rejects queries that exceed a configurable nesting depth.
+class QueryDepthRule(ValidationRule):
+    """Rejects operations that exceed a configurable nesting depth.
 
-    Parses the raw query string and measures the deepest field selection
-    chain.  If the depth exceeds ``max_depth``, the query is rejected
-    before execution.
+    Runs as a graphql-core validation rule on the document Strawberry has
+    already parsed, so the query is not parsed a second time.  If the
+    deepest field selection chain exceeds ``max_depth``, validation fails
+    and the operation is never executed.  The limit is a class attribute:
+    use :func:`_configured_rule` to derive a subclass with a different one.
     """
 
-    def __init__(self, *, max_depth: int = 10, **kwargs: Any) -> None:
-        self._max_depth = max_depth
-        super().__init__(**kwargs)
-
-    def on_operation(self) -> Any:
-        """Validate query depth before execution."""
-        execution_context: ExecutionContext = self.execution_context
-        query_str = execution_context.query
-        if query_str:
-            try:
-                document = gql_parse(query_str)
-            except Exception:
-                yield
-                return
-
-            for definition in document.definitions:
-                depth = _measure_depth(definition)
-                if depth > self._max_depth:
-                    logger.warning(
-                        "Query depth %d exceeds limit %d",
-                        depth,
-                        self._max_depth,
-                    )
-                    raise PermissionError(f"Query depth {depth} exceeds maximum allowed depth of {self._max_depth}.")
-        yield
+    max_depth: int = 10
+
+    def __init__(self, context: ValidationContext) -> None:
+        super().__init__(context)
+        self._fragments = _fragment_map(context.document)
+        self._fragment_depths: dict[str, int] = {}
+
+    def enter_operation_definition(self, node: OperationDefinitionNode, *_args: Any) -> Any:
+        """Validate operation depth; children are measured here, so skip them."""
+        depth = _measure_depth(node, fragments=self._fragments, _memo=self._fragment_depths)
+        if depth > self.max_depth:
+            logger.warning("Query depth %d exceeds limit %d", depth, self.max_depth)
+            self.report_error(
+                GraphQLError(f"Query depth {depth} exceeds maximum allowed depth of {self.max_depth}.", node)
+            )
+        return self.SKIP
 
 
 # ---------------------------------------------------------------------------
-# Query complexity analysis extension
+# Query complexity analysis rule
 # ---------------------------------------------------------------------------
 
 
+_LIST_SIZE_ARGS = frozenset({"first", "last", "limit"})
+
+
+def _list_size(field: FieldNode, default: int, max_size: int | None) -> int:
+    """Return the fan-out multiplier for *field*'s children.
+
+    A literal integer ``first``/``last``/``limit`` argument is taken as the
+    page size (clamped to ``[0, max_size]``); otherwise, including when the
+    size comes from a variable, *default* is used.
+    """
+    for arg in field.arguments or ():
+        if arg.name.value in _LIST_SIZE_ARGS and isinstance(arg.value, IntValueNode):
+            size = max(int(arg.value.value), 0)
+            return size if max_size is None else min(size, max_size)
+    return default
+
+
 def _measure_complexity(
     node: Any,
     default_cost: int = 1,
     list_multiplier: int = 10,
     multiplier: int = 1,
+    fragments: Mapping[str, FragmentDefinitionNode] | None = None,
+    max_list_size: int | None = None,
+    limit: int | None = None,
+    _visited: frozenset[str] = frozenset(),
+    _memo: dict[str, int] | None = None,
 ) -> int:
     """Calculate total complexity cost of a parsed AST node.
 
     Each field adds ``default_cost * multiplier`` to the total.  When a
     field has a sub-selection (i.e. returns an object or list), the cost
-    of its children is multiplied by ``list_multiplier`` to approximate
-    the fan-out of list fields.
+    of its children is multiplied by the field's page size (a literal
+    ``first``/``last``/``limit`` argument) or, failing that, by
+    ``list_multiplier`` to approximate the fan-out of list fields.  Inline
+    fragments and fragment spreads are costed as if their fields were
+    selected directly.  Cost is linear in *multiplier*, so each named
+    fragment is costed once per *_memo* at multiplier 1 and scaled for
+    every spread instead of being walked again.
 
     Parameters
     ----------
@@ -182,9 +281,17 @@ def _measure_complexity(
     default_cost:
         Base cost per field.
     list_multiplier:
-        Multiplier applied to children of list-returning fields.
+        Multiplier applied to children of fields without a page size argument.
     multiplier:
         Inherited multiplier from parent context.
+    fragments:
+        Fragment definitions of the document, keyed by name.  Spreads of
+        fragments not found here are ignored.
+    max_list_size:
+        Upper bound for page size arguments; ``None`` means unbounded.
+    limit:
+        Stop as soon as the running total exceeds this; the returned cost is
+        then only a lower bound.  ``None`` measures the whole node.
 
     Returns
     -------
@@ -195,71 +302,101 @@ def _measure_complexity(
     if selection_set is None or not selection_set.selections:
         return 0
 
+    if _memo is None:
+        _memo = {}
     total = 0
     for selection in selection_set.selections:
-        field_cost = default_cost * multiplier
-        total += field_cost
-
-        child_ss = getattr(selection, "selection_set", None)
-        if child_ss and child_ss.selections:
-            # Nested object/list — apply list multiplier to children
+        if isinstance(selection, FieldNode):
+            total += default_cost * multiplier
+
+            child_ss = selection.selection_set
+            if child_ss and child_ss.selections:
+                # Nested object/list — apply list multiplier to children
+                total += _measure_complexity(
+                    selection,
+                    default_cost=default_cost,
+                    list_multiplier=list_multiplier,
+                    multiplier=multiplier * _list_size(selection, list_multiplier, max_list_size),
+                    fragments=fragments,
+                    max_list_size=max_list_size,
+                    limit=None if limit is None else limit - total,
+                    _visited=_visited,
+                    _memo=_memo,
+                )
+        elif isinstance(selection, InlineFragmentNode):
             total += _measure_complexity(
                 selection,
                 default_cost=default_cost,
                 list_multiplier=list_multiplier,
-                multiplier=multiplier * list_multiplier,
+                multiplier=multiplier,
+                fragments=fragments,
+                max_list_size=max_list_size,
+                limit=None if limit is None else limit - total,
+                _visited=_visited,
+                _memo=_memo,
             )
+        else:
+            fragment = _resolve_spread(selection, fragments, _visited)
+            if fragment is None:
+                continue
+            name = fragment.name.value
+            unit = _memo.get(name)
+            if unit is None:
+                unit = _memo[name] = _measure_complexity(
+                    fragment,
+                    default_cost=default_cost,
+                    list_multiplier=list_multiplier,
+                    fragments=fragments,
+                    max_list_size=max_list_size,
+                    _visited=_visited | {name},
+                    _memo=_memo,
+                )
+            total += unit * multiplier
+        if limit is not None and total > limit:
+            break
 
     return total
 
 
-class QueryComplexityExtension(SchemaExtension):
-    """Rejects queries whose estimated complexity exceeds a threshold.
+class QueryComplexityRule(ValidationRule):
+    """Rejects operations whose estimated complexity exceeds a threshold.
 
     Uses a simple cost model: each field has a base cost, and nested
-    selections multiply by a configurable list-field multiplier.
+    selections multiply by the parent's page size argument, or by a
+    configurable list-field multiplier when none is given.  Like
+    :class:`QueryDepthRule`, the limits are class attributes.
     """
 
-    def __init__(
-        self,
-        *,
-        max_complexity: int = 1000,
-        default_field_cost: int = 1,
-        list_field_multiplier: int = 10,
-        **kwargs: Any,
-    ) -> None:
-        self._max_complexity = max_complexity
-        self._default_field_cost = default_field_cost
-        self._list_field_multiplier = list_field_multiplier
-        super().__init__(**kwargs)
-
-    def on_operation(self) -> Any:
-        """Validate query complexity before execution."""
-        execution_context: ExecutionContext = self.execution_context
-        query_str = execution_context.query
-        if query_str:
-            try:
-                document = gql_parse(query_str)
-            except Exception:
-                yield
-                return
-
-            for definition in document.definitions:
-                cost = _measure_complexity(
-                    definition,
-                    default_cost=self._default_field_cost,
-                    list_multiplier=self._list_field_multiplier,
+    max_complexity: int = 1000
+    default_field_cost: int = 1
+    list_field_multiplier: int = 10
+    max_list_size: int | None = None
+
+    def __init__(self, context: ValidationContext) -> None:
+        super().__init__(context)
+        self._fragments = _fragment_map(context.document)
+        self._fragment_costs: dict[str, int] = {}
+
+    def enter_operation_definition(self, node: OperationDefinitionNode, *_args: Any) -> Any:
+        """Validate operation complexity; children are measured here, so skip them."""
+        cost = _measure_complexity(
+            node,
+            default_cost=self.default_field_cost,
+            list_multiplier=self.list_field_multiplier,
+            fragments=self._fragments,
+            max_list_size=self.max_list_size,
+            limit=self.max_complexity,
+            _memo=self._fragment_costs,
+        )
+        if cost > self.max_complexity:
+            logger.warning("Query complexity %d exceeds limit %d", cost, self.max_complexity)
+            self.report_error(
+                GraphQLError(
+                    f"Query complexity {cost} exceeds maximum allowed complexity of {self.max_complexity}.",
+                    node,
                 )
-                if cost > self._max_complexity:
-                    logger.warning(
-                        "Query complexity %d exceeds limit %d",
-                        cost,
-                        self._max_complexity,
-                    )
-                    raise PermissionError(
-                        f"Query complexity {cost} exceeds maximum allowed complexity of {self._max_complexity}."
-                    )
-        yield
+            )
+        return self.SKIP
 
 
 # ---------------------------------------------------------------------------
@@ -267,61 +404,56 @@ class QueryComplexityExtension(SchemaExtension):
 # ---------------------------------------------------------------------------
 
 
+def _configured_rule(rule: type[ASTValidationRule], **limits: Any) -> type[ASTValidationRule]:
+    """Return a subclass of *rule* with *limits* set as class attributes.
+
+    graphql-core instantiates validation rules itself with only a
+    :class:`~graphql.ValidationContext` and, from 3.2 on, rejects anything
+    that is not an :class:`~graphql.validation.ASTValidationRule` subclass,
+    so configuration cannot be bound with :func:`functools.partial`.
+    Subclasses are memoized, so rebuilding a schema with the same limits
+    reuses the class built the first time.
+    """
+    return _rule_subclass(rule, tuple(sorted(limits.items())))
+
+
+@cache
+def _rule_subclass(rule: type[ASTValidationRule], limits: tuple[tuple[str, Any], ...]) -> type[ASTValidationRule]:
+    return type(rule.__name__, (rule,), dict(limits))
+
+
 def build_security_extensions(
     config: GraphQLSecurityConfig | None = None,
-) -> list[type[SchemaExtension] | object]:
+) -> list[Callable[[], SchemaExtension]]:
     """Build a list of Strawberry schema extensions from a security config.
 
-    Returns extension *instances* wrapped in lambdas suitable for passing
-    to ``strawberry.Schema(extensions=[...])``.
+    Returns zero-argument factories suitable for passing to
+    ``strawberry.Schema(extensions=[...])``; Strawberry calls each one to
+    create a fresh extension instance per operation.  All checks run as
+    validation rules on the already-parsed document.  Checks that could
+    never reject anything (introspection enabled, limits at
+    :data:`UNLIMITED`) are left out so they cost nothing per request.
     """
     if config is None:
         config = GraphQLSecurityConfig()
 
-    extensions: list[Any] = []
-
-    # Introspection control — always add, toggle via config
-    extensions.append(
-        _make_extension_factory(
-            IntrospectionControlExtension,
-            enabled=config.introspection_enabled,
-        )
-    )
-
-    # Query depth limiting
-    extensions.append(
-        _make_extension_factory(
-            QueryDepthExtension,
-            max_depth=config.max_query_depth,
-        )
-    )
-
-    # Query complexity analysis
-    extensions.append(
-        _make_extension_factory(
-            QueryComplexityExtension,
-            max_complexity=config.max_query_complexity,
-            default_field_cost=config.default_field_cost,
-            list_field_multiplier=config.list_field_multiplier,
+    extensions: list[Callable[[], SchemaExtension]] = []
+    rules: list[type[ASTValidationRule]] = []
+    if not config.introspection_enabled:
+        rules.append(IntrospectionControlRule)
+    if config.max_query_depth < UNLIMITED:
+        rules.append(_configured_rule(QueryDepthRule, max_depth=config.max_query_depth))
+    if config.max_query_complexity < UNLIMITED:
+        rules.append(
+            _configured_rule(
+                QueryComplexityRule,
+                max_complexity=config.max_query_complexity,
+                default_field_cost=config.default_field_cost,
+                list_field_multiplier=config.list_field_multiplier,
+                max_list_size=config.max_list_size,
+            )
         )
-    )
+    if rules:
+        extensions.append(partial(AddValidationRules, rules))
 
     return extensions
-
-
-def _make_extension_factory(cls: type, **kwargs: Any) -> type:
-    """Create a SchemaExtension subclass that passes kwargs on init.
-
-    Strawberry expects extension classes (not instances) in the
-    ``extensions`` list.  This factory creates a subclass whose
-    ``__init__`` injects the provided kwargs.
-    """
-
-    class _Factory(cls):  # type: ignore[valid-type]
-        def __init__(self, **init_kwargs: Any) -> None:
-            merged = {**kwargs, **init_kwargs}
-            super().__init__(**merged)
-
-    _Factory.__name__ = f"{cls.__name__}Configured"
-    _Factory.__qualname__ = _Factory.__name__
-    return _Factory
@@ -8,99 +8,197 @@ field-level type and constraint checks.
 from __future__ import annotations
 
 import re
+import weakref
+from dataclasses import dataclass
 from typing import Any
 
-from ninja_core.schema.entity import EntitySchema, FieldType
+from ninja_core.schema.entity import EntitySchema, FieldConstraint, FieldType
 
 # ---------------------------------------------------------------------------
 # Field-type validators
 # ---------------------------------------------------------------------------
 
-_STRING_TYPES = frozenset({FieldType.STRING, FieldType.TEXT, FieldType.UUID, FieldType.ENUM, FieldType.BINARY})
-_NUMERIC_INT_TYPES = frozenset({FieldType.INTEGER})
-_NUMERIC_FLOAT_TYPES = frozenset({FieldType.FLOAT})
+# (accepted Python type(s), human-readable label)
+_TypeCheck = tuple[type | tuple[type, ...], str]
 
+# FieldType -> type check.  Types not listed here (e.g. JSON) accept any value.
+_TYPE_CHECKS: dict[FieldType, _TypeCheck] = {
+    FieldType.STRING: (str, "string"),
+    FieldType.TEXT: (str, "string"),
+    FieldType.UUID: (str, "string"),
+    FieldType.ENUM: (str, "string"),
+    FieldType.BINARY: (str, "string"),
+    FieldType.INTEGER: (int, "integer"),
+    FieldType.FLOAT: ((int, float), "number"),
+    FieldType.BOOLEAN: (bool, "boolean"),
+    FieldType.ARRAY: (list, "array"),
+    FieldType.DATETIME: (str, "ISO date string"),
+    FieldType.DATE: (str, "ISO date string"),
+}
 
-def _check_field_type(field_name: str, value: Any, field_type: FieldType) -> str | None:
-    """Validate that *value* is compatible with *field_type*.
+
+def _check_field_type(field_name: str, value: Any, check: _TypeCheck | None) -> str | None:
+    """Validate *value* against a :data:`_TYPE_CHECKS` entry (``None`` accepts anything).
 
     Returns an error message string on failure, or ``None`` on success.
     """
-    if value is None:
-        return None  # Nullability is checked separately
-
-    if field_type in _STRING_TYPES:
-        if not isinstance(value, str):
-            return f"Field '{field_name}': expected string, got {type(value).__name__}"
-
-    elif field_type in _NUMERIC_INT_TYPES:
-        if not isinstance(value, int) or isinstance(value, bool):
-            return f"Field '{field_name}': expected integer, got {type(value).__name__}"
-
-    elif field_type in _NUMERIC_FLOAT_TYPES:
-        if not isinstance(value, (int, float)) or isinstance(value, bool):
-            return f"Field '{field_name}': expected number, got {type(value).__name__}"
-
-    elif field_type == FieldType.BOOLEAN:
-        if not isinstance(value, bool):
-            return f"Field '{field_name}': expected boolean, got {type(value).__name__}"
-
-    elif field_type == FieldType.ARRAY:
-        if not isinstance(value, list):
-            return f"Field '{field_name}': expected array, got {type(value).__name__}"
+    if value is None or check is None:
+        return None  # Nullability is checked separately; untyped fields take any JSON
 
-    elif field_type in (FieldType.DATETIME, FieldType.DATE):
-        if not isinstance(value, str):
-            return f"Field '{field_name}': expected ISO date string, got {type(value).__name__}"
+    expected, label = check
+    # ``bool`` subclasses ``int`` — only accept it where a boolean is expected.
+    if not isinstance(value, expected) or (isinstance(value, bool) and expected is not bool):
+        return f"Field '{field_name}': expected {label}, got {type(value).__name__}"
+    return None
 
-    elif field_type == FieldType.JSON:
-        pass  # Any JSON value is acceptable
 
-    return None
+@dataclass(frozen=True, slots=True)
+class _FieldRule:
+    """A :class:`FieldConstraint` flattened for the validation hot path.
 
+    The regex is compiled once here rather than looked up in the ``re``
+    module cache on every value, and enum values become a frozenset.
+    """
 
-def _check_constraints(field_name: str, value: Any, entity_field: Any) -> list[str]:
+    min_length: int | None
+    max_length: int | None
+    pattern: re.Pattern[str] | None
+    ge: float | None
+    le: float | None
+    enum_values: list[str] | None  # original order, for error messages
+    enum_set: frozenset[str] | None
+
+    @classmethod
+    def from_constraints(cls, constraints: FieldConstraint | None) -> _FieldRule | None:
+        """Return the rule for *constraints*, or ``None`` when nothing is constrained."""
+        if constraints is None:
+            return None
+        rule = cls(
+            min_length=constraints.min_length,
+            max_length=constraints.max_length,
+            pattern=re.compile(constraints.pattern) if constraints.pattern is not None else None,
+            ge=constraints.ge,
+            le=constraints.le,
+            enum_values=constraints.enum_values,
+            enum_set=frozenset(constraints.enum_values) if constraints.enum_values is not None else None,
+        )
+        return None if rule == _UNCONSTRAINED else rule
+
+
+_UNCONSTRAINED = _FieldRule(None, None, None, None, None, None, None)
+
+
+def _check_constraints(field_name: str, value: Any, rule: _FieldRule | None) -> list[str]:
     """Validate field constraints (length, range, pattern, enum).
 
     Returns a list of error messages (empty if valid).
     """
     errors: list[str] = []
-    constraints = entity_field.constraints
-    if constraints is None or value is None:
+    if rule is None or value is None:
         return errors
 
     # String length constraints
     if isinstance(value, str):
-        if constraints.min_length is not None and len(value) < constraints.min_length:
-            errors.append(f"Field '{field_name}': length {len(value)} is below minimum {constraints.min_length}")
-        if constraints.max_length is not None and len(value) > constraints.max_length:
-            errors.append(f"Field '{field_name}': length {len(value)} exceeds maximum {constraints.max_length}")
-        if constraints.pattern is not None:
-            if not re.fullmatch(constraints.pattern, value):
-                errors.append(f"Field '{field_name}': value does not match pattern '{constraints.pattern}'")
+        if rule.min_length is not None and len(value) < rule.min_length:
+            errors.append(f"Field '{field_name}': length {len(value)} is below minimum {rule.min_length}")
+        if rule.max_length is not None and len(value) > rule.max_length:
+            errors.append(f"Field '{field_name}': length {len(value)} exceeds maximum {rule.max_length}")
+        if rule.pattern is not None:
+            if not rule.pattern.fullmatch(value):
+                errors.append(f"Field '{field_name}': value does not match pattern '{rule.pattern.pattern}'")
 
     # Numeric range constraints
     if isinstance(value, (int, float)) and not isinstance(value, bool):
-        if constraints.ge is not None and value < constraints.ge:
-            errors.append(f"Field '{field_name}': value {value} is below minimum {constraints.ge}")
-        if constraints.le is not None and value > constraints.le:
-            errors.append(f"Field '{field_name}': value {value} exceeds maximum {constraints.le}")
+        if rule.ge is not None and value < rule.ge:
+            errors.append(f"Field '{field_name}': value {value} is below minimum {rule.ge}")
+        if rule.le is not None and value > rule.le:
+            errors.append(f"Field '{field_name}': value {value} exceeds maximum {rule.le}")
 
     # Enum validation
-    if constraints.enum_values is not None and isinstance(value, str):
-        if value not in constraints.enum_values:
-            errors.append(
-                f"Field '{field_name}': value '{value}' is not one of the allowed values: {constraints.enum_values}"
-            )
+    if rule.enum_set is not None and isinstance(value, str):
+        if value not in rule.enum_set:
+            errors.append(f"Field '{field_name}': value '{value}' is not one of the allowed values: {rule.enum_values}")
 
     return errors
 
 
+# Upper bound on reported errors (and unknown field names) per payload, so
+# pathological inputs with hundreds of bad fields are rejected cheaply.
+_MAX_ERRORS = 25
+
+
+# ---------------------------------------------------------------------------
+# Per-entity validation plans
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class _ValidationPlan:
+    """Entity field metadata flattened into parallel tuples.
+
+    Built once per entity so the validators index plain tuples instead of
+    reading several Pydantic attributes per field on every mutation.  Type
+    checks are resolved from :data:`_TYPE_CHECKS` here, not per value.  Fields
+    without constraints get a ``None`` rule and skip constraint checks.
+    """
+
+    index: dict[str, int]
+    known: frozenset[str]
+    type_checks: tuple[_TypeCheck | None, ...]
+    rules: tuple[_FieldRule | None, ...]
+    primary_key: tuple[bool, ...]
+    required: tuple[str, ...]
+    primary_keys: tuple[str, ...]
+
+    @classmethod
+    def from_entity(cls, entity: EntitySchema) -> _ValidationPlan:
+        fields = entity.fields
+        return cls(
+            index={f.name: i for i, f in enumerate(fields)},
+            known=frozenset(f.name for f in fields),
+            type_checks=tuple(_TYPE_CHECKS.get(f.field_type) for f in fields),
+            rules=tuple(_FieldRule.from_constraints(f.constraints) for f in fields),
+            primary_key=tuple(f.primary_key for f in fields),
+            required=tuple(f.name for f in fields if not f.primary_key and not f.nullable),
+            primary_keys=tuple(f.name for f in fields if f.primary_key),
+        )
+
+
+# id(entity) -> (weakref to entity, plan).  EntitySchema is unhashable, so
+# plans are keyed by identity and evicted when the entity is collected.
+# Entities are treated as immutable once handed to schema building; callers
+# that mutate one afterwards must call invalidate_validation_plan().
+_ENTITY_VALIDATION_META: dict[int, tuple[weakref.ref[EntitySchema], _ValidationPlan]] = {}
+
+
+def _plan_for(entity: EntitySchema) -> _ValidationPlan:
+    """Return the cached validation plan for *entity*, building it on first use."""
+    key = id(entity)
+    cached = _ENTITY_VALIDATION_META.get(key)
+    if cached is not None and cached[0]() is entity:
+        return cached[1]
+
+    plan = _ValidationPlan.from_entity(entity)
+    ref = weakref.ref(entity, lambda _ref, key=key: _ENTITY_VALIDATION_META.pop(key, None))
+    _ENTITY_VALIDATION_META[key] = (ref, plan)
+    return plan
+
+
 # ---------------------------------------------------------------------------
 # Public validation API
 # ---------------------------------------------------------------------------
 
 
+def invalidate_validation_plan(entity: EntitySchema) -> None:
+    """Discard the cached validation plan for *entity*.
+
+    Validation plans are built once per entity and assume its definition no
+    longer changes.  Call this after mutating an entity's fields or
+    constraints so the next validation rebuilds the plan.
+    """
+    _ENTITY_VALIDATION_META.pop(id(entity), None)
+
+
 class InputValidationError(Exception):
     """Raised when JSON scalar input fails validation against the ASD.
 
@@ -140,32 +238,34 @@ def validate_create_input(entity: EntitySchema, data: dict[str, Any]) -> dict[st
         raise InputValidationError(["Input must be a JSON object"])
 
     errors: list[str] = []
-    field_map = {f.name: f for f in entity.fields}
-    allowed_names = set(field_map.keys())
+    plan = _plan_for(entity)
+    index = plan.index
 
-    # Reject unknown fields (mass assignment protection)
-    unknown = set(data.keys()) - allowed_names
-    if unknown:
-        errors.append(f"Unknown fields: {sorted(unknown)}")
+    # Reject unknown fields (mass assignment protection).  The C-level
+    # superset test is the common case; names are only collected on failure.
+    if not plan.known.issuperset(data):
+        unknown = [k for k in data if k not in index]
+        errors.append(f"Unknown fields: {sorted(unknown)[:_MAX_ERRORS]}")
 
-    # Check required fields (non-nullable, non-primary-key)
-    for f in entity.fields:
-        if f.primary_key:
-            continue  # PKs are auto-generated
-        if not f.nullable and f.name not in data:
-            errors.append(f"Required field '{f.name}' is missing")
+    # Check required fields (non-nullable, non-primary-key; PKs are auto-generated)
+    for name in plan.required:
+        if name not in data:
+            errors.append(f"Required field '{name}' is missing")
 
     # Validate each provided field
+    type_checks, rules = plan.type_checks, plan.rules
     for key, value in data.items():
-        field = field_map.get(key)
-        if field is None:
+        if len(errors) >= _MAX_ERRORS:
+            break  # Rejection is certain; don't keep doing O(fields) work
+        i = index.get(key)
+        if i is None:
             continue  # Already reported as unknown
 
-        type_err = _check_field_type(key, value, field.field_type)
+        type_err = _check_field_type(key, value, type_checks[i])
         if type_err:
             errors.append(type_err)
         else:
-            errors.extend(_check_constraints(key, value, field))
+            errors.extend(_check_constraints(key, value, rules[i]))
 
     if errors:
         raise InputValidationError(errors)
@@ -201,33 +301,36 @@ def validate_update_input(entity: EntitySchema, data: dict[str, Any]) -> dict[st
         raise InputValidationError(["Patch must be a JSON object"])
 
     errors: list[str] = []
-    field_map = {f.name: f for f in entity.fields}
-    allowed_names = set(field_map.keys())
+    plan = _plan_for(entity)
+    index = plan.index
 
     # Reject unknown fields
-    unknown = set(data.keys()) - allowed_names
-    if unknown:
-        errors.append(f"Unknown fields: {sorted(unknown)}")
+    if not plan.known.issuperset(data):
+        unknown = [k for k in data if k not in index]
+        errors.append(f"Unknown fields: {sorted(unknown)[:_MAX_ERRORS]}")
 
     # Reject attempts to modify primary key via patch
-    for f in entity.fields:
-        if f.primary_key and f.name in data:
-            errors.append(f"Cannot modify primary key field '{f.name}' via patch")
+    for name in plan.primary_keys:
+        if name in data:
+            errors.append(f"Cannot modify primary key field '{name}' via patch")
 
     # Validate each provided field
+    type_checks, rules, primary_key = plan.type_checks, plan.rules, plan.primary_key
     for key, value in data.items():
-        field = field_map.get(key)
-        if field is None:
+        if len(errors) >= _MAX_ERRORS:
+            break  # Rejection is certain; don't keep doing O(fields) work
+        i = index.get(key)
+        if i is None:
             continue
 
-        if field.primary_key:
+        if primary_key[i]:
             continue  # Already reported
 
-        type_err = _check_field_type(key, value, field.field_type)
+        type_err = _check_field_type(key, value, type_checks[i])
         if type_err:
             errors.append(type_err)
         else:
-            errors.extend(_check_constraints(key, value, field))
+            errors.extend(_check_constraints(key, value, rules[i]))
 
     if errors:
         raise InputValidationError(errors)
@@ -2,7 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+import re
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
 import pytest
+import strawberry
 from ninja_core.schema.domain import DomainSchema
 from ninja_core.schema.entity import (
     EmbeddingConfig,
@@ -13,6 +22,24 @@ from ninja_core.schema.entity import (
 )
 from ninja_core.schema.project import AgenticSchema
 from ninja_core.schema.relationship import Cardinality, RelationshipSchema, RelationshipType
+from ninja_gql.schema import build_schema, build_schema_sdl
+from ninja_gql.security import GraphQLSecurityConfig
+from pytest_asyncio import is_async_test
+
+_TESTS_DIR = Path(__file__).parent
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Run this package's async tests on one session-wide event loop.
+
+    Nothing here depends on a fresh loop per test, so sharing one avoids
+    creating and closing a loop for every async test.  Items from other
+    packages in a workspace-wide run are left alone.
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item) and item.path.is_relative_to(_TESTS_DIR):
+            item.add_marker(session_loop, append=False)
 
 
 def _customer_entity() -> EntitySchema:
@@ -61,9 +88,7 @@ def _product_entity() -> EntitySchema:
     )
 
 
-@pytest.fixture()
-def sample_asd() -> AgenticSchema:
-    """Return a 3-entity ASD with relationships and domains."""
+def _sample_asd() -> AgenticSchema:
     return AgenticSchema(
         project_name="test-shop",
         entities=[_customer_entity(), _order_entity(), _product_entity()],
@@ -83,3 +108,126 @@ def sample_asd() -> AgenticSchema:
             DomainSchema(name="Catalog", entities=["Product"]),
         ],
     )
+
+
+@pytest.fixture()
+def sample_asd() -> AgenticSchema:
+    """Return a 3-entity ASD with relationships and domains."""
+    return _sample_asd()
+
+
+@pytest.fixture(scope="session")
+def shared_asd() -> AgenticSchema:
+    """Session-wide copy of ``sample_asd`` for expensive derived fixtures — do not mutate."""
+    return _sample_asd()
+
+
+@pytest.fixture(scope="session")
+def cached_schema(shared_asd: AgenticSchema) -> Callable[..., strawberry.Schema]:
+    """Return ``build(security_config=None)``, memoizing one repo-less schema per security config.
+
+    Schema construction dominates these tests; tests that need repos or patched
+    globals at build time should call ``build_schema`` directly.
+    """
+    schemas: dict[str | None, strawberry.Schema] = {}
+
+    def build(security_config: GraphQLSecurityConfig | None = None) -> strawberry.Schema:
+        key = security_config.model_dump_json() if security_config is not None else None
+        schema = schemas.get(key)
+        if schema is None:
+            schema = schemas[key] = build_schema(shared_asd, security_config=security_config)
+        return schema
+
+    return build
+
+
+@pytest.fixture(scope="session")
+def sample_sdl(shared_asd: AgenticSchema) -> str:
+    """SDL printed once for ``shared_asd``, for substring assertions on the generated schema."""
+    return build_schema_sdl(shared_asd)
+
+
+@pytest.fixture(scope="session")
+def sample_sdl_tokens(sample_sdl: str) -> frozenset[str]:
+    """Identifiers appearing in ``sample_sdl``.
+
+    Membership checks are exact: ``"Order" in tokens`` does not match
+    ``OrderInput`` the way a substring test would.
+    """
+    return frozenset(re.findall(r"[A-Za-z_]\w*", sample_sdl))
+
+
+# ---------------------------------------------------------------------------
+# Direct ASGI invocation
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class ASGIResponse:
+    """Status and body collected from one direct ASGI call."""
+
+    status_code: int
+    body: bytes
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+
+async def _asgi_post(
+    app: Callable[..., Awaitable[None]],
+    path: str,
+    payload: Any,
+    *,
+    headers: dict[str, str] | None = None,
+    client: tuple[str, int] = ("testclient", 50000),
+) -> ASGIResponse:
+    body = json.dumps(payload).encode()
+    raw_headers = [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]
+    raw_headers += [(k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in (headers or {}).items()]
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": raw_headers,
+        "client": client,
+        "server": ("testserver", 80),
+    }
+    body_sent = False
+
+    async def receive() -> dict[str, Any]:
+        nonlocal body_sent
+        if not body_sent:
+            body_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        # The client never disconnects; middleware waiting on this gets cancelled.
+        await asyncio.Event().wait()
+        return {"type": "http.disconnect"}
+
+    status = 0
+    chunks: list[bytes] = []
+
+    async def send(message: dict[str, Any]) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return ASGIResponse(status_code=status, body=b"".join(chunks))
+
+
+@pytest.fixture(scope="session")
+def asgi_post() -> Callable[..., Awaitable[ASGIResponse]]:
+    """POST a JSON payload straight into an ASGI app, bypassing ``TestClient``.
+
+    Skips the thread portal and httpx transport, so request-loop tests for
+    middleware measure the middleware rather than the test harness.
+    """
+    return _asgi_post
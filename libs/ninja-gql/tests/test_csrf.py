@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import pytest
 from ninja_gql.csrf import (
     CSRFConfig,
     CSRFMiddleware,
@@ -9,6 +10,7 @@ from ninja_gql.csrf import (
     generate_csrf_token,
     verify_csrf_token,
 )
+from pydantic import ValidationError
 from starlette.applications import Starlette
 from starlette.requests import Request
 from starlette.responses import JSONResponse
@@ -43,6 +45,18 @@ class TestCSRFTokens:
         tampered = token[:-1] + ("a" if token[-1] != "a" else "b")
         assert verify_csrf_token(tampered, secret) is False
 
+    def test_verify_rejects_mismatch_at_any_position(self):
+        secret = "my-secret"
+        nonce, signature = generate_csrf_token(secret).split(".")
+        for i in (0, len(signature) - 1):
+            flipped = "0" if signature[i] != "0" else "1"
+            tampered = f"{nonce}.{signature[:i]}{flipped}{signature[i + 1 :]}"
+            assert verify_csrf_token(tampered, secret) is False
+
+    def test_verify_non_ascii_signature_rejected(self):
+        nonce = generate_csrf_token("my-secret").split(".")[0]
+        assert verify_csrf_token(f"{nonce}.\u00e9\u00e9\u00e9", "my-secret") is False
+
     def test_verify_wrong_secret(self):
         token = generate_csrf_token("correct-secret")
         assert verify_csrf_token(token, "wrong-secret") is False
@@ -69,6 +83,15 @@ class TestMutationDetection:
     def test_mutation_with_whitespace(self):
         assert _is_mutation_request({"query": "  mutation CreateUser { createUser { id } }"}) is True
 
+    def test_mutation_case_insensitive(self):
+        assert _is_mutation_request({"query": "\n\tMUTATION { createUser { id } }"}) is True
+
+    def test_mutation_keyword_later_in_query_ignored(self):
+        assert _is_mutation_request({"query": "query { a }" + " " * 65536 + "mutation { b }"}) is False
+
+    def test_non_string_query(self):
+        assert _is_mutation_request({"query": 42}) is False
+
     def test_empty_query(self):
         assert _is_mutation_request({"query": ""}) is False
 
@@ -94,6 +117,13 @@ class TestCSRFConfig:
         config = CSRFConfig(header_name="X-CSRF-Token")
         assert config.header_name == "X-CSRF-Token"
 
+    def test_frozen_and_hashable(self):
+        config = CSRFConfig(token_secret="s", exempt_paths=["/health"])
+        assert config.exempt_paths == ("/health",)
+        assert hash(config) == hash(CSRFConfig(token_secret="s", exempt_paths=["/health"]))
+        with pytest.raises(ValidationError):
+            config.enabled = False
+
 
 # ---------------------------------------------------------------------------
 # Middleware integration
@@ -113,40 +143,72 @@ def _make_test_app(config: CSRFConfig | None = None) -> Starlette:
     return app
 
 
+_MUTATION = {"query": "mutation { createUser(input: {}) { id } }"}
+
+
+@pytest.fixture(scope="module")
+def default_app() -> Starlette:
+    return _make_test_app()
+
+
+@pytest.fixture(scope="module")
+def _default_client(default_app: Starlette) -> TestClient:
+    return TestClient(default_app)
+
+
+@pytest.fixture()
+def client(_default_client: TestClient) -> TestClient:
+    """Module-wide client for the default config, with a fresh cookie jar per test."""
+    _default_client.cookies.clear()
+    return _default_client
+
+
 class TestCSRFMiddleware:
     """Tests for the CSRF middleware."""
 
-    def test_mutation_without_header_returns_403(self):
-        app = _make_test_app()
-        client = TestClient(app)
-        response = client.post(
-            "/graphql",
-            json={"query": "mutation { createUser(input: {}) { id } }"},
-        )
+    async def test_mutation_without_header_returns_403(self, default_app: Starlette, asgi_post):
+        response = await asgi_post(default_app, "/graphql", _MUTATION)
         assert response.status_code == 403
         assert "CSRF" in response.json()["errors"][0]["message"]
 
-    def test_mutation_with_header_succeeds(self):
-        app = _make_test_app()
-        client = TestClient(app)
-        response = client.post(
-            "/graphql",
-            json={"query": "mutation { createUser(input: {}) { id } }"},
-            headers={"X-Requested-With": "NinjaStack"},
-        )
+    async def test_mutation_with_header_succeeds(self, default_app: Starlette, asgi_post):
+        response = await asgi_post(default_app, "/graphql", _MUTATION, headers={"X-Requested-With": "NinjaStack"})
         assert response.status_code == 200
         assert response.json()["data"]["ok"] is True
 
-    def test_query_without_header_succeeds(self):
+    async def test_query_without_header_succeeds(self, default_app: Starlette, asgi_post):
         """Non-mutation queries should not require CSRF token."""
-        app = _make_test_app()
-        client = TestClient(app)
-        response = client.post(
-            "/graphql",
-            json={"query": "query { getUser(id: 1) { name } }"},
-        )
+        response = await asgi_post(default_app, "/graphql", {"query": "query { getUser(id: 1) { name } }"})
+        assert response.status_code == 200
+
+    async def test_mutation_detected_without_full_parse(self, default_app: Starlette, asgi_post, monkeypatch):
+        def _fail(*args, **kwargs):
+            raise AssertionError("full JSON parse should not be needed")
+
+        monkeypatch.setattr("ninja_gql.csrf.json.loads", _fail)
+        response = await asgi_post(default_app, "/graphql", {"query": "  Mutation { deleteUser(id: 1) }"})
+        assert response.status_code == 403
+
+    async def test_mutation_after_other_keys_still_detected(self, default_app: Starlette, asgi_post):
+        """Bodies the fast path does not recognise fall back to a full parse."""
+        payload = {"variables": {"id": 1}, "query": "mutation { deleteUser(id: $id) }"}
+        response = await asgi_post(default_app, "/graphql", payload)
+        assert response.status_code == 403
+
+    async def test_escaped_whitespace_mutation_detected(self, default_app: Starlette, asgi_post):
+        response = await asgi_post(default_app, "/graphql", {"query": "\n\tmutation { deleteUser(id: 1) }"})
+        assert response.status_code == 403
+
+    async def test_non_object_body_passes_through(self, default_app: Starlette, asgi_post):
+        response = await asgi_post(default_app, "/graphql", [{"query": "{ a }"}])
         assert response.status_code == 200
 
+    def test_mutation_without_header_over_http(self, client: TestClient):
+        """End-to-end smoke test through ``TestClient``."""
+        response = client.post("/graphql", json=_MUTATION)
+        assert response.status_code == 403
+        assert response.headers["content-type"] == "application/json"
+
     def test_csrf_disabled_allows_all(self):
         app = _make_test_app(CSRFConfig(enabled=False))
         client = TestClient(app)
@@ -156,9 +218,7 @@ class TestCSRFMiddleware:
         )
         assert response.status_code == 200
 
-    def test_samesite_cookie_set(self):
-        app = _make_test_app()
-        client = TestClient(app)
+    def test_samesite_cookie_set(self, client: TestClient):
         response = client.post(
             "/graphql",
             json={"query": "query { getUser(id: 1) { name } }"},
@@ -179,6 +239,8 @@ class TestCSRFMiddleware:
         )
         assert response.status_code == 403
 
+        assert "X-CSRF-Token" in response.json()["errors"][0]["message"]
+
         # With the custom header
         response = client.post(
             "/graphql",
@@ -2,81 +2,92 @@
 
 from __future__ import annotations
 
+import pytest
 from ninja_core.schema.project import AgenticSchema
 from ninja_gql.generator import GqlGenerator
 
+# Type generation is the expensive part; build it once and share it read-only.
 
-class TestGqlGeneratorTypes:
-    def test_generates_type_per_entity(self, sample_asd: AgenticSchema):
-        gen = GqlGenerator(sample_asd)
-        types = gen.generate_types()
 
+@pytest.fixture(scope="module")
+def gen(shared_asd: AgenticSchema) -> GqlGenerator:
+    return GqlGenerator(shared_asd)
+
+
+@pytest.fixture(scope="module")
+def types(gen: GqlGenerator) -> dict[str, type]:
+    return gen.generate_types()
+
+
+@pytest.fixture(scope="module")
+def inputs(gen: GqlGenerator) -> dict[str, tuple[type, type]]:
+    return gen.generate_input_types()
+
+
+class TestGqlGeneratorTypes:
+    def test_generates_type_per_entity(self, types: dict[str, type]):
         assert set(types.keys()) == {"Customer", "Order", "Product"}
 
-    def test_customer_type_has_fields(self, sample_asd: AgenticSchema):
-        gen = GqlGenerator(sample_asd)
-        types = gen.generate_types()
+    def test_customer_type_has_fields(self, types: dict[str, type]):
         customer = types["Customer"]
 
         assert "id" in customer.__annotations__
         assert "name" in customer.__annotations__
         assert "email" in customer.__annotations__
 
-    def test_order_type_has_fields(self, sample_asd: AgenticSchema):
-        gen = GqlGenerator(sample_asd)
-        types = gen.generate_types()
+    def test_order_type_has_fields(self, types: dict[str, type]):
         order = types["Order"]
 
         assert "customer_id" in order.__annotations__
         assert "total" in order.__annotations__
         assert "status" in order.__annotations__
 
-    def test_relationship_field_attached(self, sample_asd: AgenticSchema):
-        gen = GqlGenerator(sample_asd)
-        types = gen.generate_types()
+    def test_relationship_field_attached(self, types: dict[str, type]):
         customer = types["Customer"]
 
         assert "customer_orders" in customer.__annotations__
 
-    def test_nullable_field_type(self, sample_asd: AgenticSchema):
-        gen = GqlGenerator(sample_asd)
-        types = gen.generate_types()
+    def test_nullable_field_type(self, types: dict[str, type]):
         product = types["Product"]
 
         # description is nullable
         assert "description" in product.__annotations__
 
-    def test_types_are_strawberry_types(self, sample_asd: AgenticSchema):
-        gen = GqlGenerator(sample_asd)
-        types = gen.generate_types()
-
+    def test_types_are_strawberry_types(self, types: dict[str, type]):
         for t in types.values():
             assert hasattr(t, "__strawberry_definition__")
 
-    def test_has_embeddable_fields(self, sample_asd: AgenticSchema):
-        gen = GqlGenerator(sample_asd)
+    def test_generate_types_memoized(self, gen: GqlGenerator, types: dict[str, type]):
+        assert gen.generate_types() is types
+        assert gen.get_type("Customer") is types["Customer"]
 
-        product = sample_asd.entities[2]
-        customer = sample_asd.entities[0]
+    def test_empty_schema_memoized(self):
+        gen = GqlGenerator(AgenticSchema(project_name="empty"))
+        assert gen.generate_types() == {}
+        assert gen._types_ready is True
+        assert gen.generate_input_types() == {}
+        assert gen._input_types_ready is True
+
+    def test_has_embeddable_fields(self, gen: GqlGenerator, shared_asd: AgenticSchema):
+        product = shared_asd.entities[2]
+        customer = shared_asd.entities[0]
 
         assert gen.has_embeddable_fields(product) is True
         assert gen.has_embeddable_fields(customer) is False
 
 
 class TestGqlGeneratorInputTypes:
-    def test_generates_input_types(self, sample_asd: AgenticSchema):
-        gen = GqlGenerator(sample_asd)
-        inputs = gen.generate_input_types()
-
+    def test_generates_input_types(self, inputs: dict[str, tuple[type, type]]):
         assert "Customer" in inputs
         create_cls, update_cls = inputs["Customer"]
         assert hasattr(create_cls, "__strawberry_definition__")
         assert hasattr(update_cls, "__strawberry_definition__")
 
-    def test_create_input_pk_optional(self, sample_asd: AgenticSchema):
-        gen = GqlGenerator(sample_asd)
-        inputs = gen.generate_input_types()
+    def test_create_input_pk_optional(self, inputs: dict[str, tuple[type, type]]):
         create_cls, _ = inputs["Customer"]
 
         # PK should be optional in create input
         assert create_cls.__annotations__["id"] is not None
+
+    def test_generate_input_types_memoized(self, gen: GqlGenerator, inputs: dict[str, tuple[type, type]]):
+        assert gen.generate_input_types() is inputs
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 import pytest
+import strawberry
 from ninja_auth.agent_context import clear_user_context, set_user_context
 from ninja_auth.context import ANONYMOUS_USER, UserContext
 from ninja_core.schema.project import AgenticSchema
@@ -46,16 +48,18 @@ class MockRepo:
         pass
 
 
-def _build(asd: AgenticSchema):
-    repos = {e.name: MockRepo() for e in asd.entities}
-    return build_schema(asd, repo_getter=lambda name: repos[name])
-
-
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="module")
+def schema(shared_asd: AgenticSchema) -> strawberry.Schema:
+    """Build the schema once; resolvers read the user context at execution time."""
+    repos = {e.name: MockRepo() for e in shared_asd.entities}
+    return build_schema(shared_asd, repo_getter=lambda name: repos[name])
+
+
 @pytest.fixture(autouse=True)
 def _reset_user_context():
     """Ensure each test starts with anonymous context."""
@@ -69,29 +73,31 @@ def _reset_user_context():
 # ---------------------------------------------------------------------------
 
 
-class TestMutationAuthRejectsAnonymous:
-    """Mutations must fail when no authenticated user context is set."""
+_WRITE_MUTATIONS = [
+    'mutation { createCustomer(input: {name: "X", email: "x@t.com"}) { id } }',
+    'mutation { updateCustomer(id: "abc", patch: {name: "Y"}) { id } }',
+    'mutation { deleteCustomer(id: "abc") }',
+]
 
-    async def test_create_rejects_anonymous(self, sample_asd: AgenticSchema):
-        schema = _build(sample_asd)
 
-        result = await schema.execute('mutation { createCustomer(input: {name: "X", email: "x@t.com"}) { id } }')
-        assert result.errors is not None
-        assert any("permission" in str(e).lower() or "authenticated" in str(e).lower() for e in result.errors)
+def _is_auth_error(result: Any) -> bool:
+    return result.errors is not None and any(
+        "permission" in str(e).lower() or "authenticated" in str(e).lower() for e in result.errors
+    )
 
-    async def test_update_rejects_anonymous(self, sample_asd: AgenticSchema):
-        schema = _build(sample_asd)
 
-        result = await schema.execute('mutation { updateCustomer(id: "abc", patch: {name: "Y"}) { id } }')
-        assert result.errors is not None
-        assert any("permission" in str(e).lower() or "authenticated" in str(e).lower() for e in result.errors)
+class TestMutationAuthRejectsAnonymous:
+    """Mutations must fail when no authenticated user context is set."""
 
-    async def test_delete_rejects_anonymous(self, sample_asd: AgenticSchema):
-        schema = _build(sample_asd)
+    @pytest.mark.parametrize("mutation", _WRITE_MUTATIONS, ids=["create", "update", "delete"])
+    async def test_rejects_anonymous(self, schema: strawberry.Schema, mutation: str):
+        result = await schema.execute(mutation)
+        assert _is_auth_error(result)
 
-        result = await schema.execute('mutation { deleteCustomer(id: "abc") }')
-        assert result.errors is not None
-        assert any("permission" in str(e).lower() or "authenticated" in str(e).lower() for e in result.errors)
+    async def test_rejects_anonymous_concurrently(self, schema: strawberry.Schema):
+        """Tasks inherit the anonymous context; concurrent execution must not leak another identity."""
+        results = await asyncio.gather(*(schema.execute(m) for m in _WRITE_MUTATIONS))
+        assert all(_is_auth_error(r) for r in results)
 
 
 # ---------------------------------------------------------------------------
@@ -102,43 +108,41 @@ class TestMutationAuthRejectsAnonymous:
 class TestMutationAuthAllowsAuthorized:
     """Mutations succeed when the user has the required write/delete permission."""
 
-    async def test_create_with_write_permission(self, sample_asd: AgenticSchema):
+    async def test_create_with_write_permission(self, schema: strawberry.Schema):
         user = _make_user(permissions=["write:Sales.Customer"])
         set_user_context(user)
-        schema = _build(sample_asd)
-
         result = await schema.execute('mutation { createCustomer(input: {name: "Z", email: "z@t.com"}) { id name } }')
         assert result.errors is None
         assert result.data["createCustomer"]["name"] == "Z"
 
-    async def test_update_with_write_permission(self, sample_asd: AgenticSchema):
+    async def test_update_with_write_permission(self, schema: strawberry.Schema):
         user = _make_user(permissions=["write:Sales.Customer"])
         set_user_context(user)
-        schema = _build(sample_asd)
-
         result = await schema.execute('mutation { updateCustomer(id: "abc", patch: {name: "Updated"}) { id name } }')
         assert result.errors is None
         assert result.data["updateCustomer"]["name"] == "Updated"
 
-    async def test_delete_with_delete_permission(self, sample_asd: AgenticSchema):
+    async def test_delete_with_delete_permission(self, schema: strawberry.Schema):
         user = _make_user(permissions=["delete:Sales.Customer"])
         set_user_context(user)
-        schema = _build(sample_asd)
-
         result = await schema.execute('mutation { deleteCustomer(id: "abc") }')
         assert result.errors is None
         assert result.data["deleteCustomer"] is True
 
-    async def test_wildcard_permission_grants_access(self, sample_asd: AgenticSchema):
+    async def test_wildcard_permission_grants_access(self, schema: strawberry.Schema):
         user = _make_user(permissions=["write:*"])
         set_user_context(user)
-        schema = _build(sample_asd)
-
         result = await schema.execute(
             'mutation { createOrder(input: {customer_id: "c1", total: 9.99, status: "new"}) { id } }'
         )
         assert result.errors is None
 
+    async def test_all_writes_succeed_concurrently(self, schema: strawberry.Schema):
+        set_user_context(_make_user(permissions=["write:Sales.Customer", "delete:Sales.Customer"]))
+
+        results = await asyncio.gather(*(schema.execute(m) for m in _WRITE_MUTATIONS))
+        assert [r.errors for r in results] == [None, None, None]
+
 
 # ---------------------------------------------------------------------------
 # Tests — authenticated but wrong permissions are rejected
@@ -148,27 +152,21 @@ class TestMutationAuthAllowsAuthorized:
 class TestMutationAuthRejectsInsufficient:
     """Mutations fail when the user is authenticated but lacks the needed permission."""
 
-    async def test_read_permission_not_enough_for_create(self, sample_asd: AgenticSchema):
+    async def test_read_permission_not_enough_for_create(self, schema: strawberry.Schema):
         user = _make_user(permissions=["read:Sales.Customer"])
         set_user_context(user)
-        schema = _build(sample_asd)
-
         result = await schema.execute('mutation { createCustomer(input: {name: "X", email: "x@t.com"}) { id } }')
         assert result.errors is not None
 
-    async def test_write_on_wrong_entity_rejected(self, sample_asd: AgenticSchema):
+    async def test_write_on_wrong_entity_rejected(self, schema: strawberry.Schema):
         user = _make_user(permissions=["write:Sales.Order"])
         set_user_context(user)
-        schema = _build(sample_asd)
-
         result = await schema.execute('mutation { createCustomer(input: {name: "X", email: "x@t.com"}) { id } }')
         assert result.errors is not None
 
-    async def test_delete_needs_delete_not_write(self, sample_asd: AgenticSchema):
+    async def test_delete_needs_delete_not_write(self, schema: strawberry.Schema):
         user = _make_user(permissions=["write:Sales.Customer"])
         set_user_context(user)
-        schema = _build(sample_asd)
-
         result = await schema.execute('mutation { deleteCustomer(id: "abc") }')
         assert result.errors is not None
 
@@ -181,14 +179,10 @@ class TestMutationAuthRejectsInsufficient:
 class TestQueriesUnaffected:
     """Read queries should still work without authentication."""
 
-    async def test_get_query_works_anonymous(self, sample_asd: AgenticSchema):
-        schema = _build(sample_asd)
-
+    async def test_get_query_works_anonymous(self, schema: strawberry.Schema):
         result = await schema.execute('{ getCustomer(id: "abc") { id name } }')
         assert result.errors is None
 
-    async def test_list_query_works_anonymous(self, sample_asd: AgenticSchema):
-        schema = _build(sample_asd)
-
+    async def test_list_query_works_anonymous(self, schema: strawberry.Schema):
         result = await schema.execute("{ listCustomer { id name } }")
         assert result.errors is None
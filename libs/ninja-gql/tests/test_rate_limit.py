@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import itertools
+from collections.abc import Callable
+
+import pytest
 from ninja_gql.rate_limit import (
     GraphQLRateLimitConfig,
     GraphQLRateLimitMiddleware,
     _is_mutation,
 )
+from pydantic import ValidationError
 from starlette.applications import Starlette
 from starlette.requests import Request
 from starlette.responses import JSONResponse
@@ -30,6 +35,13 @@ class TestGraphQLRateLimitConfig:
         assert config.per_user_enabled is False
         assert config.graphql_path == "/graphql"
 
+    def test_frozen_and_hashable(self):
+        config = GraphQLRateLimitConfig(query_max_requests=5)
+        assert hash(config) == hash(GraphQLRateLimitConfig(query_max_requests=5))
+        assert config == GraphQLRateLimitConfig(query_max_requests=5)
+        with pytest.raises(ValidationError):
+            config.query_max_requests = 10
+
     def test_mutation_stricter_than_query(self):
         config = GraphQLRateLimitConfig()
         assert config.mutation_max_requests < config.query_max_requests
@@ -52,6 +64,9 @@ class TestHelpers:
     def test_is_mutation_with_whitespace(self):
         assert _is_mutation({"query": "  mutation { deleteUser }"}) is True
 
+    def test_is_mutation_large_leading_whitespace(self):
+        assert _is_mutation({"query": " " * 65536 + "Mutation { deleteUser }"}) is True
+
 
 # ---------------------------------------------------------------------------
 # Middleware integration
@@ -77,129 +92,147 @@ def _make_test_app(config: GraphQLRateLimitConfig | None = None) -> Starlette:
     return app
 
 
+_QUERY = {"query": "query { getUser { id } }"}
+_MUTATION = {"query": "mutation { createUser { id } }"}
+_addresses = itertools.count(1)
+
+
+@pytest.fixture(scope="module")
+def app_factory() -> Callable[[GraphQLRateLimitConfig | None], Starlette]:
+    """Return one app per distinct config, shared across the module."""
+    apps: dict[GraphQLRateLimitConfig | None, Starlette] = {}
+
+    def factory(config: GraphQLRateLimitConfig | None = None) -> Starlette:
+        if config not in apps:
+            apps[config] = _make_test_app(config)
+        return apps[config]
+
+    return factory
+
+
+@pytest.fixture()
+def client_ip() -> str:
+    """A client address unique to the test.
+
+    Rate-limit buckets are keyed by client IP, so tests sharing an app never
+    see each other's counters, without rebuilding the middleware stack.
+    """
+    n = next(_addresses)
+    return f"10.0.{n // 256}.{n % 256}"
+
+
+@pytest.fixture()
+def post(app_factory, asgi_post, client_ip: str):
+    """Return ``post(config, payload)`` that calls the app for *config* directly over ASGI."""
+
+    async def _post(config: GraphQLRateLimitConfig | None, payload: dict[str, str]):
+        return await asgi_post(app_factory(config), "/graphql", payload, client=(client_ip, 50000))
+
+    return _post
+
+
 class TestGraphQLRateLimitMiddleware:
     """Tests for the rate limiting middleware."""
 
-    def test_within_limit_succeeds(self):
+    async def test_within_limit_succeeds(self, post):
         config = GraphQLRateLimitConfig(query_max_requests=5)
-        app = _make_test_app(config)
-        client = TestClient(app)
 
         for _ in range(5):
-            response = client.post(
-                "/graphql",
-                json={"query": "query { getUser { id } }"},
-            )
+            response = await post(config, _QUERY)
             assert response.status_code == 200
 
-    def test_exceeding_query_limit_returns_429(self):
+    async def test_default_query_limit(self, post):
+        """The default limit of 100 is cheap enough to exhaust over direct ASGI calls."""
+        config = GraphQLRateLimitConfig()
+
+        for _ in range(config.query_max_requests):
+            assert (await post(config, _QUERY)).status_code == 200
+        assert (await post(config, _QUERY)).status_code == 429
+
+    async def test_exceeding_query_limit_returns_429(self, post):
         config = GraphQLRateLimitConfig(query_max_requests=3, window_seconds=60)
-        app = _make_test_app(config)
-        client = TestClient(app)
 
         # Use up the limit
         for _ in range(3):
-            response = client.post(
-                "/graphql",
-                json={"query": "query { getUser { id } }"},
-            )
+            response = await post(config, _QUERY)
             assert response.status_code == 200
 
         # Next request should be rate limited
-        response = client.post(
-            "/graphql",
-            json={"query": "query { getUser { id } }"},
-        )
+        response = await post(config, _QUERY)
         assert response.status_code == 429
         assert "Rate limit exceeded" in response.json()["errors"][0]["message"]
 
-    def test_exceeding_mutation_limit_returns_429(self):
+    async def test_exceeding_mutation_limit_returns_429(self, post):
         config = GraphQLRateLimitConfig(mutation_max_requests=2, window_seconds=60)
-        app = _make_test_app(config)
-        client = TestClient(app)
 
         # Use up mutation limit
         for _ in range(2):
-            response = client.post(
-                "/graphql",
-                json={"query": "mutation { createUser { id } }"},
-            )
+            response = await post(config, _MUTATION)
             assert response.status_code == 200
 
         # Next mutation should be rate limited
-        response = client.post(
-            "/graphql",
-            json={"query": "mutation { createUser { id } }"},
-        )
+        response = await post(config, _MUTATION)
+        assert response.status_code == 429
+        assert "mutation" in response.json()["errors"][0]["message"]
+
+    async def test_mutation_after_other_keys_uses_mutation_limit(self, post):
+        config = GraphQLRateLimitConfig(query_max_requests=10, mutation_max_requests=1)
+        payload = {"operationName": "Create", "query": "mutation Create { createUser { id } }"}
+
+        assert (await post(config, payload)).status_code == 200
+        response = await post(config, payload)
         assert response.status_code == 429
         assert "mutation" in response.json()["errors"][0]["message"]
 
-    def test_mutation_limit_independent_of_query_limit(self):
+    async def test_mutation_limit_independent_of_query_limit(self, post):
         """Mutations and queries have separate limits."""
         config = GraphQLRateLimitConfig(
             query_max_requests=10,
             mutation_max_requests=2,
             window_seconds=60,
         )
-        app = _make_test_app(config)
-        client = TestClient(app)
 
         # Exhaust mutation limit
         for _ in range(2):
-            client.post(
-                "/graphql",
-                json={"query": "mutation { createUser { id } }"},
-            )
+            await post(config, _MUTATION)
 
         # Mutation blocked
-        response = client.post(
-            "/graphql",
-            json={"query": "mutation { createUser { id } }"},
-        )
+        response = await post(config, _MUTATION)
         assert response.status_code == 429
 
         # Queries still work
-        response = client.post(
-            "/graphql",
-            json={"query": "query { getUser { id } }"},
-        )
+        response = await post(config, _QUERY)
         assert response.status_code == 200
 
-    def test_non_graphql_path_not_limited(self):
+    async def test_disabled_allows_all(self, post):
+        config = GraphQLRateLimitConfig(enabled=False, query_max_requests=1)
+
+        for _ in range(10):
+            response = await post(config, _QUERY)
+            assert response.status_code == 200
+
+    def test_non_graphql_path_not_limited(self, app_factory, client_ip: str):
         config = GraphQLRateLimitConfig(query_max_requests=1)
-        app = _make_test_app(config)
-        client = TestClient(app)
+        client = TestClient(app_factory(config), headers={"X-Forwarded-For": client_ip})
 
         # Exhaust graphql limit
-        client.post("/graphql", json={"query": "query { getUser { id } }"})
-        response = client.post("/graphql", json={"query": "query { getUser { id } }"})
+        client.post("/graphql", json=_QUERY)
+        response = client.post("/graphql", json=_QUERY)
         assert response.status_code == 429
 
         # Non-graphql path not affected
         response = client.get("/health")
         assert response.status_code == 200
 
-    def test_disabled_allows_all(self):
-        config = GraphQLRateLimitConfig(enabled=False, query_max_requests=1)
-        app = _make_test_app(config)
-        client = TestClient(app)
-
-        for _ in range(10):
-            response = client.post(
-                "/graphql",
-                json={"query": "query { getUser { id } }"},
-            )
-            assert response.status_code == 200
-
-    def test_rate_limit_error_format(self):
+    def test_rate_limit_error_format(self, app_factory, client_ip: str):
         """Rate limit error should be a valid GraphQL error response."""
         config = GraphQLRateLimitConfig(query_max_requests=1)
-        app = _make_test_app(config)
-        client = TestClient(app)
+        client = TestClient(app_factory(config), headers={"X-Forwarded-For": client_ip})
 
-        client.post("/graphql", json={"query": "query { getUser { id } }"})
-        response = client.post("/graphql", json={"query": "query { getUser { id } }"})
+        client.post("/graphql", json=_QUERY)
+        response = client.post("/graphql", json=_QUERY)
 
+        assert response.headers["content-type"] == "application/json"
         data = response.json()
         assert "errors" in data
         assert isinstance(data["errors"], list)
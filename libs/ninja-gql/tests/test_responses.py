@@ -0,0 +1,24 @@
+"""Tests for the shared GraphQL error response helpers."""
+
+from __future__ import annotations
+
+import json
+
+from ninja_gql.responses import encode_graphql_errors, graphql_error_response
+from starlette.responses import JSONResponse
+
+
+class TestGraphQLErrorResponses:
+    def test_body_matches_json_response(self):
+        content = {"errors": [{"message": "Rate limit exceeded — try later"}]}
+        assert encode_graphql_errors("Rate limit exceeded — try later") == JSONResponse(content).body
+
+    def test_multiple_messages(self):
+        body = json.loads(encode_graphql_errors("a", "b"))
+        assert body == {"errors": [{"message": "a"}, {"message": "b"}]}
+
+    def test_response_headers(self):
+        response = graphql_error_response(429, encode_graphql_errors("slow down"))
+        assert response.status_code == 429
+        assert response.headers["content-type"] == "application/json"
+        assert response.body == b'{"errors":[{"message":"slow down"}]}'
@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any
 
 import pytest
 import strawberry
+from graphql.language.parser import Parser
 from ninja_auth.agent_context import clear_user_context, set_user_context
 from ninja_auth.context import UserContext
 from ninja_core.schema.project import AgenticSchema
-from ninja_gql.schema import build_schema, build_schema_sdl
+from ninja_gql.schema import _document_cache_extensions, build_schema, build_schema_sdl
+from ninja_gql.security import GraphQLSecurityConfig, QueryDepthRule
+from strawberry.extensions import ParserCache, ValidationCache
 
 
 @pytest.fixture(autouse=True)
@@ -22,236 +26,214 @@ def _auth_context_for_mutations():
 
 
 class TestBuildSchema:
-    def test_returns_strawberry_schema(self, sample_asd: AgenticSchema):
-        schema = build_schema(sample_asd)
+    def test_returns_strawberry_schema(self, cached_schema):
+        schema = cached_schema()
         assert isinstance(schema, strawberry.Schema)
 
-    def test_schema_has_query_and_mutation(self, sample_asd: AgenticSchema):
-        schema = build_schema(sample_asd)
-        sdl = str(schema)
+    def test_schema_has_query_and_mutation(self, sample_sdl_tokens: frozenset[str]):
+        assert "Query" in sample_sdl_tokens
+        assert "Mutation" in sample_sdl_tokens
 
-        assert "Query" in sdl
-        assert "Mutation" in sdl
+    def test_get_queries_generated(self, sample_sdl_tokens: frozenset[str]):
+        assert "getCustomer" in sample_sdl_tokens
+        assert "getOrder" in sample_sdl_tokens
+        assert "getProduct" in sample_sdl_tokens
 
-    def test_get_queries_generated(self, sample_asd: AgenticSchema):
-        sdl = build_schema_sdl(sample_asd)
-
-        assert "getCustomer" in sdl
-        assert "getOrder" in sdl
-        assert "getProduct" in sdl
-
-    def test_list_queries_generated(self, sample_asd: AgenticSchema):
-        sdl = build_schema_sdl(sample_asd)
-
-        assert "listCustomer" in sdl
-        assert "listOrder" in sdl
-        assert "listProduct" in sdl
-
-    def test_search_query_only_for_embeddable(self, sample_asd: AgenticSchema):
-        sdl = build_schema_sdl(sample_asd)
+    def test_list_queries_generated(self, sample_sdl_tokens: frozenset[str]):
+        assert "listCustomer" in sample_sdl_tokens
+        assert "listOrder" in sample_sdl_tokens
+        assert "listProduct" in sample_sdl_tokens
 
+    def test_search_query_only_for_embeddable(self, sample_sdl_tokens: frozenset[str]):
         # Product has embedding, Customer/Order do not
-        assert "searchProduct" in sdl
-        assert "searchCustomer" not in sdl
-        assert "searchOrder" not in sdl
-
-    def test_mutations_generated(self, sample_asd: AgenticSchema):
-        sdl = build_schema_sdl(sample_asd)
-
-        assert "createCustomer" in sdl
-        assert "updateCustomer" in sdl
-        assert "deleteCustomer" in sdl
-        assert "createOrder" in sdl
-        assert "deleteProduct" in sdl
-
-    def test_agent_query_generated(self, sample_asd: AgenticSchema):
-        sdl = build_schema_sdl(sample_asd)
-
-        assert "askSales" in sdl
-        assert "askCatalog" in sdl
-
-
-class TestSchemaExecution:
-    async def test_get_query_returns_none_without_repo(self, sample_asd: AgenticSchema):
-        """Calling a resolver without a real repo raises RuntimeError."""
-        schema = build_schema(sample_asd)
-
-        result = await schema.execute('{ getCustomer(id: "abc") { id name } }')
-        # Should error because no repo is configured
-        assert result.errors is not None
-        assert len(result.errors) > 0
-
-    async def test_get_query_resolves_with_mock_repo(self, sample_asd: AgenticSchema):
-        """With a mock repo, queries resolve correctly."""
-        import uuid
-
-        uid = str(uuid.uuid4())
-
-        class MockRepo:
-            async def find_by_id(self, id: str) -> dict[str, Any] | None:
-                return {"id": uid, "name": "Alice", "email": "alice@test.com"}
-
-            async def find_many(self, filters=None, limit=100) -> list[dict[str, Any]]:
-                return [{"id": uid, "name": "Alice", "email": "alice@test.com"}]
-
-            async def create(self, data: dict[str, Any]) -> dict[str, Any]:
-                return {**data, "id": uid}
-
-            async def update(self, id: str, patch: dict[str, Any]) -> dict[str, Any] | None:
-                return {"id": id, "name": patch.get("name", "Alice"), "email": "alice@test.com"}
-
-            async def delete(self, id: str) -> bool:
-                return True
-
-            async def search_semantic(self, query: str, limit: int = 10) -> list[dict[str, Any]]:
-                return []
-
-            async def upsert_embedding(self, id: str, embedding: list[float]) -> None:
-                pass
+        assert "searchProduct" in sample_sdl_tokens
+        assert "searchCustomer" not in sample_sdl_tokens
+        assert "searchOrder" not in sample_sdl_tokens
+
+    def test_mutations_generated(self, sample_sdl_tokens: frozenset[str]):
+        assert "createCustomer" in sample_sdl_tokens
+        assert "updateCustomer" in sample_sdl_tokens
+        assert "deleteCustomer" in sample_sdl_tokens
+        assert "createOrder" in sample_sdl_tokens
+        assert "deleteProduct" in sample_sdl_tokens
+
+    def test_agent_query_generated(self, sample_sdl_tokens: frozenset[str]):
+        assert "askSales" in sample_sdl_tokens
+        assert "askCatalog" in sample_sdl_tokens
+
+    def test_sdl_matches_full_schema(self, sample_asd: AgenticSchema):
+        """The SDL-only path must print the same schema as build_schema."""
+        assert build_schema_sdl(sample_asd) == str(build_schema(sample_asd))
+
+    def test_sdl_cached_per_asd_content(self, sample_asd: AgenticSchema):
+        first = build_schema_sdl(sample_asd)
+        assert build_schema_sdl(sample_asd.model_copy(deep=True)) is first
+
+        changed = sample_asd.model_copy(update={"entities": sample_asd.entities[:1]})
+        assert build_schema_sdl(changed) != first
+
+
+class TestDocumentCaches:
+    def test_default_schema_caches_parse_and_validation(self, cached_schema):
+        factories = cached_schema().extensions
+        built = [type(factory()) for factory in factories]
+        assert built[:2] == [ParserCache, ValidationCache]
+
+    def test_zero_cache_size_disables_caches(self):
+        assert _document_cache_extensions(GraphQLSecurityConfig(document_cache_size=0)) == []
+
+    async def test_repeated_query_reuses_parse_and_validation(self, cached_schema, monkeypatch):
+        schema = cached_schema(GraphQLSecurityConfig(document_cache_size=7))
+        query = '{ askCatalog(query: "cache me") }'
+        calls = {"parse": 0, "validate": 0}
+
+        def counting(name: str, original: Callable[..., Any]) -> Callable[..., Any]:
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                calls[name] += 1
+                return original(*args, **kwargs)
+
+            return wrapper
+
+        monkeypatch.setattr(Parser, "parse_document", counting("parse", Parser.parse_document))
+        monkeypatch.setattr(
+            QueryDepthRule,
+            "enter_operation_definition",
+            counting("validate", QueryDepthRule.enter_operation_definition),
+        )
 
-        repos: dict[str, Any] = {
-            "Customer": MockRepo(),
-            "Order": MockRepo(),
-            "Product": MockRepo(),
-        }
-        schema = build_schema(sample_asd, repo_getter=lambda name: repos[name])
+        await schema.execute(query)
+        assert calls == {"parse": 1, "validate": 1}
+        result = await schema.execute(query)
 
-        result = await schema.execute(f'{{ getCustomer(id: "{uid}") {{ id name email }} }}')
         assert result.errors is None
-        assert result.data["getCustomer"]["name"] == "Alice"
+        assert calls == {"parse": 1, "validate": 1}
 
-    async def test_list_query_resolves(self, sample_asd: AgenticSchema):
-        uid = "test-id-123"
 
-        class MockRepo:
-            async def find_by_id(self, id: str) -> dict[str, Any] | None:
-                return None
+class MockRepo:
+    """In-memory stand-in for ``Repository`` returning canned results."""
 
-            async def find_many(self, filters=None, limit=100) -> list[dict[str, Any]]:
-                return [
-                    {"id": uid, "name": "Bob", "email": "bob@test.com"},
-                    {"id": "id-2", "name": "Carol", "email": "carol@test.com"},
-                ]
+    def __init__(
+        self,
+        *,
+        by_id: dict[str, Any] | None = None,
+        many: list[dict[str, Any]] | None = None,
+        search: list[dict[str, Any]] | None = None,
+        created: list[dict[str, Any]] | None = None,
+        deleted: bool = True,
+    ) -> None:
+        self._by_id = by_id
+        self._many = many or []
+        self._search = search or []
+        self._created = created
+        self._deleted = deleted
 
-            async def create(self, data):
-                return data
+    async def find_by_id(self, id: str) -> dict[str, Any] | None:
+        return self._by_id
 
-            async def update(self, id, patch):
-                return None
+    async def find_many(self, filters=None, limit=100) -> list[dict[str, Any]]:
+        return self._many
 
-            async def delete(self, id):
-                return False
+    async def create(self, data: dict[str, Any]) -> dict[str, Any]:
+        if self._created is not None:
+            self._created.append(data)
+        return {**data, "id": "new-id"}
 
-            async def search_semantic(self, query, limit=10):
-                return []
+    async def update(self, id: str, patch: dict[str, Any]) -> dict[str, Any] | None:
+        return None if self._by_id is None else {**self._by_id, **patch}
 
-            async def upsert_embedding(self, id, embedding):
-                pass
+    async def delete(self, id: str) -> bool:
+        return self._deleted
 
-        repos = {"Customer": MockRepo(), "Order": MockRepo(), "Product": MockRepo()}
-        schema = build_schema(sample_asd, repo_getter=lambda name: repos[name])
+    async def search_semantic(self, query: str, limit: int = 10) -> list[dict[str, Any]]:
+        return self._search
 
-        result = await schema.execute("{ listCustomer { id name } }")
-        assert result.errors is None
-        assert len(result.data["listCustomer"]) == 2
+    async def upsert_embedding(self, id: str, embedding: list[float]) -> None:
+        pass
 
-    async def test_mutation_create_resolves(self, sample_asd: AgenticSchema):
-        created: list[dict] = []
-
-        class MockRepo:
-            async def find_by_id(self, id):
-                return None
-
-            async def find_many(self, filters=None, limit=100):
-                return []
-
-            async def create(self, data: dict[str, Any]) -> dict[str, Any]:
-                created.append(data)
-                return {**data, "id": "new-id"}
-
-            async def update(self, id, patch):
-                return None
-
-            async def delete(self, id):
-                return True
-
-            async def search_semantic(self, query, limit=10):
-                return []
 
-            async def upsert_embedding(self, id, embedding):
-                pass
+_UID = "3f1c2b9e-8d4a-4e5f-9a6b-7c8d9e0f1a2b"
 
-        repos = {"Customer": MockRepo(), "Order": MockRepo(), "Product": MockRepo()}
-        schema = build_schema(sample_asd, repo_getter=lambda name: repos[name])
 
-        result = await schema.execute(
-            'mutation { createCustomer(input: {name: "Dave", email: "d@test.com"}) { id name } }'
-        )
-        assert result.errors is None
-        assert result.data["createCustomer"]["name"] == "Dave"
-
-    async def test_mutation_delete_resolves(self, sample_asd: AgenticSchema):
-        class MockRepo:
-            async def find_by_id(self, id):
-                return None
-
-            async def find_many(self, filters=None, limit=100):
-                return []
+@pytest.fixture(scope="module")
+def repo_schema(shared_asd: AgenticSchema) -> tuple[strawberry.Schema, Callable[[MockRepo], None]]:
+    """One schema for the module whose resolvers use whichever ``MockRepo`` was last installed."""
+    current: dict[str, MockRepo] = {}
+    schema = build_schema(shared_asd, repo_getter=lambda name: current["repo"])
 
-            async def create(self, data):
-                return data
+    def install(repo: MockRepo) -> None:
+        current["repo"] = repo
 
-            async def update(self, id, patch):
-                return None
+    return schema, install
 
-            async def delete(self, id: str) -> bool:
-                return True
 
-            async def search_semantic(self, query, limit=10):
-                return []
-
-            async def upsert_embedding(self, id, embedding):
-                pass
+class TestSchemaExecution:
+    async def test_get_query_returns_none_without_repo(self, cached_schema):
+        """Calling a resolver without a real repo raises RuntimeError."""
+        schema = cached_schema()
 
-        repos = {"Customer": MockRepo(), "Order": MockRepo(), "Product": MockRepo()}
-        schema = build_schema(sample_asd, repo_getter=lambda name: repos[name])
+        result = await schema.execute('{ getCustomer(id: "abc") { id name } }')
+        # Should error because no repo is configured
+        assert result.errors is not None
+        assert len(result.errors) > 0
 
-        result = await schema.execute('mutation { deleteCustomer(id: "abc") }')
+    @pytest.mark.parametrize(
+        ("query", "repo_kwargs", "expected"),
+        [
+            pytest.param(
+                f'{{ getCustomer(id: "{_UID}") {{ id name email }} }}',
+                {"by_id": {"id": _UID, "name": "Alice", "email": "alice@test.com"}},
+                {"getCustomer": {"id": _UID, "name": "Alice", "email": "alice@test.com"}},
+                id="get",
+            ),
+            pytest.param(
+                "{ listCustomer { id name } }",
+                {
+                    "many": [
+                        {"id": "test-id-123", "name": "Bob", "email": "bob@test.com"},
+                        {"id": "id-2", "name": "Carol", "email": "carol@test.com"},
+                    ]
+                },
+                {"listCustomer": [{"id": "test-id-123", "name": "Bob"}, {"id": "id-2", "name": "Carol"}]},
+                id="list",
+            ),
+            pytest.param(
+                'mutation { createCustomer(input: {name: "Dave", email: "d@test.com"}) { id name } }',
+                {},
+                {"createCustomer": {"id": "new-id", "name": "Dave"}},
+                id="create",
+            ),
+            pytest.param(
+                'mutation { deleteCustomer(id: "abc") }',
+                {},
+                {"deleteCustomer": True},
+                id="delete",
+            ),
+            pytest.param(
+                '{ searchProduct(query: "red shoes") { id name price } }',
+                {"search": [{"id": "p1", "name": "Red Shoes", "price": 59.99, "description": "Bright red shoes"}]},
+                {"searchProduct": [{"id": "p1", "name": "Red Shoes", "price": 59.99}]},
+                id="search",
+            ),
+        ],
+    )
+    async def test_resolves_with_mock_repo(self, repo_schema, query: str, repo_kwargs: dict, expected: dict):
+        schema, install = repo_schema
+        install(MockRepo(**repo_kwargs))
+
+        result = await schema.execute(query)
         assert result.errors is None
-        assert result.data["deleteCustomer"] is True
-
-    async def test_search_query_resolves(self, sample_asd: AgenticSchema):
-        class MockRepo:
-            async def find_by_id(self, id):
-                return None
-
-            async def find_many(self, filters=None, limit=100):
-                return []
-
-            async def create(self, data):
-                return data
+        assert result.data == expected
 
-            async def update(self, id, patch):
-                return None
-
-            async def delete(self, id):
-                return False
-
-            async def search_semantic(self, query: str, limit: int = 10) -> list[dict[str, Any]]:
-                return [{"id": "p1", "name": "Red Shoes", "price": 59.99, "description": "Bright red shoes"}]
-
-            async def upsert_embedding(self, id, embedding):
-                pass
-
-        repos = {"Customer": MockRepo(), "Order": MockRepo(), "Product": MockRepo()}
-        schema = build_schema(sample_asd, repo_getter=lambda name: repos[name])
+    async def test_mutation_create_passes_input_to_repo(self, repo_schema):
+        schema, install = repo_schema
+        created: list[dict] = []
+        install(MockRepo(created=created))
 
-        result = await schema.execute('{ searchProduct(query: "red shoes") { id name price } }')
-        assert result.errors is None
-        assert result.data["searchProduct"][0]["name"] == "Red Shoes"
+        await schema.execute('mutation { createCustomer(input: {name: "Dave", email: "d@test.com"}) { id } }')
+        assert created[0]["name"] == "Dave"
 
-    async def test_agent_query_without_router(self, sample_asd: AgenticSchema):
-        schema = build_schema(sample_asd)
+    async def test_agent_query_without_router(self, cached_schema):
+        schema = cached_schema()
 
         result = await schema.execute('{ askSales(query: "top customers") }')
         assert result.errors is None
@@ -2,16 +2,32 @@
 
 from __future__ import annotations
 
+import time
+
 import pytest
+from graphql import DocumentNode
 from graphql import parse as gql_parse
+from graphql.validation import ASTValidationRule
 from ninja_core.schema.project import AgenticSchema
 from ninja_gql.schema import build_schema
 from ninja_gql.security import (
+    UNLIMITED,
     GraphQLSecurityConfig,
+    IntrospectionControlRule,
+    QueryDepthRule,
+    _fragment_map,
     _measure_complexity,
     _measure_depth,
     build_security_extensions,
 )
+from strawberry.extensions import AddValidationRules
+
+# Documents for the fragment-parity complexity test, parsed once at import.
+_DOC_COST_DIRECT = gql_parse("{ getUser { id profile { name } } }")
+_DOC_COST_VIA_FRAGMENTS = gql_parse(
+    "{ getUser { ...UserFields } } fragment UserFields on User { id ... on User { profile { name } } }"
+)
+
 
 # ---------------------------------------------------------------------------
 # Introspection control
@@ -19,48 +35,64 @@ from ninja_gql.security import (
 
 
 class TestIntrospectionControl:
-    """Tests for the IntrospectionControlExtension."""
+    """Tests for the IntrospectionControlRule."""
 
-    async def test_introspection_enabled_by_default(self, sample_asd: AgenticSchema):
+    async def test_introspection_enabled_by_default(self, cached_schema):
         """Introspection works with default config (enabled)."""
-        schema = build_schema(sample_asd)
+        schema = cached_schema()
         result = await schema.execute("{ __schema { types { name } } }")
         assert result.errors is None
         assert result.data is not None
         assert "__schema" in result.data
 
-    async def test_introspection_disabled_blocks_schema_query(self, sample_asd: AgenticSchema):
+    async def test_introspection_disabled_blocks_schema_query(self, cached_schema):
         """Introspection __schema is blocked when disabled."""
         config = GraphQLSecurityConfig(introspection_enabled=False)
-        schema = build_schema(sample_asd, security_config=config)
+        schema = cached_schema(config)
         result = await schema.execute("{ __schema { types { name } } }")
         assert result.errors is not None
         assert any("Introspection is disabled" in str(e) for e in result.errors)
 
-    async def test_introspection_disabled_blocks_type_query(self, sample_asd: AgenticSchema):
+    async def test_introspection_disabled_blocks_type_query(self, cached_schema):
         """Introspection __type is blocked when disabled."""
         config = GraphQLSecurityConfig(introspection_enabled=False)
-        schema = build_schema(sample_asd, security_config=config)
+        schema = cached_schema(config)
         result = await schema.execute('{ __type(name: "Query") { fields { name } } }')
         assert result.errors is not None
         assert any("Introspection is disabled" in str(e) for e in result.errors)
 
-    async def test_introspection_enabled_explicit(self, sample_asd: AgenticSchema):
+    async def test_introspection_enabled_explicit(self, cached_schema):
         """Introspection works when explicitly enabled."""
         config = GraphQLSecurityConfig(introspection_enabled=True)
-        schema = build_schema(sample_asd, security_config=config)
+        schema = cached_schema(config)
         result = await schema.execute("{ __schema { queryType { name } } }")
         assert result.errors is None
 
-    async def test_normal_queries_work_when_introspection_disabled(self, sample_asd: AgenticSchema):
+    async def test_normal_queries_work_when_introspection_disabled(self, cached_schema):
         """Non-introspection queries are not affected."""
         config = GraphQLSecurityConfig(introspection_enabled=False)
-        schema = build_schema(sample_asd, security_config=config)
+        schema = cached_schema(config)
         # This should fail for missing repo, not introspection
         result = await schema.execute('{ getCustomer(id: "test") { id } }')
         assert result.errors is not None
         assert not any("Introspection" in str(e) for e in result.errors)
 
+    async def test_introspection_name_in_argument_not_blocked(self, cached_schema):
+        """Only selected fields count — not string arguments or comments."""
+        config = GraphQLSecurityConfig(introspection_enabled=False)
+        schema = cached_schema(config)
+        result = await schema.execute('# __schema\n{ getCustomer(id: "__type") { id } }')
+        assert result.errors is not None
+        assert not any("Introspection" in str(e) for e in result.errors)
+
+    async def test_introspection_in_fragment_blocked(self, cached_schema):
+        """Introspection hidden inside a fragment is still detected."""
+        config = GraphQLSecurityConfig(introspection_enabled=False)
+        schema = cached_schema(config)
+        result = await schema.execute("{ ...Meta } fragment Meta on Query { __schema { queryType { name } } }")
+        assert result.errors is not None
+        assert any("Introspection is disabled" in str(e) for e in result.errors)
+
 
 # ---------------------------------------------------------------------------
 # Query depth limiting
@@ -68,46 +100,64 @@ class TestIntrospectionControl:
 
 
 class TestQueryDepthLimiting:
-    """Tests for the QueryDepthExtension."""
+    """Tests for the QueryDepthRule."""
 
-    async def test_shallow_query_passes(self, sample_asd: AgenticSchema):
+    async def test_shallow_query_passes(self, cached_schema):
         """A simple shallow query passes depth validation."""
         config = GraphQLSecurityConfig(max_query_depth=5)
-        schema = build_schema(sample_asd, security_config=config)
+        schema = cached_schema(config)
         result = await schema.execute('{ getCustomer(id: "test") { id name } }')
         # Should fail due to no repo, not depth
         assert result.errors is not None
         assert not any("depth" in str(e).lower() for e in result.errors)
 
-    async def test_query_at_depth_limit_passes(self, sample_asd: AgenticSchema):
+    async def test_query_at_depth_limit_passes(self, cached_schema):
         """A query exactly at the depth limit passes."""
         config = GraphQLSecurityConfig(max_query_depth=3)
-        schema = build_schema(sample_asd, security_config=config)
+        schema = cached_schema(config)
         # Depth 2: query -> getCustomer -> { id name }
         result = await schema.execute('{ getCustomer(id: "test") { id name } }')
         assert not any("depth" in str(e).lower() for e in (result.errors or []))
 
-    async def test_deeply_nested_query_rejected(self, sample_asd: AgenticSchema):
+    async def test_deeply_nested_query_rejected(self, cached_schema):
         """A deeply nested query exceeding the limit is rejected."""
         # Set depth limit to 1 — even a simple field selection exceeds it
         config = GraphQLSecurityConfig(max_query_depth=1)
-        schema = build_schema(sample_asd, security_config=config)
+        schema = cached_schema(config)
         # This query has depth 2: query -> getCustomer -> { id name }
         result = await schema.execute('{ getCustomer(id: "test") { id name } }')
         assert result.errors is not None
         assert any("depth" in str(e).lower() for e in result.errors)
-
-    def test_measure_depth_flat_query(self):
-        """_measure_depth correctly measures a flat query."""
-        doc = gql_parse("{ getUser { id name } }")
-        depth = _measure_depth(doc.definitions[0])
-        assert depth == 2  # query -> getUser -> fields
-
-    def test_measure_depth_nested_query(self):
-        """_measure_depth correctly measures nested fields."""
-        doc = gql_parse("{ getUser { profile { address { city } } } }")
-        depth = _measure_depth(doc.definitions[0])
-        assert depth == 4  # query -> getUser -> profile -> address -> city
+        assert result.data is None  # rejected during validation, never executed
+
+    @pytest.mark.parametrize(
+        ("doc", "expected"),
+        [
+            # query -> getUser -> fields
+            pytest.param(gql_parse("{ getUser { id name } }"), 2, id="flat"),
+            # query -> getUser -> profile -> address -> city
+            pytest.param(gql_parse("{ getUser { profile { address { city } } } }"), 4, id="nested"),
+            # fragment spreads and inline fragments do not hide nesting
+            pytest.param(
+                gql_parse(
+                    "{ getUser { ...Profile } } "
+                    "fragment Profile on User { profile { ... on Profile { address { city } } } }"
+                ),
+                4,
+                id="via-fragments",
+            ),
+            pytest.param(gql_parse("{ getUser { ...A } } fragment A on User { id ...A }"), 2, id="cyclic-fragments"),
+        ],
+    )
+    def test_measure_depth(self, doc: DocumentNode, expected: int):
+        assert _measure_depth(doc.definitions[0], fragments=_fragment_map(doc)) == expected
+
+    async def test_nesting_inside_fragment_rejected(self, cached_schema):
+        config = GraphQLSecurityConfig(max_query_depth=1)
+        schema = cached_schema(config)
+        result = await schema.execute('{ ...Q } fragment Q on Query { getCustomer(id: "test") { id } }')
+        assert result.errors is not None
+        assert any("depth" in str(e).lower() for e in result.errors)
 
     async def test_default_depth_limit_is_10(self, sample_asd: AgenticSchema):
         """Default depth limit should be 10."""
@@ -121,40 +171,96 @@ class TestQueryDepthLimiting:
 
 
 class TestQueryComplexityLimiting:
-    """Tests for the QueryComplexityExtension."""
+    """Tests for the QueryComplexityRule."""
 
-    async def test_simple_query_passes(self, sample_asd: AgenticSchema):
+    async def test_simple_query_passes(self, cached_schema):
         """A simple query is within the default complexity limit."""
         config = GraphQLSecurityConfig(max_query_complexity=100)
-        schema = build_schema(sample_asd, security_config=config)
+        schema = cached_schema(config)
         result = await schema.execute('{ getCustomer(id: "test") { id name } }')
         # Should fail for repo reasons, not complexity
         assert not any("complexity" in str(e).lower() for e in (result.errors or []))
 
-    async def test_very_low_complexity_limit_rejects(self, sample_asd: AgenticSchema):
+    async def test_very_low_complexity_limit_rejects(self, cached_schema):
         """An extremely low complexity limit rejects even simple queries."""
         config = GraphQLSecurityConfig(max_query_complexity=1, default_field_cost=5)
-        schema = build_schema(sample_asd, security_config=config)
+        schema = cached_schema(config)
         result = await schema.execute('{ getCustomer(id: "test") { id name email } }')
         assert result.errors is not None
         assert any("complexity" in str(e).lower() for e in result.errors)
 
-    def test_measure_complexity_simple(self):
-        """_measure_complexity correctly calculates for a flat query."""
-        doc = gql_parse("{ getUser { id name email } }")
-        cost = _measure_complexity(doc.definitions[0], default_cost=1, list_multiplier=10)
-        # query level: 1 field (getUser) = 1
-        # nested: 3 fields at multiplier 10 = 30
-        assert cost == 1 + 30
-
-    def test_measure_complexity_nested(self):
-        """_measure_complexity correctly handles nested objects."""
-        doc = gql_parse("{ getUser { profile { name } } }")
-        cost = _measure_complexity(doc.definitions[0], default_cost=1, list_multiplier=10)
-        # query level: 1 field (getUser) = 1
-        # level 2: 1 field (profile) = 10
-        # level 3: 1 field (name) = 100
-        assert cost == 1 + 10 + 100
+    @pytest.mark.parametrize(
+        ("doc", "max_list_size", "expected"),
+        [
+            # getUser = 1, three scalars at multiplier 10 = 30
+            pytest.param(gql_parse("{ getUser { id name email } }"), None, 1 + 30, id="flat"),
+            # getUser = 1, profile = 10, name = 100
+            pytest.param(gql_parse("{ getUser { profile { name } } }"), None, 1 + 10 + 100, id="nested"),
+            # a literal first/limit argument replaces the default list multiplier
+            pytest.param(gql_parse("{ listUser(limit: 3) { id name } }"), None, 1 + 2 * 3, id="page-size"),
+            pytest.param(gql_parse("{ listUser(first: 100000) { id } }"), 100, 1 + 100, id="clamped-page-size"),
+            pytest.param(
+                gql_parse("query($n: Int) { listUser(limit: $n) { id } }"), None, 1 + 10, id="variable-page-size"
+            ),
+        ],
+    )
+    def test_measure_complexity(self, doc: DocumentNode, max_list_size: int | None, expected: int):
+        cost = _measure_complexity(doc.definitions[0], default_cost=1, list_multiplier=10, max_list_size=max_list_size)
+        assert cost == expected
+
+    def test_measure_complexity_follows_fragments(self):
+        """Fields selected through fragments cost the same as direct selections."""
+        direct = _DOC_COST_DIRECT
+        via_fragments = _DOC_COST_VIA_FRAGMENTS
+        expected = _measure_complexity(direct.definitions[0])
+        cost = _measure_complexity(via_fragments.definitions[0], fragments=_fragment_map(via_fragments))
+        assert cost == expected == 1 + 20 + 100
+
+    async def test_small_page_allows_wide_selection(self, cached_schema):
+        """Paginated queries are costed by their page size, not the default multiplier."""
+        config = GraphQLSecurityConfig(max_query_complexity=20)
+        schema = cached_schema(config)
+        result = await schema.execute("{ listCustomer(limit: 2) { id name email } }")
+        assert not any("complexity" in str(e).lower() for e in (result.errors or []))
+
+        result = await schema.execute("{ listCustomer { id name email } }")
+        assert any("complexity" in str(e).lower() for e in (result.errors or []))
+
+    async def test_list_limit_capped_to_costed_page_size(self, shared_asd: AgenticSchema):
+        """The page size is clamped when costing, so the resolver must not fetch more rows."""
+        limits: list[int] = []
+
+        class _Repo:
+            async def find_many(self, filters=None, limit=100):
+                limits.append(limit)
+                return []
+
+        schema = build_schema(
+            shared_asd,
+            repo_getter=lambda name: _Repo(),
+            security_config=GraphQLSecurityConfig(max_list_size=5),
+        )
+        result = await schema.execute("{ listCustomer(limit: 100000) { id } listOrder(limit: 3) { id } }")
+        assert result.errors is None
+        assert limits == [5, 3]
+
+    async def test_repeated_fragment_spreads_measured_once(self, cached_schema):
+        """A chain of fragments that each spread the next one twice must not be walked exponentially."""
+        n = 22
+        chain = " ".join(f"fragment F{i} on Query {{ ...F{i + 1} ...F{i + 1} }}" for i in range(n))
+        query = f"{{ ...F0 }} {chain} fragment F{n} on Query {{ __typename }}"
+        doc = gql_parse(query)
+        fragments = _fragment_map(doc)
+
+        started = time.perf_counter()
+        assert _measure_depth(doc.definitions[0], fragments=fragments) == 1
+        assert _measure_complexity(doc.definitions[0], fragments=fragments) == 2**n
+        assert _measure_complexity(doc.definitions[0], fragments=fragments, limit=1000) > 1000
+        result = await cached_schema().execute(query)
+        elapsed = time.perf_counter() - started
+
+        assert any("complexity" in str(e).lower() for e in (result.errors or []))
+        assert elapsed < 1
 
     async def test_default_complexity_limit(self):
         """Default complexity limit should be 1000."""
@@ -182,6 +288,8 @@ class TestGraphQLSecurityConfig:
         assert config.max_query_complexity == 1000
         assert config.default_field_cost == 1
         assert config.list_field_multiplier == 10
+        assert config.max_list_size == 100
+        assert config.document_cache_size == 128
 
     def test_custom_values(self):
         config = GraphQLSecurityConfig(
@@ -212,15 +320,61 @@ class TestGraphQLSecurityConfig:
 class TestBuildSecurityExtensions:
     """Tests for the build_security_extensions helper."""
 
-    def test_returns_three_extensions(self):
+    def test_defaults_install_only_validation_rules(self):
+        """Introspection is enabled by default, so its extension is skipped."""
         extensions = build_security_extensions()
-        assert len(extensions) == 3
+        assert len(extensions) == 1
+        assert type(extensions[0]()) is AddValidationRules
 
-    def test_custom_config_applies(self):
-        config = GraphQLSecurityConfig(max_query_depth=3)
-        extensions = build_security_extensions(config)
-        assert len(extensions) == 3
+    def test_disabled_introspection_adds_rule(self):
+        config = GraphQLSecurityConfig(introspection_enabled=False, max_query_depth=3)
+        (rules_factory,) = build_security_extensions(config)
+        assert IntrospectionControlRule in rules_factory().validation_rules
 
     def test_none_config_uses_defaults(self):
         extensions = build_security_extensions(None)
-        assert len(extensions) == 3
+        assert len(extensions) == 1
+
+    def test_unlimited_limits_skip_validation_rules(self):
+        config = GraphQLSecurityConfig(max_query_depth=UNLIMITED, max_query_complexity=UNLIMITED)
+        assert build_security_extensions(config) == []
+
+    def test_single_unlimited_limit_keeps_the_other_rule(self):
+        config = GraphQLSecurityConfig(max_query_depth=UNLIMITED)
+        (rules_factory,) = build_security_extensions(config)
+        assert len(rules_factory().validation_rules) == 1
+
+    def test_validation_rules_are_rule_classes(self):
+        """graphql-core only accepts ASTValidationRule subclasses, not partials."""
+        config = GraphQLSecurityConfig(max_query_depth=4, max_query_complexity=50, max_list_size=20)
+        (rules_factory,) = build_security_extensions(config)
+        depth_rule, complexity_rule = rules_factory().validation_rules
+        for rule in (depth_rule, complexity_rule):
+            assert isinstance(rule, type) and issubclass(rule, ASTValidationRule)
+        assert depth_rule.max_depth == 4
+        assert (complexity_rule.max_complexity, complexity_rule.max_list_size) == (50, 20)
+        assert QueryDepthRule.max_depth == 10  # the base class is left untouched
+
+    def test_rule_classes_reused_across_builds(self):
+        """Equal limits map to the same configured class instead of a new one per build."""
+        config = GraphQLSecurityConfig(max_query_depth=4, max_query_complexity=50)
+        (first,) = build_security_extensions(config)
+        (second,) = build_security_extensions(config.model_copy())
+        assert first().validation_rules == second().validation_rules
+        (other,) = build_security_extensions(GraphQLSecurityConfig(max_query_depth=5, max_query_complexity=50))
+        assert other().validation_rules[0] is not first().validation_rules[0]
+
+    async def test_unlimited_schema_still_executes(self, cached_schema):
+        config = GraphQLSecurityConfig(max_query_depth=UNLIMITED, max_query_complexity=UNLIMITED)
+        schema = cached_schema(config)
+        result = await schema.execute("{ __schema { queryType { name } } }")
+        assert result.errors is None
+
+    def test_disabled_introspection_alone_installs_rule(self):
+        config = GraphQLSecurityConfig(
+            introspection_enabled=False, max_query_depth=UNLIMITED, max_query_complexity=UNLIMITED
+        )
+        (rules_factory,) = build_security_extensions(config)
+        rules = rules_factory()
+        assert type(rules) is AddValidationRules
+        assert rules.validation_rules == [IntrospectionControlRule]
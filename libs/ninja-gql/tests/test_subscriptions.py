@@ -10,67 +10,77 @@ from ninja_gql.resolvers.subscription import EntityChangePayload, make_subscript
 from ninja_gql.schema import build_schema
 
 # ---------------------------------------------------------------------------
-# EventBus unit tests
+# Helpers
 # ---------------------------------------------------------------------------
 
 
-class TestEventBus:
-    @pytest.mark.asyncio
-    async def test_publish_delivers_to_subscriber(self) -> None:
-        bus = EventBus()
-        event = EntityChangeEvent(
-            entity_name="Customer",
-            change_type=ChangeType.CREATED,
-            entity_id="abc",
-            data={"name": "Alice"},
-        )
-        received: list[EntityChangeEvent] = []
+async def _subscribed(bus: EventBus, topic: str, n: int = 1) -> None:
+    """Return once *topic* has at least *n* registered subscribers.
 
-        async def _collect() -> None:
-            async for e in bus.subscribe("customer"):
-                received.append(e)
-                break  # stop after first
+    Returns without yielding when they are already registered; otherwise
+    yields to the loop only until the subscribing tasks reach ``subscribe()``.
+    Raises :class:`TimeoutError` if they have not registered within a second.
+    """
+    async with asyncio.timeout(1):
+        while len(bus._subscribers.get(topic, ())) < n:
+            await asyncio.sleep(0)
 
-        task = asyncio.create_task(_collect())
-        await asyncio.sleep(0)  # let subscriber register
 
-        await bus.publish("customer", event)
-        await task
+# ---------------------------------------------------------------------------
+# EventBus unit tests
+# ---------------------------------------------------------------------------
 
-        assert len(received) == 1
-        assert received[0].entity_id == "abc"
-        assert received[0].change_type == ChangeType.CREATED
 
-    @pytest.mark.asyncio
-    async def test_multiple_subscribers(self) -> None:
-        bus = EventBus()
-        event = EntityChangeEvent(
-            entity_name="Order",
-            change_type=ChangeType.UPDATED,
-            entity_id="o1",
-        )
-        results_a: list[EntityChangeEvent] = []
-        results_b: list[EntityChangeEvent] = []
+@pytest.fixture
+def bus() -> EventBus:
+    """A private bus per test; construction is trivial, so sharing one buys nothing."""
+    return EventBus()
+
 
-        async def _sub(target: list[EntityChangeEvent]) -> None:
-            async for e in bus.subscribe("order"):
-                target.append(e)
-                break
+class TestEventBus:
+    @pytest.mark.parametrize(
+        ("topic", "event", "subscribers"),
+        [
+            pytest.param(
+                "customer",
+                EntityChangeEvent(
+                    entity_name="Customer",
+                    change_type=ChangeType.CREATED,
+                    entity_id="abc",
+                    data={"name": "Alice"},
+                ),
+                1,
+                id="single",
+            ),
+            pytest.param(
+                "order",
+                EntityChangeEvent(entity_name="Order", change_type=ChangeType.UPDATED, entity_id="o1"),
+                2,
+                id="fan-out",
+            ),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_publish_delivers_to_every_subscriber(
+        self, bus: EventBus, topic: str, event: EntityChangeEvent, subscribers: int
+    ) -> None:
+        async def _first_event() -> EntityChangeEvent:
+            events = bus.subscribe(topic)
+            received = await anext(events)
+            await events.aclose()
+            return received
 
-        ta = asyncio.create_task(_sub(results_a))
-        tb = asyncio.create_task(_sub(results_b))
-        await asyncio.sleep(0)
+        tasks = [asyncio.create_task(_first_event()) for _ in range(subscribers)]
+        await _subscribed(bus, topic, subscribers)
 
-        await bus.publish("order", event)
-        await ta
-        await tb
+        await bus.publish(topic, event)
 
-        assert len(results_a) == 1
-        assert len(results_b) == 1
+        assert await asyncio.gather(*tasks) == [event] * subscribers
+        # aclose() runs subscribe()'s finally block before each task returns.
+        assert bus._subscribers[topic] == []
 
     @pytest.mark.asyncio
-    async def test_no_cross_topic_delivery(self) -> None:
-        bus = EventBus()
+    async def test_no_cross_topic_delivery(self, bus: EventBus) -> None:
         event = EntityChangeEvent(
             entity_name="Product",
             change_type=ChangeType.DELETED,
@@ -79,15 +89,17 @@ class TestEventBus:
         received: list[EntityChangeEvent] = []
 
         async def _sub() -> None:
-            async for e in bus.subscribe("customer"):
-                received.append(e)
-                break
+            events = bus.subscribe("customer")
+            received.append(await anext(events))
+            await events.aclose()
 
         task = asyncio.create_task(_sub())
-        await asyncio.sleep(0)
+        await _subscribed(bus, "customer")
 
         await bus.publish("product", event)
-        await asyncio.sleep(0.05)
+        # publish() enqueues to every matching subscriber before returning, so
+        # an empty customer queue means nothing was delivered to it.
+        assert all(queue.empty() for queue in bus._subscribers["customer"])
 
         task.cancel()
         with pytest.raises(asyncio.CancelledError):
@@ -96,15 +108,13 @@ class TestEventBus:
         assert len(received) == 0
 
     @pytest.mark.asyncio
-    async def test_subscriber_cleanup_on_cancel(self) -> None:
-        bus = EventBus()
+    async def test_subscriber_cleanup_on_cancel(self, bus: EventBus) -> None:
 
         async def _sub() -> None:
-            async for _ in bus.subscribe("topic"):
-                break
+            await anext(bus.subscribe("topic"))
 
         task = asyncio.create_task(_sub())
-        await asyncio.sleep(0)
+        await _subscribed(bus, "topic")
 
         assert len(bus._subscribers.get("topic", [])) == 1
 
@@ -127,8 +137,7 @@ class TestGetEventBus:
 
 class TestSubscriptionResolver:
     @pytest.mark.asyncio
-    async def test_resolver_yields_payload(self, sample_asd) -> None:
-        bus = EventBus()
+    async def test_resolver_yields_payload(self, sample_asd, bus: EventBus) -> None:
         entity = sample_asd.entities[0]  # Customer
         resolver = make_subscription_resolver(entity, event_bus=bus)
 
@@ -142,12 +151,12 @@ class TestSubscriptionResolver:
         payloads: list[EntityChangePayload] = []
 
         async def _collect() -> None:
-            async for p in resolver(None):
-                payloads.append(p)
-                break
+            stream = resolver(None)
+            payloads.append(await anext(stream))
+            await stream.aclose()
 
         task = asyncio.create_task(_collect())
-        await asyncio.sleep(0)
+        await _subscribed(bus, "customer")
 
         await bus.publish("customer", event)
         await task
@@ -170,37 +179,33 @@ class TestSubscriptionResolver:
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture
+def isolated_bus(bus: EventBus, monkeypatch: pytest.MonkeyPatch) -> EventBus:
+    """Make schemas built during the test subscribe to a private bus.
+
+    Resolvers bind their bus when the schema is built, so the schema must be
+    built after this fixture (and not taken from ``cached_schema``).
+    """
+    monkeypatch.setattr("ninja_gql.resolvers.subscription.get_event_bus", lambda: bus)
+    return bus
+
+
 class TestSchemaSubscriptions:
-    def test_schema_has_subscription_type(self, sample_asd) -> None:
-        schema = build_schema(sample_asd)
-        sdl = str(schema)
-        assert "Subscription" in sdl
-
-    def test_schema_has_per_entity_subscription_fields(self, sample_asd) -> None:
-        schema = build_schema(sample_asd)
-        sdl = str(schema)
-        assert "onCustomerChanged" in sdl
-        assert "onOrderChanged" in sdl
-        assert "onProductChanged" in sdl
-
-    def test_subscription_field_returns_payload_type(self, sample_asd) -> None:
-        schema = build_schema(sample_asd)
-        sdl = str(schema)
-        assert "EntityChangePayload" in sdl
+    def test_schema_has_subscription_type(self, sample_sdl_tokens: frozenset[str]) -> None:
+        assert "Subscription" in sample_sdl_tokens
 
-    @pytest.mark.asyncio
-    async def test_subscription_execution(self, sample_asd) -> None:
-        bus = EventBus()
+    def test_schema_has_per_entity_subscription_fields(self, sample_sdl_tokens: frozenset[str]) -> None:
+        assert "onCustomerChanged" in sample_sdl_tokens
+        assert "onOrderChanged" in sample_sdl_tokens
+        assert "onProductChanged" in sample_sdl_tokens
 
-        # Patch the default bus for this test
-        import ninja_gql.resolvers.subscription as sub_mod
+    def test_subscription_field_returns_payload_type(self, sample_sdl_tokens: frozenset[str]) -> None:
+        assert "EntityChangePayload" in sample_sdl_tokens
 
-        original = sub_mod.get_event_bus
-        sub_mod.get_event_bus = lambda: bus
-        try:
-            schema = build_schema(sample_asd)
-        finally:
-            sub_mod.get_event_bus = original
+    @pytest.mark.asyncio
+    async def test_subscription_execution(self, shared_asd, isolated_bus: EventBus) -> None:
+        bus = isolated_bus
+        schema = build_schema(shared_asd)
 
         sub_query = """
             subscription {
@@ -222,16 +227,18 @@ class TestSchemaSubscriptions:
             data={"name": "Updated"},
         )
 
-        async def _publish_after_delay() -> None:
-            await asyncio.sleep(0)
+        async def _publish_when_subscribed() -> None:
+            await _subscribed(bus, "customer")
             await bus.publish("customer", event)
 
-        asyncio.create_task(_publish_after_delay())
+        publisher = asyncio.create_task(_publish_when_subscribed())
+
+        gql_result = await anext(result)
+        await result.aclose()
+        await publisher
 
-        async for gql_result in result:
-            assert gql_result.data is not None
-            payload = gql_result.data["onCustomerChanged"]
-            assert payload["entityName"] == "Customer"
-            assert payload["changeType"] == "UPDATED"
-            assert payload["entityId"] == "c99"
-            break
+        assert gql_result.data is not None
+        payload = gql_result.data["onCustomerChanged"]
+        assert payload["entityName"] == "Customer"
+        assert payload["changeType"] == "UPDATED"
+        assert payload["entityId"] == "c99"
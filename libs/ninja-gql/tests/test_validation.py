@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import gc
+from typing import Any
+
 import pytest
 from ninja_core.schema.entity import (
     EntitySchema,
@@ -12,7 +15,10 @@ from ninja_core.schema.entity import (
 )
 from ninja_core.schema.project import AgenticSchema
 from ninja_gql.validation import (
+    _ENTITY_VALIDATION_META,
     InputValidationError,
+    _plan_for,
+    invalidate_validation_plan,
     validate_create_input,
     validate_update_input,
 )
@@ -142,6 +148,15 @@ class TestValidateCreateInput:
             )
         assert "expected integer" in str(exc_info.value)
 
+    def test_boolean_not_confused_with_float(self, customer_entity: EntitySchema):
+        """Booleans should not pass as numbers either."""
+        with pytest.raises(InputValidationError) as exc_info:
+            validate_create_input(
+                customer_entity,
+                {"name": "Alice", "email": "a@b.c", "score": False},
+            )
+        assert "expected number" in str(exc_info.value)
+
     def test_string_max_length_constraint(self, customer_entity: EntitySchema):
         with pytest.raises(InputValidationError) as exc_info:
             validate_create_input(
@@ -202,6 +217,7 @@ class TestValidateCreateInput:
                 {"title": "Fix bug", "status": "invalid"},
             )
         assert "not one of the allowed values" in str(exc_info.value)
+        assert "['open', 'closed', 'pending']" in str(exc_info.value)  # declared order
 
     def test_non_dict_input_rejected(self, customer_entity: EntitySchema):
         with pytest.raises(InputValidationError) as exc_info:
@@ -216,6 +232,21 @@ class TestValidateCreateInput:
         )
         assert result["score"] == 50
 
+    def test_error_count_capped_for_pathological_payload(self):
+        wide = EntitySchema(
+            name="Wide",
+            storage_engine=StorageEngine.SQL,
+            fields=[FieldSchema(name="id", field_type=FieldType.UUID, primary_key=True)]
+            + [FieldSchema(name=f"f{i}", field_type=FieldType.STRING, nullable=True) for i in range(100)],
+        )
+        payload = {f"f{i}": i for i in range(100)} | {f"bogus{i}": 1 for i in range(100)}
+        with pytest.raises(InputValidationError) as exc_info:
+            validate_create_input(wide, payload)
+        errors = exc_info.value.errors
+        assert len(errors) == 25
+        assert errors[0].startswith("Unknown fields")
+        assert errors[0].count("bogus") == 25
+
     def test_primary_key_in_input_allowed(self, customer_entity: EntitySchema):
         """Primary key in create input is allowed (may be user-supplied)."""
         result = validate_create_input(
@@ -290,6 +321,84 @@ class TestValidateUpdateInput:
         assert "JSON object" in str(exc_info.value)
 
 
+# ---------------------------------------------------------------------------
+# Validation plan caching
+# ---------------------------------------------------------------------------
+
+
+class TestValidationPlanCache:
+    """Tests for the per-entity flattened validation plan."""
+
+    def test_plan_reused_across_calls(self, customer_entity: EntitySchema):
+        validate_create_input(customer_entity, {"name": "Alice", "email": "a@b.c"})
+        plan = _plan_for(customer_entity)
+        validate_update_input(customer_entity, {"name": "Bob"})
+        assert _plan_for(customer_entity) is plan
+        assert plan.required == ("name", "email")
+        assert plan.primary_keys == ("id",)
+
+    def test_plan_flattens_constraints(self, customer_entity: EntitySchema):
+        plan = _plan_for(customer_entity)
+        assert plan.rules[plan.index["email"]] is None
+        assert plan.rules[plan.index["name"]].min_length == 1
+
+    def test_plan_precompiles_pattern(self):
+        entity = EntitySchema(
+            name="Coupon",
+            storage_engine=StorageEngine.SQL,
+            fields=[
+                FieldSchema(name="id", field_type=FieldType.UUID, primary_key=True),
+                FieldSchema(name="code", field_type=FieldType.STRING, constraints=FieldConstraint(pattern=r"[A-Z]{4}")),
+            ],
+        )
+        assert _plan_for(entity).rules[1].pattern.fullmatch("SAVE")
+        validate_create_input(entity, {"code": "SAVE"})
+        with pytest.raises(InputValidationError, match=r"does not match pattern '\[A-Z\]\{4\}'"):
+            validate_create_input(entity, {"code": "save"})
+
+    def test_cached_path_does_not_serialize_entity(self, customer_entity: EntitySchema, monkeypatch):
+        _plan_for(customer_entity)
+
+        def fail(*_args: Any, **_kwargs: Any) -> Any:
+            raise AssertionError("entity serialized on the cached validation path")
+
+        monkeypatch.setattr(EntitySchema, "model_dump_json", fail)
+        monkeypatch.setattr(EntitySchema, "model_dump", fail)
+        for _ in range(1000):
+            validate_create_input(customer_entity, {"name": "Alice", "email": "a@b.c"})
+            validate_update_input(customer_entity, {"name": "Bob"})
+
+    def test_plan_rebuilt_after_invalidation(self, customer_entity: EntitySchema):
+        plan = _plan_for(customer_entity)
+        customer_entity.fields.append(FieldSchema(name="nickname", field_type=FieldType.STRING))
+        assert _plan_for(customer_entity) is plan
+        invalidate_validation_plan(customer_entity)
+        rebuilt = _plan_for(customer_entity)
+        assert rebuilt is not plan
+        assert "nickname" in rebuilt.required
+        with pytest.raises(InputValidationError, match="nickname"):
+            validate_create_input(customer_entity, {"name": "Alice", "email": "a@b.c"})
+
+    def test_plan_built_with_schema(self, sample_asd: AgenticSchema):
+        from ninja_gql.schema import build_schema
+
+        build_schema(sample_asd)
+        assert all(id(entity) in _ENTITY_VALIDATION_META for entity in sample_asd.entities)
+
+    def test_plan_evicted_when_entity_collected(self):
+        entity = EntitySchema(
+            name="Temp",
+            storage_engine=StorageEngine.SQL,
+            fields=[FieldSchema(name="id", field_type=FieldType.UUID, primary_key=True)],
+        )
+        _plan_for(entity)
+        key = id(entity)
+        assert key in _ENTITY_VALIDATION_META
+        del entity
+        gc.collect()
+        assert key not in _ENTITY_VALIDATION_META
+
+
 # ---------------------------------------------------------------------------
 # Integration: validation in resolvers
 # ---------------------------------------------------------------------------
@@ -7,9 +7,32 @@ in-memory graph backend — no external dependencies required.
 
 from __future__ import annotations
 
+import asyncio
+import weakref
+from dataclasses import dataclass
 from typing import Any
 
-from ninja_graph.protocols import GraphBackend
+from ninja_graph.protocols import GraphBackend, iter_edges, iter_nodes
+
+
+@dataclass(frozen=True, slots=True)
+class _Partition:
+    """Community assignment plus its reverse index, shared by all readers."""
+
+    communities: dict[str, int]
+    members: dict[int, list[str]]
+
+    @classmethod
+    def from_communities(cls, communities: dict[str, int]) -> _Partition:
+        members: dict[int, list[str]] = {}
+        for nid, cid in communities.items():
+            members.setdefault(cid, []).append(nid)
+        return cls(communities=communities, members=members)
+
+
+# backend -> (backend version, max_iterations, partition).  Only backends
+# exposing a ``version()`` write counter are cached; others recompute.
+_PARTITIONS: weakref.WeakKeyDictionary[Any, tuple[int, int, _Partition]] = weakref.WeakKeyDictionary()
 
 
 async def detect_communities(backend: GraphBackend, max_iterations: int = 10) -> dict[str, int]:
@@ -19,6 +42,10 @@ async def detect_communities(backend: GraphBackend, max_iterations: int = 10) ->
     the community label most common among its neighbors. Iterates until stable
     or max_iterations reached.
 
+    Results are reused until the graph changes when the backend exposes a
+    ``version()`` counter that increases on every write (as
+    :class:`~ninja_graph.memory_backend.InMemoryGraphBackend` does).
+
     Args:
         backend: Graph backend to read from.
         max_iterations: Maximum number of label propagation rounds.
@@ -26,51 +53,92 @@ async def detect_communities(backend: GraphBackend, max_iterations: int = 10) ->
     Returns:
         Mapping of node_id -> community_id (int).
     """
-    nodes = await backend.get_all_nodes()
-    edges = await backend.get_all_edges()
-
-    if not nodes:
+    return dict((await _partition(backend, max_iterations)).communities)
+
+
+async def _partition(backend: GraphBackend, max_iterations: int) -> _Partition:
+    """Return the (shared, do-not-mutate) partition for *backend*, computing it if stale."""
+    version_of = getattr(backend, "version", None)
+    version = version_of() if callable(version_of) else None
+    if version is not None:
+        cached = _PARTITIONS.get(backend)
+        if cached is not None and cached[0] == version and cached[1] == max_iterations:
+            return cached[2]
+
+    # The version is read before the graph, so a write that lands while
+    # propagating leaves a stale entry that misses on the next call.
+    partition = _Partition.from_communities(await _propagate_labels(backend, max_iterations))
+    if version is not None:
+        _PARTITIONS[backend] = (version, max_iterations, partition)
+    return partition
+
+
+async def _propagate_labels(backend: GraphBackend, max_iterations: int) -> dict[str, int]:
+    """Run label propagation over the backend's current nodes and edges."""
+    # Index nodes once so propagation works on lists of ints rather than
+    # hashing node-ID strings for every neighbor visit.  Nodes and edges are
+    # streamed straight into the index and adjacency lists.
+    index: dict[str, int] = {}
+    async for node in iter_nodes(backend):
+        index.setdefault(node["id"], len(index))
+
+    if not index:
         return {}
+    node_ids = list(index)
 
-    # Build adjacency from edges
-    adjacency: dict[str, list[str]] = {}
-    for node in nodes:
-        adjacency[node["id"]] = []
-
-    for edge in edges:
-        src, tgt = edge["source"], edge["target"]
-        if src in adjacency:
-            adjacency[src].append(tgt)
-        if tgt in adjacency:
-            adjacency[tgt].append(src)
+    # Build adjacency from edges; edges to unknown nodes are ignored
+    adjacency: list[list[int]] = [[] for _ in node_ids]
+    async for edge in iter_edges(backend):
+        src, tgt = index.get(edge["source"]), index.get(edge["target"])
+        if src is None or tgt is None:
+            continue
+        adjacency[src].append(tgt)
+        adjacency[tgt].append(src)
 
     # Initialize: each node is its own community
-    node_ids = list(adjacency.keys())
-    community: dict[str, int] = {nid: i for i, nid in enumerate(node_ids)}
+    community = list(range(len(node_ids)))
+
+    # A node's choice depends only on its neighbors' labels, so it only needs
+    # re-evaluating after one of them changes; skipping the rest is exact.
+    dirty = [True] * len(node_ids)
+    counts = [0] * len(node_ids)
 
     for _ in range(max_iterations):
         changed = False
-        for nid in node_ids:
-            neighbors = adjacency[nid]
-            if not neighbors:
+        for i, neighbors in enumerate(adjacency):
+            if not dirty[i] or not neighbors:
                 continue
+            dirty[i] = False
 
-            # Count neighbor community labels
-            label_counts: dict[int, int] = {}
+            # Count neighbor labels in the scratch array (labels are node indices)
+            best_count = 0
+            for neighbor in neighbors:
+                lbl = community[neighbor]
+                count = counts[lbl] + 1
+                counts[lbl] = count
+                if count > best_count:
+                    best_count = count
+
+            # Pick the most common label (first seen wins ties), resetting the
+            # scratch counts on the way.  A label's first occurrence is always
+            # visited before its count is cleared.
+            best_label = -1
             for neighbor in neighbors:
                 lbl = community[neighbor]
-                label_counts[lbl] = label_counts.get(lbl, 0) + 1
+                if best_label < 0 and counts[lbl] == best_count:
+                    best_label = lbl
+                counts[lbl] = 0
 
-            # Pick the most common label
-            best_label = max(label_counts, key=lambda lbl: label_counts[lbl])
-            if community[nid] != best_label:
-                community[nid] = best_label
+            if community[i] != best_label:
+                community[i] = best_label
                 changed = True
+                for neighbor in neighbors:
+                    dirty[neighbor] = True
 
         if not changed:
             break
 
-    return community
+    return dict(zip(node_ids, community))
 
 
 async def get_community_members(backend: GraphBackend, entity_id: str) -> list[dict[str, Any]]:
@@ -83,18 +151,14 @@ async def get_community_members(backend: GraphBackend, entity_id: str) -> list[d
     Returns:
         List of node dicts in the same community.
     """
-    communities = await detect_communities(backend)
-    target_community = communities.get(entity_id)
+    partition = await _partition(backend, max_iterations=10)
+    target_community = partition.communities.get(entity_id)
     if target_community is None:
         return []
 
-    member_ids = [nid for nid, cid in communities.items() if cid == target_community]
-    members = []
-    for nid in member_ids:
-        node = await backend.get_node(nid)
-        if node:
-            members.append(node)
-    return members
+    member_ids = partition.members[target_community]
+    nodes = await asyncio.gather(*(backend.get_node(nid) for nid in member_ids))
+    return [node for node in nodes if node]
 
 
 async def get_community_summary(backend: GraphBackend) -> dict[int, list[str]]:
@@ -103,8 +167,5 @@ async def get_community_summary(backend: GraphBackend) -> dict[int, list[str]]:
     Returns:
         Mapping of community_id -> list of node IDs.
     """
-    communities = await detect_communities(backend)
-    summary: dict[int, list[str]] = {}
-    for nid, cid in communities.items():
-        summary.setdefault(cid, []).append(nid)
-    return summary
+    partition = await _partition(backend, max_iterations=10)
+    return {cid: list(member_ids) for cid, member_ids in partition.members.items()}
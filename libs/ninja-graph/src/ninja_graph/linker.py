@@ -6,9 +6,10 @@ above a configurable similarity threshold.
 
 from __future__ import annotations
 
-from typing import Protocol, runtime_checkable
+import asyncio
+from typing import Any, Protocol, runtime_checkable
 
-from ninja_graph.protocols import GraphBackend
+from ninja_graph.protocols import GraphBackend, bulk_create_edges
 
 
 @runtime_checkable
@@ -20,6 +21,18 @@ class VectorStore(Protocol):
         ...
 
 
+# Stores may also implement ``async def query_similar_batch(entity_ids, top_k)``
+# returning one ``query_similar`` result per ID, in order, from a single
+# round trip.  Without it the per-entity queries are issued concurrently.
+
+
+async def _query_all(vector_store: VectorStore, entity_ids: list[str], top_k: int) -> list[list[tuple[str, float]]]:
+    query_batch = getattr(vector_store, "query_similar_batch", None)
+    if query_batch is not None:
+        return await query_batch(entity_ids, top_k=top_k)
+    return await asyncio.gather(*(vector_store.query_similar(eid, top_k=top_k) for eid in entity_ids))
+
+
 async def link_similar_entities(
     backend: GraphBackend,
     vector_store: VectorStore,
@@ -30,6 +43,9 @@ async def link_similar_entities(
 ) -> int:
     """Create soft edges between entities with similarity above threshold.
 
+    All similarity queries are made before any edge is written, and the
+    edges are written with one bulk call when the backend supports it.
+
     Args:
         backend: Graph backend to write edges to.
         vector_store: Vector store to query for similarities.
@@ -41,27 +57,22 @@ async def link_similar_entities(
     Returns:
         Number of edges created.
     """
-    created: set[tuple[str, str]] = set()
-    count = 0
+    results = await _query_all(vector_store, entity_ids, top_k)
 
-    for entity_id in entity_ids:
-        similar_items = await vector_store.query_similar(entity_id, top_k=top_k)
+    created: set[tuple[str, str]] = set()
+    edges: list[tuple[str, str, dict[str, Any]]] = []
+    for entity_id, similar_items in zip(entity_ids, results):
         for other_id, score in similar_items:
             if other_id == entity_id:
                 continue
             if score < similarity_threshold:
                 continue
-            # Avoid duplicate edges
-            edge_key = (min(entity_id, other_id), max(entity_id, other_id))
+            # Avoid duplicate edges; one comparison orders the pair
+            edge_key = (entity_id, other_id) if entity_id < other_id else (other_id, entity_id)
             if edge_key in created:
                 continue
             created.add(edge_key)
-            await backend.create_edge(
-                source_id=entity_id,
-                target_id=other_id,
-                edge_type=edge_type,
-                properties={"similarity": score},
-            )
-            count += 1
-
-    return count
+            edges.append((entity_id, other_id, {"similarity": score}))
+
+    await bulk_create_edges(backend, edge_type, edges)
+    return len(edges)
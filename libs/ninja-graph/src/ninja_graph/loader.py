@@ -6,10 +6,15 @@ Uses the GraphBackend protocol so it works with both the in-memory backend
 
 from __future__ import annotations
 
+import asyncio
+from itertools import batched
 from typing import Any
 
 from ninja_graph.mapper import GraphSchema
-from ninja_graph.protocols import GraphBackend
+from ninja_graph.protocols import GraphBackend, bulk_create_edges, bulk_create_nodes
+
+# Records written per bulk backend call.
+_BATCH_SIZE = 1000
 
 
 async def load_nodes(
@@ -20,6 +25,9 @@ async def load_nodes(
 ) -> int:
     """Bulk-create nodes from a list of records.
 
+    Nodes are written in batches of up to 1000 per backend call (see
+    :func:`~ninja_graph.protocols.bulk_create_nodes`).
+
     Args:
         backend: Graph backend to write to.
         label: Node label for all records.
@@ -29,14 +37,18 @@ async def load_nodes(
     Returns:
         Number of nodes created.
     """
-    count = 0
+    rows: list[tuple[str, dict[str, Any]]] = []
     for record in records:
-        node_id = str(record.get(id_field, ""))
+        node_id = record.get(id_field, "")
+        if type(node_id) is not str:
+            node_id = str(node_id)
         if not node_id:
             continue
-        await backend.create_node(label=label, node_id=node_id, properties=record)
-        count += 1
-    return count
+        rows.append((node_id, record))
+
+    for batch in batched(rows, _BATCH_SIZE):
+        await bulk_create_nodes(backend, label, list(batch))
+    return len(rows)
 
 
 async def load_edges(
@@ -48,6 +60,9 @@ async def load_edges(
 ) -> int:
     """Bulk-create edges from a list of records containing source/target pairs.
 
+    Edges are written in batches of up to 1000 per backend call (see
+    :func:`~ninja_graph.protocols.bulk_create_edges`).
+
     Args:
         backend: Graph backend to write to.
         records: Dicts containing at least source and target ID fields.
@@ -58,16 +73,24 @@ async def load_edges(
     Returns:
         Number of edges created.
     """
-    count = 0
+    rows: list[tuple[str, str, dict[str, Any]]] = []
     for record in records:
-        source_id = str(record.get(source_id_field, ""))
-        target_id = str(record.get(target_id_field, ""))
+        source_id = record.get(source_id_field, "")
+        if type(source_id) is not str:
+            source_id = str(source_id)
+        target_id = record.get(target_id_field, "")
+        if type(target_id) is not str:
+            target_id = str(target_id)
         if not source_id or not target_id:
             continue
-        props = {k: v for k, v in record.items() if k not in (source_id_field, target_id_field)}
-        await backend.create_edge(source_id=source_id, target_id=target_id, edge_type=edge_type, properties=props)
-        count += 1
-    return count
+        props = record.copy()
+        props.pop(source_id_field, None)
+        props.pop(target_id_field, None)
+        rows.append((source_id, target_id, props))
+
+    for batch in batched(rows, _BATCH_SIZE):
+        await bulk_create_edges(backend, edge_type, list(batch))
+    return len(rows)
 
 
 async def load_from_schema(
@@ -78,6 +101,9 @@ async def load_from_schema(
 ) -> dict[str, int]:
     """Load a full graph from an ASD-derived schema and entity data.
 
+    Node labels (and then edge types) are loaded concurrently, so the
+    backend must accept concurrent writes.
+
     Args:
         backend: Graph backend to write to.
         schema: GraphSchema from map_asd_to_graph_schema().
@@ -88,18 +114,28 @@ async def load_from_schema(
     Returns:
         Dict with counts: {"nodes": N, "edges": M}.
     """
-    total_nodes = 0
-    for node_label in schema.node_labels:
-        records = entity_data.get(node_label.name, [])
-        id_field = node_label.primary_key or "id"
-        total_nodes += await load_nodes(backend, node_label.name, records, id_field)
-
-    total_edges = 0
+    # Labels are loaded concurrently, then edge types, so every node exists
+    # before the first edge that references it is written.
+    node_counts = await asyncio.gather(
+        *(
+            load_nodes(backend, node_label.name, entity_data.get(node_label.name, []), node_label.primary_key or "id")
+            for node_label in schema.node_labels
+        )
+    )
+
+    edge_counts: list[int] = []
     if relationship_data:
-        for edge_type in schema.edge_types:
-            records = relationship_data.get(edge_type.name, [])
-            total_edges += await load_edges(
-                backend, records, source_id_field="source", target_id_field="target", edge_type=edge_type.name
+        edge_counts = await asyncio.gather(
+            *(
+                load_edges(
+                    backend,
+                    relationship_data.get(edge_type.name, []),
+                    source_id_field="source",
+                    target_id_field="target",
+                    edge_type=edge_type.name,
+                )
+                for edge_type in schema.edge_types
             )
+        )
 
-    return {"nodes": total_nodes, "edges": total_edges}
+    return {"nodes": sum(node_counts), "edges": sum(edge_counts)}
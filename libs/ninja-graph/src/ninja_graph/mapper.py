@@ -6,7 +6,7 @@ into a graph schema with node labels, edge types, and property mappings.
 
 from __future__ import annotations
 
-from ninja_core.schema.entity import EntitySchema, FieldSchema
+from ninja_core.schema.entity import EntitySchema
 from ninja_core.schema.project import AgenticSchema
 from ninja_core.schema.relationship import RelationshipSchema
 from pydantic import BaseModel, Field
@@ -19,6 +19,8 @@ class NodeLabel(BaseModel):
     properties: list[str] = Field(default_factory=list, description="Property names from entity fields.")
     primary_key: str | None = Field(default=None, description="Primary key field name.")
 
+    model_config = {"extra": "forbid", "frozen": True}
+
 
 class EdgeType(BaseModel):
     """An edge type derived from an ASD relationship."""
@@ -28,6 +30,8 @@ class EdgeType(BaseModel):
     target_label: str = Field(description="Target node label.")
     properties: list[str] = Field(default_factory=list, description="Edge property names.")
 
+    model_config = {"extra": "forbid", "frozen": True}
+
 
 class GraphSchema(BaseModel):
     """Complete graph schema derived from an ASD."""
@@ -35,17 +39,14 @@ class GraphSchema(BaseModel):
     node_labels: list[NodeLabel] = Field(default_factory=list)
     edge_types: list[EdgeType] = Field(default_factory=list)
 
+    model_config = {"extra": "forbid", "frozen": True}
+
 
 def _extract_node_label(entity: EntitySchema) -> NodeLabel:
     """Convert an entity to a node label definition."""
-    pk: str | None = None
-    props: list[str] = []
-    field: FieldSchema
-    for field in entity.fields:
-        props.append(field.name)
-        if field.primary_key:
-            pk = field.name
-    return NodeLabel(name=entity.name, properties=props, primary_key=pk)
+    props = [f.name for f in entity.fields]
+    pk = next((f.name for f in entity.fields if f.primary_key), None)
+    return NodeLabel.model_construct(name=entity.name, properties=props, primary_key=pk)
 
 
 def _extract_edge_type(rel: RelationshipSchema) -> EdgeType:
@@ -56,14 +57,18 @@ def _extract_edge_type(rel: RelationshipSchema) -> EdgeType:
         props.append(rel.source_field)
     if rel.target_field:
         props.append(rel.target_field)
-    return EdgeType(name=label, source_label=rel.source_entity, target_label=rel.target_entity, properties=props)
+    return EdgeType.model_construct(
+        name=label, source_label=rel.source_entity, target_label=rel.target_entity, properties=props
+    )
 
 
 def map_asd_to_graph_schema(asd: AgenticSchema) -> GraphSchema:
     """Map an Agentic Schema Definition to a graph schema.
 
     All entities become node labels. All relationships become edge types.
+    The ASD has already been validated, so the graph models are built with
+    ``model_construct`` instead of being validated a second time.
     """
     node_labels = [_extract_node_label(e) for e in asd.entities]
     edge_types = [_extract_edge_type(r) for r in asd.relationships]
-    return GraphSchema(node_labels=node_labels, edge_types=edge_types)
+    return GraphSchema.model_construct(node_labels=node_labels, edge_types=edge_types)
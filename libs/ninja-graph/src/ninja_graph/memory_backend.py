@@ -2,46 +2,98 @@
 
 from __future__ import annotations
 
-from collections import deque
+import sys
+from collections.abc import AsyncIterator, Iterator, Mapping
+from types import MappingProxyType
 from typing import Any
 
+# Shared, read-only properties for edges created without any.
+_EMPTY_PROPS: Mapping[str, Any] = MappingProxyType({})
+
 
 class InMemoryGraphBackend:
     """Dict-based adjacency list that mirrors the GraphBackend protocol."""
 
     def __init__(self) -> None:
         self._nodes: dict[str, dict[str, Any]] = {}
-        # edges stored as: source_id -> list of (target_id, edge_type, properties)
-        self._edges: dict[str, list[tuple[str, str, dict[str, Any]]]] = {}
+        # neighbor ids per node in both directions, keyed by edge_type (``None`` holds every type)
+        self._edges_by_type: dict[str, dict[str | None, list[str]]] = {}
+        # each distinct (endpoint pair, edge_type) once, in creation order, for export
+        self._edge_list: list[tuple[str, str, str, Mapping[str, Any]]] = []
+        self._edge_keys: set[tuple[str, str, str]] = set()
+        self._version = 0
+
+    def version(self) -> int:
+        """Return a counter that increases on every write, for caching derived results."""
+        return self._version
+
+    # Labels and edge types repeat across many nodes/edges, so they are interned
+    # once on write; node IDs are mostly unique and are stored as given.
 
     async def create_node(self, label: str, node_id: str, properties: dict[str, Any]) -> None:
-        self._nodes[node_id] = {"id": node_id, "label": label, **properties}
+        self._nodes[node_id] = {"id": node_id, "label": sys.intern(label), **properties}
+        self._version += 1
+
+    async def create_nodes(self, label: str, nodes: list[tuple[str, dict[str, Any]]]) -> None:
+        label = sys.intern(label)
+        for node_id, properties in nodes:
+            self._nodes[node_id] = {"id": node_id, "label": label, **properties}
+        self._version += 1
 
     async def create_edge(
         self, source_id: str, target_id: str, edge_type: str, properties: dict[str, Any] | None = None
     ) -> None:
-        self._edges.setdefault(source_id, []).append((target_id, edge_type, properties or {}))
-        # Bidirectional for traversal
-        self._edges.setdefault(target_id, []).append((source_id, edge_type, properties or {}))
+        self._add_edge(source_id, target_id, sys.intern(edge_type), properties or _EMPTY_PROPS)
+        self._version += 1
+
+    async def create_edges(self, edge_type: str, edges: list[tuple[str, str, dict[str, Any]]]) -> None:
+        edge_type = sys.intern(edge_type)
+        for source_id, target_id, properties in edges:
+            self._add_edge(source_id, target_id, edge_type, properties or _EMPTY_PROPS)
+        self._version += 1
+
+    def _add_edge(self, source_id: str, target_id: str, edge_type: str, props: Mapping[str, Any]) -> None:
+        # Bidirectional for traversal; properties are kept once, in _edge_list.
+        by_type = self._edges_by_type
+        for node_id, other_id in ((source_id, target_id), (target_id, source_id)):
+            typed = by_type.get(node_id)
+            if typed is None:
+                typed = by_type[node_id] = {}
+            for key in (edge_type, None):
+                neighbors = typed.get(key)
+                if neighbors is None:
+                    neighbors = typed[key] = []
+                neighbors.append(other_id)
+
+        key = (source_id, target_id, edge_type) if source_id <= target_id else (target_id, source_id, edge_type)
+        if key not in self._edge_keys:
+            self._edge_keys.add(key)
+            self._edge_list.append((source_id, target_id, edge_type, props))
 
     async def get_node(self, node_id: str) -> dict[str, Any] | None:
         return self._nodes.get(node_id)
 
     async def get_neighbors(self, node_id: str, edge_type: str | None = None, depth: int = 1) -> list[dict[str, Any]]:
+        by_type = self._edges_by_type
+        nodes = self._nodes
         visited: set[str] = {node_id}
-        current_layer: set[str] = {node_id}
+        # ``visited`` already rules out duplicates, so the frontiers can be plain lists.
+        current_layer: list[str] = [node_id]
         results: list[dict[str, Any]] = []
 
         for _ in range(depth):
-            next_layer: set[str] = set()
+            next_layer: list[str] = []
             for nid in current_layer:
-                for target_id, etype, _ in self._edges.get(nid, []):
-                    if target_id not in visited and (edge_type is None or etype == edge_type):
+                # the per-type index makes a filtered scan cost O(matches), not O(degree)
+                for target_id in by_type.get(nid, {}).get(edge_type, ()):
+                    if target_id not in visited:
                         visited.add(target_id)
-                        next_layer.add(target_id)
-                        node = self._nodes.get(target_id)
+                        next_layer.append(target_id)
+                        node = nodes.get(target_id)
                         if node:
                             results.append(node)
+            if not next_layer:
+                break
             current_layer = next_layer
 
         return results
@@ -52,45 +104,80 @@ class InMemoryGraphBackend:
         if start_id == end_id:
             return [start_id]
 
-        queue: deque[list[str]] = deque([[start_id]])
-        visited: set[str] = {start_id}
-
-        while queue:
-            path = queue.popleft()
-            if len(path) > max_depth + 1:
-                return None
-
-            current = path[-1]
-            for target_id, _, _ in self._edges.get(current, []):
-                if target_id == end_id:
-                    return path + [target_id]
-                if target_id not in visited:
-                    visited.add(target_id)
-                    queue.append(path + [target_id])
+        # Bidirectional BFS: grow whichever frontier is smaller by one full layer
+        # until the two searches meet. Edges are stored in both directions, so
+        # the backward search walks the same adjacency. A path may have at most
+        # ``max_depth + 1`` edges.
+        fwd_parents: dict[str, str | None] = {start_id: None}
+        bwd_parents: dict[str, str | None] = {end_id: None}
+        fwd_frontier = [start_id]
+        bwd_frontier = [end_id]
+        hops = 0
+
+        while fwd_frontier and bwd_frontier and hops <= max_depth:
+            if len(fwd_frontier) <= len(bwd_frontier):
+                fwd_frontier, meet = self._expand_layer(fwd_frontier, fwd_parents, bwd_parents)
+            else:
+                bwd_frontier, meet = self._expand_layer(bwd_frontier, bwd_parents, fwd_parents)
+            if meet is not None:
+                path: list[str] = []
+                node: str | None = meet
+                while node is not None:
+                    path.append(node)
+                    node = fwd_parents[node]
+                path.reverse()
+                node = bwd_parents[meet]
+                while node is not None:
+                    path.append(node)
+                    node = bwd_parents[node]
+                return path
+            hops += 1
 
         return None
 
+    def _expand_layer(
+        self, frontier: list[str], parents: dict[str, str | None], other: dict[str, str | None]
+    ) -> tuple[list[str], str | None]:
+        """Advance one BFS layer; return the next frontier and the node where it met *other*, if any."""
+        by_type = self._edges_by_type
+        next_frontier: list[str] = []
+        for current in frontier:
+            for target_id in by_type.get(current, {}).get(None, ()):
+                if target_id in parents:
+                    continue
+                parents[target_id] = current
+                if target_id in other:
+                    return next_frontier, target_id
+                next_frontier.append(target_id)
+        return next_frontier, None
+
     async def get_all_nodes(self) -> list[dict[str, Any]]:
         return list(self._nodes.values())
 
     async def get_all_edges(self) -> list[dict[str, Any]]:
-        seen: set[tuple[str, str, str]] = set()
-        edges: list[dict[str, Any]] = []
-        for source_id, edge_list in self._edges.items():
-            for target_id, edge_type, props in edge_list:
-                key = (min(source_id, target_id), max(source_id, target_id), edge_type)
-                if key not in seen:
-                    seen.add(key)
-                    edges.append(
-                        {
-                            "source": source_id,
-                            "target": target_id,
-                            "type": edge_type,
-                            **props,
-                        }
-                    )
-        return edges
+        return list(self._unique_edges())
+
+    async def iter_nodes(self) -> AsyncIterator[dict[str, Any]]:
+        for node in list(self._nodes.values()):
+            yield node
+
+    async def iter_edges(self) -> AsyncIterator[dict[str, Any]]:
+        for edge in self._unique_edges():
+            yield edge
+
+    def _unique_edges(self) -> Iterator[dict[str, Any]]:
+        # Adjacency holds each edge under both endpoints; _edge_list holds it once.
+        for source_id, target_id, edge_type, props in list(self._edge_list):
+            yield {
+                "source": source_id,
+                "target": target_id,
+                "type": edge_type,
+                **props,
+            }
 
     async def clear(self) -> None:
         self._nodes.clear()
-        self._edges.clear()
+        self._edges_by_type.clear()
+        self._edge_list.clear()
+        self._edge_keys.clear()
+        self._version += 1
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from typing import Any, Protocol, runtime_checkable
 
 
@@ -11,6 +12,8 @@ class GraphBackend(Protocol):
 
     Implementations must support async node/edge CRUD and traversal queries.
     The in-memory backend is used for testing; the Neo4j backend for production.
+    Writes may be issued concurrently (e.g. by :func:`~ninja_graph.loader.load_from_schema`),
+    so implementations must be safe to call from several tasks at once.
     """
 
     async def create_node(self, label: str, node_id: str, properties: dict[str, Any]) -> None: ...
@@ -34,3 +37,73 @@ class GraphBackend(Protocol):
     async def get_all_edges(self) -> list[dict[str, Any]]: ...
 
     async def clear(self) -> None: ...
+
+
+# ---------------------------------------------------------------------------
+# Optional bulk writes
+# ---------------------------------------------------------------------------
+# Backends may additionally implement
+#
+#     async def create_nodes(self, label: str, nodes: list[tuple[str, dict[str, Any]]]) -> None
+#     async def create_edges(self, edge_type: str, edges: list[tuple[str, str, dict[str, Any]]]) -> None
+#
+# to write many nodes or edges in one round trip (for Neo4j, a single
+# ``UNWIND`` statement; the label or edge type is fixed per call because
+# Cypher cannot parameterize them).  Callers go through the helpers below,
+# which fall back to one ``create_node`` / ``create_edge`` call per item.
+
+
+async def bulk_create_nodes(backend: GraphBackend, label: str, nodes: list[tuple[str, dict[str, Any]]]) -> None:
+    """Create *nodes* as ``(node_id, properties)`` pairs with label *label*."""
+    if not nodes:
+        return
+    create_nodes = getattr(backend, "create_nodes", None)
+    if create_nodes is not None:
+        await create_nodes(label, nodes)
+        return
+    for node_id, properties in nodes:
+        await backend.create_node(label=label, node_id=node_id, properties=properties)
+
+
+async def bulk_create_edges(
+    backend: GraphBackend, edge_type: str, edges: list[tuple[str, str, dict[str, Any]]]
+) -> None:
+    """Create *edges* as ``(source_id, target_id, properties)`` triples of type *edge_type*."""
+    if not edges:
+        return
+    create_edges = getattr(backend, "create_edges", None)
+    if create_edges is not None:
+        await create_edges(edge_type, edges)
+        return
+    for source_id, target_id, properties in edges:
+        await backend.create_edge(source_id=source_id, target_id=target_id, edge_type=edge_type, properties=properties)
+
+
+# ---------------------------------------------------------------------------
+# Optional streaming reads
+# ---------------------------------------------------------------------------
+# Backends may implement ``iter_nodes()`` / ``iter_edges()`` async iterators
+# yielding the same dicts as ``get_all_nodes()`` / ``get_all_edges()``, so
+# whole-graph algorithms need not hold the full result lists in memory.
+
+
+async def iter_nodes(backend: GraphBackend) -> AsyncIterator[dict[str, Any]]:
+    """Yield every node, streaming when the backend supports it."""
+    stream = getattr(backend, "iter_nodes", None)
+    if stream is not None:
+        async for node in stream():
+            yield node
+    else:
+        for node in await backend.get_all_nodes():
+            yield node
+
+
+async def iter_edges(backend: GraphBackend) -> AsyncIterator[dict[str, Any]]:
+    """Yield every edge, streaming when the backend supports it."""
+    stream = getattr(backend, "iter_edges", None)
+    if stream is not None:
+        async for edge in stream():
+            yield edge
+    else:
+        for edge in await backend.get_all_edges():
+            yield edge
@@ -88,3 +88,72 @@ async def test_get_community_summary(backend: InMemoryGraphBackend):
     # Should have at least 2 communities (a+b together, c alone)
     total_members = sum(len(members) for members in summary.values())
     assert total_members == 3
+
+
+async def test_detect_communities_ignores_edges_to_unknown_nodes(backend: InMemoryGraphBackend):
+    await backend.create_node("X", "a", {})
+    await backend.create_node("X", "b", {})
+    await backend.create_edge("a", "b", "LINK")
+    await backend.create_edge("a", "ghost", "LINK")
+
+    result = await detect_communities(backend)
+    assert result.keys() == {"a", "b"}
+    assert result["a"] == result["b"]
+
+
+async def test_detect_communities_reused_until_graph_changes(backend: InMemoryGraphBackend, monkeypatch):
+    await backend.create_node("X", "a", {})
+    await backend.create_node("X", "b", {})
+    await backend.create_edge("a", "b", "LINK")
+
+    reads = 0
+    iter_nodes = backend.iter_nodes
+
+    def counting_iter_nodes():
+        nonlocal reads
+        reads += 1
+        return iter_nodes()
+
+    monkeypatch.setattr(backend, "iter_nodes", counting_iter_nodes)
+
+    first = await detect_communities(backend)
+    await get_community_summary(backend)
+    await get_community_members(backend, "a")
+    assert reads == 1
+
+    first["a"] = -1  # callers get their own copy
+    assert (await detect_communities(backend))["a"] != -1
+
+    await backend.create_node("Y", "c", {})
+    result = await detect_communities(backend)
+    assert reads == 2
+    assert result["c"] not in (result["a"], result["b"])
+
+
+class _ListOnlyBackend(InMemoryGraphBackend):
+    """Backend without streaming reads, to exercise the list fallback."""
+
+    iter_nodes = None
+    iter_edges = None
+
+
+async def test_detect_communities_without_streaming_reads():
+    backend = _ListOnlyBackend()
+    for nid in ("a", "b", "c"):
+        await backend.create_node("X", nid, {})
+    await backend.create_edge("a", "b", "LINK")
+
+    result = await detect_communities(backend)
+    assert result["a"] == result["b"] != result["c"]
+
+
+async def test_get_community_summary_groups_in_node_order(backend: InMemoryGraphBackend):
+    for nid in ("a", "b", "c", "d"):
+        await backend.create_node("X", nid, {})
+    await backend.create_edge("a", "c", "LINK")
+
+    summary = await get_community_summary(backend)
+    assert list(summary.values()) == [["a", "c"], ["b"], ["d"]]
+
+    summary[next(iter(summary))].append("zzz")  # callers get their own lists
+    assert [m["id"] for m in await get_community_members(backend, "a")] == ["a", "c"]
@@ -3,13 +3,17 @@
 from __future__ import annotations
 
 import pytest
+import pytest_asyncio
 from ninja_graph.memory_backend import InMemoryGraphBackend
 from ninja_graph.tools import find_related, get_community, traverse_path
 
+# The tools only read the graph, so one backend is built per module and shared.
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
-@pytest.fixture
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
 async def populated_backend() -> InMemoryGraphBackend:
-    """Backend with a small social graph for tool testing."""
+    """Backend with a small social graph for tool testing (shared; do not mutate)."""
     b = InMemoryGraphBackend()
     await b.create_node("User", "alice", {"name": "Alice"})
     await b.create_node("User", "bob", {"name": "Bob"})
@@ -56,9 +60,9 @@ async def test_find_related_with_edge_filter(populated_backend: InMemoryGraphBac
     assert "post1" not in ids
 
 
-async def test_find_related_no_neighbors(populated_backend: InMemoryGraphBackend):
-    await populated_backend.create_node("Tag", "orphan", {"name": "lonely"})
-    result = await find_related(populated_backend, "orphan", depth=3)
+async def test_find_related_no_neighbors(backend: InMemoryGraphBackend):
+    await backend.create_node("Tag", "orphan", {"name": "lonely"})
+    result = await find_related(backend, "orphan", depth=3)
     assert result == []
 
 
@@ -78,9 +82,10 @@ async def test_traverse_path_multi_hop(populated_backend: InMemoryGraphBackend):
     assert result["length"] >= 1
 
 
-async def test_traverse_path_not_found(populated_backend: InMemoryGraphBackend):
-    await populated_backend.create_node("Tag", "orphan", {})
-    result = await traverse_path(populated_backend, "alice", "orphan")
+async def test_traverse_path_not_found(backend: InMemoryGraphBackend):
+    await backend.create_node("User", "alice", {"name": "Alice"})
+    await backend.create_node("Tag", "orphan", {})
+    result = await traverse_path(backend, "alice", "orphan")
 
     assert result["path"] is None
     assert result["length"] == 0
@@ -115,3 +115,40 @@ async def test_link_top_k_limit(backend: InMemoryGraphBackend):
 
     count = await link_similar_entities(backend, store, entity_ids=["d0"], similarity_threshold=0.5, top_k=2)
     assert count == 2
+
+
+class BatchVectorStore(MockVectorStore):
+    """Mock store that answers all entities in one call."""
+
+    def __init__(self, similarities: dict[str, list[tuple[str, float]]]) -> None:
+        super().__init__(similarities)
+        self.batch_calls = 0
+
+    async def query_similar(self, entity_id: str, top_k: int = 10) -> list[tuple[str, float]]:
+        raise AssertionError("single queries should not be used when a batch query exists")
+
+    async def query_similar_batch(self, entity_ids: list[str], top_k: int = 10) -> list[list[tuple[str, float]]]:
+        self.batch_calls += 1
+        return [self._similarities.get(eid, [])[:top_k] for eid in entity_ids]
+
+
+async def test_link_uses_batch_query_and_bulk_edge_write(backend: InMemoryGraphBackend, monkeypatch):
+    for i in range(3):
+        await backend.create_node("Doc", f"d{i}", {})
+    store = BatchVectorStore({"d0": [("d1", 0.9), ("d2", 0.85)], "d1": [("d0", 0.9)]})
+
+    writes: list[int] = []
+    create_edges = backend.create_edges
+
+    async def recording_create_edges(edge_type, edges):
+        writes.append(len(edges))
+        await create_edges(edge_type, edges)
+
+    monkeypatch.setattr(backend, "create_edges", recording_create_edges)
+
+    count = await link_similar_entities(backend, store, entity_ids=["d0", "d1", "d2"], similarity_threshold=0.5)
+
+    assert count == 2
+    assert store.batch_calls == 1
+    assert writes == [2]
+    assert {e["similarity"] for e in await backend.get_all_edges()} == {0.9, 0.85}
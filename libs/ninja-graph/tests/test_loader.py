@@ -104,3 +104,54 @@ async def test_load_from_schema_empty_data(backend: InMemoryGraphBackend, sample
 
     assert result["nodes"] == 0
     assert result["edges"] == 0
+
+
+async def test_load_nodes_writes_in_batches(backend: InMemoryGraphBackend, monkeypatch):
+    batch_sizes: list[int] = []
+    create_nodes = backend.create_nodes
+
+    async def recording_create_nodes(label, nodes):
+        batch_sizes.append(len(nodes))
+        await create_nodes(label, nodes)
+
+    monkeypatch.setattr(backend, "create_nodes", recording_create_nodes)
+
+    count = await load_nodes(backend, "User", [{"id": f"u{i}"} for i in range(2500)])
+
+    assert count == 2500
+    assert batch_sizes == [1000, 1000, 500]
+    assert len(await backend.get_all_nodes()) == 2500
+
+
+class _SingleWriteBackend:
+    """Backend without bulk methods; records the per-item calls."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple] = []
+
+    async def create_node(self, label, node_id, properties):
+        self.calls.append(("node", label, node_id))
+
+    async def create_edge(self, source_id, target_id, edge_type, properties=None):
+        self.calls.append(("edge", source_id, target_id, edge_type, properties))
+
+
+async def test_loaders_fall_back_to_single_writes():
+    backend = _SingleWriteBackend()
+
+    await load_nodes(backend, "User", [{"id": "u1"}, {"id": "u2"}])
+    await load_edges(backend, [{"from": "u1", "to": "u2", "w": 1}], "from", "to", "KNOWS")
+
+    assert backend.calls == [
+        ("node", "User", "u1"),
+        ("node", "User", "u2"),
+        ("edge", "u1", "u2", "KNOWS", {"w": 1}),
+    ]
+
+
+async def test_load_nodes_stringifies_non_string_ids(backend: InMemoryGraphBackend):
+    count = await load_nodes(backend, "Item", [{"id": 7}, {"id": "8"}])
+
+    assert count == 2
+    assert await backend.get_node("7") is not None
+    assert await backend.get_node("8") is not None
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import pytest
 from ninja_core.schema.entity import EntitySchema, FieldSchema, FieldType, StorageEngine
 from ninja_core.schema.project import AgenticSchema
 from ninja_graph.mapper import GraphSchema, map_asd_to_graph_schema
+from pydantic import ValidationError
 
 
 def test_map_entities_to_node_labels(sample_asd: AgenticSchema):
@@ -89,3 +91,11 @@ def test_graph_schema_serialization(sample_asd: AgenticSchema):
     restored = GraphSchema.model_validate(data)
     assert len(restored.node_labels) == len(schema.node_labels)
     assert len(restored.edge_types) == len(schema.edge_types)
+
+
+def test_graph_schema_matches_validated_copy_and_is_frozen(sample_asd: AgenticSchema):
+    schema = map_asd_to_graph_schema(sample_asd)
+
+    assert GraphSchema.model_validate(schema.model_dump()) == schema
+    with pytest.raises(ValidationError):
+        schema.node_labels[0].name = "Renamed"
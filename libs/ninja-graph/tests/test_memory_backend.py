@@ -50,6 +50,17 @@ async def test_get_neighbors_with_edge_type_filter(backend: InMemoryGraphBackend
     assert follows[0]["id"] == "u2"
 
 
+async def test_get_neighbors_edge_type_filter_applies_at_every_hop(backend: InMemoryGraphBackend):
+    for nid in ("a", "b", "c", "d"):
+        await backend.create_node("N", nid, {})
+    await backend.create_edge("a", "b", "LINK")
+    await backend.create_edge("b", "c", "LINK")
+    await backend.create_edge("b", "d", "OTHER")
+
+    neighbors = await backend.get_neighbors("a", edge_type="LINK", depth=3)
+    assert [n["id"] for n in neighbors] == ["b", "c"]
+
+
 async def test_get_neighbors_multi_hop(backend: InMemoryGraphBackend):
     await backend.create_node("A", "a", {})
     await backend.create_node("B", "b", {})
@@ -68,6 +79,16 @@ async def test_get_neighbors_multi_hop(backend: InMemoryGraphBackend):
     assert ids == {"b", "c"}
 
 
+async def test_get_neighbors_returns_nodes_hop_by_hop(backend: InMemoryGraphBackend):
+    for nid in ("a", "b", "c", "d", "e"):
+        await backend.create_node("N", nid, {})
+    for src, dst in (("a", "b"), ("a", "c"), ("b", "d"), ("c", "d"), ("d", "e")):
+        await backend.create_edge(src, dst, "LINK")
+
+    neighbors = await backend.get_neighbors("a", depth=10)
+    assert [n["id"] for n in neighbors] == ["b", "c", "d", "e"]
+
+
 async def test_find_path_direct(backend: InMemoryGraphBackend):
     await backend.create_node("A", "a", {})
     await backend.create_node("B", "b", {})
@@ -107,6 +128,16 @@ async def test_find_path_nonexistent_node(backend: InMemoryGraphBackend):
     assert await backend.find_path("x", "y") is None
 
 
+async def test_find_path_respects_max_depth(backend: InMemoryGraphBackend):
+    for nid in "abcde":
+        await backend.create_node("N", nid, {})
+    for src, dst in zip("abcd", "bcde"):
+        await backend.create_edge(src, dst, "LINK")
+
+    assert await backend.find_path("a", "e", max_depth=3) == ["a", "b", "c", "d", "e"]
+    assert await backend.find_path("a", "e", max_depth=2) is None
+
+
 async def test_get_all_nodes(backend: InMemoryGraphBackend):
     await backend.create_node("A", "a", {})
     await backend.create_node("B", "b", {})
@@ -136,6 +167,18 @@ async def test_get_all_edges_no_duplicates(backend: InMemoryGraphBackend):
     assert len(edges) == 1
 
 
+async def test_get_all_edges_collapses_repeated_edges(backend: InMemoryGraphBackend):
+    await backend.create_edge("a", "b", "LINK", {"w": 1})
+    await backend.create_edge("b", "a", "LINK", {"w": 2})
+    await backend.create_edge("a", "b", "OTHER")
+
+    edges = await backend.get_all_edges()
+    assert edges == [
+        {"source": "a", "target": "b", "type": "LINK", "w": 1},
+        {"source": "a", "target": "b", "type": "OTHER"},
+    ]
+
+
 async def test_clear(backend: InMemoryGraphBackend):
     await backend.create_node("A", "a", {})
     await backend.create_edge("a", "a", "SELF")
@@ -143,3 +186,28 @@ async def test_clear(backend: InMemoryGraphBackend):
 
     assert await backend.get_all_nodes() == []
     assert await backend.get_all_edges() == []
+
+
+async def test_version_increases_on_writes(backend: InMemoryGraphBackend):
+    start = backend.version()
+    await backend.create_node("User", "u1", {})
+    await backend.create_edge("u1", "u1", "SELF")
+    await backend.get_node("u1")
+    assert backend.version() == start + 2
+
+    await backend.clear()
+    assert backend.version() == start + 3
+
+
+async def test_create_edges_matches_create_edge(backend: InMemoryGraphBackend):
+    single = InMemoryGraphBackend()
+    for b in (backend, single):
+        for nid in ("u1", "p1", "p2"):
+            await b.create_node("X", nid, {})
+
+    await backend.create_edges("LINK", [("u1", "p1", {"w": 1}), ("u1", "p2", {})])
+    await single.create_edge("u1", "p1", "LINK", {"w": 1})
+    await single.create_edge("u1", "p2", "LINK")
+
+    assert await backend.get_all_edges() == await single.get_all_edges()
+    assert await backend.get_neighbors("p2") == await single.get_neighbors("p2")
@@ -1,5 +1,6 @@
 """ninja-introspect — Polyglot database introspection engine for Ninja Stack."""
 
+from ninja_introspect.cache import IntrospectionCache
 from ninja_introspect.engine import IntrospectionEngine
 from ninja_introspect.providers.base import IntrospectionProvider, IntrospectionResult
 from ninja_introspect.providers.graph import GraphProvider
@@ -9,6 +10,7 @@ from ninja_introspect.providers.vector import VectorProvider
 
 __all__ = [
     "GraphProvider",
+    "IntrospectionCache",
     "IntrospectionEngine",
     "IntrospectionProvider",
     "IntrospectionResult",
@@ -0,0 +1,43 @@
+"""In-memory cache of introspection results keyed by schema version."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+
+from ninja_introspect.providers.base import IntrospectionResult
+
+DEFAULT_MAX_ENTRIES = 128
+
+
+class IntrospectionCache:
+    """Least-recently-used map of ``(connection_string, schema_version)`` -> result.
+
+    Used by :class:`~ninja_introspect.engine.IntrospectionEngine` to skip
+    re-introspecting sources whose provider reports an unchanged
+    :meth:`~ninja_introspect.providers.base.IntrospectionProvider.schema_version`.
+    Cached results are shared between runs and must not be mutated.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], IntrospectionResult] = OrderedDict()
+
+    def get(self, connection_string: str, version: str) -> IntrospectionResult | None:
+        key = (connection_string, version)
+        result = self._entries.get(key)
+        if result is not None:
+            self._entries.move_to_end(key)
+        return result
+
+    def set(self, connection_string: str, version: str, result: IntrospectionResult) -> None:
+        key = (connection_string, version)
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+
 from ninja_core.schema.entity import EntitySchema
 from ninja_core.schema.project import AgenticSchema
 from ninja_core.schema.relationship import RelationshipSchema
 from ninja_core.security import SSRFError, check_ssrf
 
+from ninja_introspect.cache import IntrospectionCache
 from ninja_introspect.providers.base import IntrospectionProvider, IntrospectionResult
 from ninja_introspect.providers.graph import GraphProvider
 from ninja_introspect.providers.mongo import MongoProvider
@@ -22,18 +25,14 @@ _SCHEME_PROVIDER_MAP: dict[str, type[IntrospectionProvider]] = {
     "mysql+aiomysql": SQLProvider,
     "sqlite": SQLProvider,
     "sqlite+aiosqlite": SQLProvider,
-    "mongodb": SQLProvider,  # Overridden below
-    "mongodb+srv": SQLProvider,  # Overridden below
+    "mongodb": MongoProvider,
+    "mongodb+srv": MongoProvider,
     "bolt": GraphProvider,
     "neo4j": GraphProvider,
     "neo4j+s": GraphProvider,
     "neo4j+ssc": GraphProvider,
 }
 
-# Mongo schemes override the default
-_SCHEME_PROVIDER_MAP["mongodb"] = MongoProvider  # type: ignore[assignment]
-_SCHEME_PROVIDER_MAP["mongodb+srv"] = MongoProvider  # type: ignore[assignment]
-
 
 def _detect_provider(
     connection_string: str,
@@ -49,7 +48,8 @@ def _detect_provider(
     Raises:
         SSRFError: If the connection string targets a blocked network address.
     """
-    scheme = connection_string.split("://")[0].lower() if "://" in connection_string else ""
+    head, sep, _ = connection_string.partition("://")
+    scheme = head.lower() if sep else ""
 
     provider_class = _SCHEME_PROVIDER_MAP.get(scheme)
     if provider_class is not None:
@@ -76,6 +76,9 @@ def _detect_provider(
 class IntrospectionEngine:
     """Orchestrates multiple introspection providers and merges their results.
 
+    Pass an :class:`~ninja_introspect.cache.IntrospectionCache` to reuse results
+    for sources whose provider reports an unchanged schema version.
+
     Usage::
 
         engine = IntrospectionEngine(project_name="my-project")
@@ -90,9 +93,11 @@ class IntrospectionEngine:
         project_name: str = "untitled",
         *,
         allow_private_hosts: bool = False,
+        cache: IntrospectionCache | None = None,
     ) -> None:
         self.project_name = project_name
         self.allow_private_hosts = allow_private_hosts
+        self.cache = cache
 
     async def run(
         self,
@@ -102,6 +107,8 @@ class IntrospectionEngine:
     ) -> AgenticSchema:
         """Run introspection across all connection strings and merge results.
 
+        Sources are introspected concurrently and merged in the order given.
+
         Args:
             connection_strings: List of database connection URIs.
             providers: Optional mapping of connection string -> provider override.
@@ -109,19 +116,39 @@ class IntrospectionEngine:
         Returns:
             A merged AgenticSchema containing entities and relationships from all sources.
         """
-        all_entities: list[EntitySchema] = []
-        all_relationships: list[RelationshipSchema] = []
-
+        # Resolve every provider first so configuration and SSRF errors surface
+        # before any database is contacted.
+        selected: list[IntrospectionProvider] = []
+        detected: list[IntrospectionProvider] = []
         for conn_str in connection_strings:
             if providers and conn_str in providers:
-                provider = providers[conn_str]
+                selected.append(providers[conn_str])
             else:
-                provider = _detect_provider(
-                    conn_str,
-                    allow_private_hosts=self.allow_private_hosts,
-                )
+                provider = _detect_provider(conn_str, allow_private_hosts=self.allow_private_hosts)
+                selected.append(provider)
+                detected.append(provider)
+
+        # Introspection is I/O-bound, so the sources are queried concurrently;
+        # results are merged in connection-string order.  Providers created
+        # here are closed afterwards; caller-supplied ones stay open.
+        tasks = [
+            asyncio.create_task(self._introspect(provider, conn_str))
+            for provider, conn_str in zip(selected, connection_strings)
+        ]
+        try:
+            results: list[IntrospectionResult] = await asyncio.gather(*tasks)
+        finally:
+            # gather() leaves the other sources running when one fails; stop
+            # them before closing the providers they are still using.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            for provider in detected:
+                await provider.aclose()
 
-            result: IntrospectionResult = await provider.introspect(conn_str)
+        all_entities: list[EntitySchema] = []
+        all_relationships: list[RelationshipSchema] = []
+        for result in results:
             all_entities.extend(result.entities)
             all_relationships.extend(result.relationships)
 
@@ -130,3 +157,19 @@ class IntrospectionEngine:
             entities=all_entities,
             relationships=all_relationships,
         )
+
+    async def _introspect(self, provider: IntrospectionProvider, connection_string: str) -> IntrospectionResult:
+        """Introspect one source, reusing a cached result while its schema version is unchanged."""
+        if self.cache is None:
+            return await provider.introspect(connection_string)
+
+        version = await provider.schema_version(connection_string)
+        if version is None:
+            return await provider.introspect(connection_string)
+
+        cached = self.cache.get(connection_string, version)
+        if cached is not None:
+            return cached
+        result = await provider.introspect(connection_string)
+        self.cache.set(connection_string, version, result)
+        return result
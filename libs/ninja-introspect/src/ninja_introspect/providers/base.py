@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from types import TracebackType
+from typing import Self
 
 from ninja_core.schema.entity import EntitySchema
 from ninja_core.schema.relationship import RelationshipSchema
@@ -22,6 +24,12 @@ class IntrospectionProvider(ABC):
 
     Each provider connects to a specific database type, reads its schema,
     and produces EntitySchema + RelationshipSchema objects.
+
+    A provider owns the connections it opens, and whoever creates the
+    provider must close it, either with :meth:`aclose` or by using it as an
+    ``async with`` block.  :class:`~ninja_introspect.engine.IntrospectionEngine`
+    closes the providers it detects itself, but never ones passed in by the
+    caller.
     """
 
     @abstractmethod
@@ -34,3 +42,36 @@ class IntrospectionProvider(ABC):
         Returns:
             IntrospectionResult containing discovered entities and relationships.
         """
+
+    async def schema_version(self, connection_string: str) -> str | None:
+        """Return a cheap fingerprint of the database schema, or ``None``.
+
+        When an :class:`~ninja_introspect.cache.IntrospectionCache` is in use,
+        a source whose fingerprint matches a cached one is not introspected
+        again. Providers should only return a value that changes whenever
+        :meth:`introspect` could return a different result; the default
+        ``None`` means results are never cached.
+
+        Args:
+            connection_string: Database connection URI.
+        """
+        return None
+
+    async def aclose(self) -> None:
+        """Close any connections the provider keeps open between calls.
+
+        Providers may reuse a client per connection string across
+        :meth:`schema_version` and :meth:`introspect` calls; the default
+        holds none and does nothing.
+        """
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.aclose()
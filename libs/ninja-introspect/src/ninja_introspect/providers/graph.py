@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Any
+import hashlib
+import json
+from typing import Any, Iterable
 
 from neo4j import AsyncGraphDatabase
+from neo4j.exceptions import Neo4jError
 from ninja_core.schema.entity import EntitySchema, FieldSchema, FieldType, StorageEngine
 from ninja_core.schema.relationship import Cardinality, RelationshipSchema, RelationshipType
 
@@ -26,9 +29,25 @@ _NEO4J_TYPE_MAP: dict[str, FieldType] = {
 
 def _neo4j_type_to_field_type(neo4j_type: str) -> FieldType:
     """Map a Neo4j property type string to a FieldType."""
+    if neo4j_type.endswith("Array"):
+        return FieldType.ARRAY
     return _NEO4J_TYPE_MAP.get(neo4j_type, FieldType.STRING)
 
 
+def _merge_neo4j_types(neo4j_types: Iterable[str]) -> FieldType:
+    """Return one FieldType for a property stored with every type in *neo4j_types*.
+
+    Integers mixed with floats widen to FLOAT; any other mix falls back to
+    STRING, which is also the result when no type is reported.
+    """
+    field_types = {_neo4j_type_to_field_type(t) for t in neo4j_types}
+    if len(field_types) == 1:
+        return field_types.pop()
+    if field_types == {FieldType.INTEGER, FieldType.FLOAT}:
+        return FieldType.FLOAT
+    return FieldType.STRING
+
+
 def _python_type_to_field_type(value: Any) -> FieldType:
     """Infer FieldType from a Python value returned by Neo4j."""
     if isinstance(value, bool):
@@ -42,34 +61,111 @@ def _python_type_to_field_type(value: Any) -> FieldType:
     return FieldType.STRING
 
 
+def _node_type_fields(records: Iterable[Any]) -> dict[str, list[FieldSchema]]:
+    """Merge ``db.schema.nodeTypeProperties()`` rows into fields per label.
+
+    There is one row per (node type, property).  A node type is a distinct
+    label combination, so a label's properties are merged across all of its
+    node types.  A property is nullable unless every node type of the label
+    has it and reports it as mandatory, and a property stored with several
+    types gets the type :func:`_merge_neo4j_types` picks for all of them.  Rows without a ``propertyName``
+    (node types with no properties) only register the node type.  Labels
+    and fields are returned sorted by name.
+    """
+    node_types: dict[str, set[str]] = {}
+    props_info: dict[str, dict[str, dict[str, Any]]] = {}
+    for record in records:
+        node_type = record["nodeType"]
+        prop_name = record["propertyName"]
+        for label in record["nodeLabels"]:
+            node_types.setdefault(label, set()).add(node_type)
+            if prop_name is None:
+                continue
+            info = props_info.setdefault(label, {}).get(prop_name)
+            if info is None:
+                props_info[label][prop_name] = info = {"types": set(), "node_types": set(), "mandatory": True}
+            info["types"].update(record["propertyTypes"] or ())
+            info["node_types"].add(node_type)
+            info["mandatory"] = info["mandatory"] and bool(record["mandatory"])
+
+    return {
+        label: [
+            FieldSchema(
+                name=prop_name,
+                field_type=_merge_neo4j_types(info["types"]),
+                nullable=not info["mandatory"] or info["node_types"] != node_types[label],
+            )
+            for prop_name, info in sorted(props_info[label].items())
+        ]
+        for label in sorted(props_info)
+    }
+
+
 DEFAULT_SAMPLE_SIZE = 100
 
 
 class GraphProvider(IntrospectionProvider):
-    """Introspects Neo4j graph databases — reads node labels, relationship types, and properties."""
+    """Introspects Neo4j graph databases — reads node labels, relationship types, and properties.
 
-    def __init__(self, sample_size: int = DEFAULT_SAMPLE_SIZE) -> None:
+    Properties are inferred from up to *sample_size* nodes per label.  With
+    ``use_schema_procedure=True`` they are read from
+    ``db.schema.nodeTypeProperties()`` instead, which is exact but scans
+    every node, so it is only worth enabling for small graphs.
+    """
+
+    def __init__(self, sample_size: int = DEFAULT_SAMPLE_SIZE, *, use_schema_procedure: bool = False) -> None:
         self.sample_size = sample_size
+        self.use_schema_procedure = use_schema_procedure
+        # connection string -> driver, kept open until aclose()
+        self._drivers: dict[str, Any] = {}
 
     async def introspect(self, connection_string: str) -> IntrospectionResult:
-        driver = AsyncGraphDatabase.driver(connection_string)
-        try:
-            return await self._run_introspection(driver)
-        finally:
+        return await self._run_introspection(self._driver(connection_string))
+
+    async def aclose(self) -> None:
+        drivers = list(self._drivers.values())
+        self._drivers.clear()
+        for driver in drivers:
             await driver.close()
 
+    def _driver(self, connection_string: str) -> Any:
+        """Return the driver for *connection_string*, creating it on first use."""
+        driver = self._drivers.get(connection_string)
+        if driver is None:
+            driver = self._drivers[connection_string] = AsyncGraphDatabase.driver(connection_string)
+        return driver
+
+    async def schema_version(self, connection_string: str) -> str | None:
+        """Fingerprint the label, relationship-type and property-key catalogs.
+
+        These are cheap catalog reads; a new label, relationship type or
+        property name changes the fingerprint. Type changes of an existing
+        property do not, so cached results may lag those until one of the
+        catalogs changes.
+        """
+        async with self._driver(connection_string).session() as session:
+            catalogs: list[Any] = [self.sample_size, self.use_schema_procedure]
+            for procedure, column in (
+                ("db.labels", "label"),
+                ("db.relationshipTypes", "relationshipType"),
+                ("db.propertyKeys", "propertyKey"),
+            ):
+                result = await session.run(f"CALL {procedure}()")
+                catalogs.append(sorted([record[column] async for record in result]))
+        return hashlib.blake2b(json.dumps(catalogs).encode(), digest_size=16).hexdigest()
+
     async def _run_introspection(self, driver: Any) -> IntrospectionResult:
         entities: list[EntitySchema] = []
         relationships: list[RelationshipSchema] = []
 
         async with driver.session() as session:
-            # Get all node labels
-            labels = await self._get_node_labels(session)
-
-            for label in sorted(labels):
-                entity = await self._introspect_label(session, label)
-                if entity is not None:
-                    entities.append(entity)
+            node_types = await self._introspect_node_types(session) if self.use_schema_procedure else None
+            if node_types is not None:
+                entities.extend(node_types)
+            else:
+                # Sample the labels (the default, or the schema procedure is unavailable).
+                labels = await self._get_node_labels(session)
+                entities.extend(await self._introspect_labels(session, sorted(labels)))
 
             # Get relationship types
             rel_types = await self._get_relationship_types(session)
@@ -78,10 +174,27 @@ class GraphProvider(IntrospectionProvider):
 
         return IntrospectionResult(entities=entities, relationships=relationships)
 
+    async def _introspect_node_types(self, session: Any) -> list[EntitySchema] | None:
+        """Read every label's properties in one call to ``db.schema.nodeTypeProperties()``.
+
+        Returns ``None`` when the procedure cannot be called (e.g. older
+        servers or restricted users), so the caller can fall back to sampling.
+        Rows are merged into fields by :func:`_node_type_fields`.
+        """
+        try:
+            result = await session.run("CALL db.schema.nodeTypeProperties()")
+            records = [record async for record in result]
+        except Neo4jError:
+            return None
+
+        return [
+            EntitySchema(name=label, storage_engine=StorageEngine.GRAPH, fields=fields)
+            for label, fields in _node_type_fields(records).items()
+        ]
+
     async def _get_node_labels(self, session: Any) -> list[str]:
         result = await session.run("CALL db.labels()")
-        records = [record async for record in result]
-        return [record["label"] for record in records]
+        return [record["label"] async for record in result]
 
     async def _get_relationship_types(self, session: Any) -> list[RelationshipSchema]:
         """Discover relationship types by sampling the graph."""
@@ -107,45 +220,46 @@ class GraphProvider(IntrospectionProvider):
             )
         return relationships
 
-    async def _introspect_label(self, session: Any, label: str) -> EntitySchema | None:
-        """Sample nodes with a given label and infer properties."""
-        result = await session.run(
-            f"MATCH (n:`{label}`) RETURN properties(n) AS props LIMIT $limit",
-            limit=self.sample_size,
-        )
-        records = [record async for record in result]
-        if not records:
-            return None
+    async def _introspect_labels(self, session: Any, labels: list[str]) -> list[EntitySchema]:
+        """Sample nodes of every label in one query and infer properties per label.
 
-        # Merge properties across sampled nodes
-        total = len(records)
-        props_info: dict[str, dict[str, Any]] = {}
-        for record in records:
-            props = record["props"]
-            for key, value in props.items():
-                if key not in props_info:
-                    props_info[key] = {
-                        "type": _python_type_to_field_type(value),
-                        "seen": 1,
-                    }
-                else:
-                    props_info[key]["seen"] += 1
-
-        fields: list[FieldSchema] = []
-        for prop_name, info in sorted(props_info.items()):
-            fields.append(
+        Each label gets its own ``UNION ALL`` branch so the server can use the
+        label scan and apply the sample limit per label. Properties are
+        aggregated server-side, so each branch returns one row per property
+        key (with one sample value for type inference) rather than every
+        property of every sampled node.
+        """
+        if not labels:
+            return []
+
+        branches = []
+        params: dict[str, Any] = {"limit": self.sample_size}
+        for i, label in enumerate(labels):
+            escaped = label.replace("`", "``")
+            branches.append(
+                f"MATCH (n:`{escaped}`) WITH n LIMIT $limit "
+                "WITH collect(n) AS sampled WITH sampled, size(sampled) AS total "
+                "UNWIND sampled AS n UNWIND keys(n) AS prop "
+                f"RETURN $label{i} AS label, total, prop AS key, count(*) AS seen, head(collect(n[prop])) AS sample"
+            )
+            params[f"label{i}"] = label
+        result = await session.run(" UNION ALL ".join(branches), **params)
+
+        fields_by_label: dict[str, list[FieldSchema]] = {}
+        async for record in result:
+            fields_by_label.setdefault(record["label"], []).append(
                 FieldSchema(
-                    name=prop_name,
-                    field_type=info["type"],
-                    nullable=info["seen"] < total,
+                    name=record["key"],
+                    field_type=_python_type_to_field_type(record["sample"]),
+                    nullable=record["seen"] < record["total"],
                 )
             )
 
-        if not fields:
-            return None
-
-        return EntitySchema(
-            name=label,
-            storage_engine=StorageEngine.GRAPH,
-            fields=fields,
-        )
+        entities: list[EntitySchema] = []
+        for label in labels:
+            fields = fields_by_label.get(label)
+            if not fields:
+                continue
+            fields.sort(key=lambda f: f.name)
+            entities.append(EntitySchema(name=label, storage_engine=StorageEngine.GRAPH, fields=fields))
+        return entities
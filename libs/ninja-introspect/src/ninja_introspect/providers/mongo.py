@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 from motor.motor_asyncio import AsyncIOMotorClient
@@ -23,6 +26,7 @@ _PYTHON_TYPE_MAP: dict[type, FieldType] = {
 }
 
 DEFAULT_SAMPLE_SIZE = 100
+DEFAULT_MAX_CONCURRENCY = 10
 
 
 def _infer_field_type(value: Any) -> FieldType:
@@ -32,62 +36,92 @@ def _infer_field_type(value: Any) -> FieldType:
     return _PYTHON_TYPE_MAP.get(type(value), FieldType.STRING)
 
 
+_NAME_SEPARATOR_RE = re.compile(r"[-_]")
+
+
+@lru_cache(maxsize=1024)
 def _collection_to_pascal(name: str) -> str:
     """Convert a collection name to PascalCase entity name."""
-    return "".join(part.capitalize() for part in name.replace("-", "_").split("_"))
+    return "".join(part.capitalize() for part in _NAME_SEPARATOR_RE.split(name))
 
 
 def _merge_field_info(fields_info: dict[str, dict[str, Any]], doc: dict[str, Any]) -> None:
     """Merge field information from a single document into the accumulated info."""
     for key, value in doc.items():
-        if key not in fields_info:
+        info = fields_info.get(key)
+        if info is None:
             fields_info[key] = {
                 "type": _infer_field_type(value),
                 "nullable": value is None,
                 "seen": 1,
             }
-        else:
-            info = fields_info[key]
-            info["seen"] += 1
-            if value is None:
-                info["nullable"] = True
-            else:
-                # Upgrade type if we see a more specific value
-                inferred = _infer_field_type(value)
-                if info["type"] == FieldType.STRING and inferred != FieldType.STRING:
-                    info["type"] = inferred
+            continue
+        info["seen"] += 1
+        if value is None:
+            info["nullable"] = True
+        elif info["type"] is FieldType.STRING:
+            # Upgrade type if we see a more specific value
+            info["type"] = _PYTHON_TYPE_MAP.get(type(value), FieldType.STRING)
 
 
 class MongoProvider(IntrospectionProvider):
     """Introspects MongoDB databases by sampling documents to infer schema."""
 
-    def __init__(self, sample_size: int = DEFAULT_SAMPLE_SIZE) -> None:
+    def __init__(
+        self,
+        sample_size: int = DEFAULT_SAMPLE_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        *,
+        use_sample_stage: bool = True,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
         self.sample_size = sample_size
+        # Sample with a random ``$sample`` stage rather than the first documents in natural order
+        self.use_sample_stage = use_sample_stage
+        # Upper bound on collections sampled at once, to avoid swamping the cluster
+        self.max_concurrency = max_concurrency
+        # connection string -> client, kept open until aclose()
+        self._clients: dict[str, AsyncIOMotorClient] = {}  # type: ignore[type-arg]
 
     async def introspect(self, connection_string: str) -> IntrospectionResult:
-        client: AsyncIOMotorClient = AsyncIOMotorClient(connection_string)  # type: ignore[type-arg]
-        try:
-            db_name = client.get_default_database().name  # type: ignore[union-attr]
-            db = client[db_name]
-
-            collection_names: list[str] = await db.list_collection_names()
-            # Filter out system collections
-            collection_names = [c for c in collection_names if not c.startswith("system.")]
-
-            entities: list[EntitySchema] = []
-            for coll_name in sorted(collection_names):
-                entity = await self._introspect_collection(db, coll_name)
-                if entity is not None:
-                    entities.append(entity)
-
-            return IntrospectionResult(entities=entities)
-        finally:
+        client = self._client(connection_string)
+        db_name = client.get_default_database().name  # type: ignore[union-attr]
+        db = client[db_name]
+
+        collection_names: list[str] = await db.list_collection_names()
+        # Filter out system collections
+        collection_names = [c for c in collection_names if not c.startswith("system.")]
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def sample(coll_name: str) -> EntitySchema | None:
+            async with semaphore:
+                return await self._introspect_collection(db, coll_name)
+
+        results = await asyncio.gather(*(sample(coll_name) for coll_name in sorted(collection_names)))
+        return IntrospectionResult(entities=[entity for entity in results if entity is not None])
+
+    async def aclose(self) -> None:
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
             client.close()
 
+    def _client(self, connection_string: str) -> AsyncIOMotorClient:  # type: ignore[type-arg]
+        """Return the client for *connection_string*, creating it on first use."""
+        client = self._clients.get(connection_string)
+        if client is None:
+            client = self._clients[connection_string] = AsyncIOMotorClient(connection_string)
+        return client
+
     async def _introspect_collection(self, db: Any, collection_name: str) -> EntitySchema | None:
         """Sample documents from a collection and infer its schema."""
         collection = db[collection_name]
-        cursor = collection.find().limit(self.sample_size)
+        if self.use_sample_stage:
+            cursor = collection.aggregate([{"$sample": {"size": self.sample_size}}])
+        else:
+            cursor = collection.find().limit(self.sample_size)
         docs = await cursor.to_list(length=self.sample_size)
 
         if not docs:
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import patch
 
 import pytest
 from ninja_core.schema.entity import EntitySchema, FieldSchema, FieldType, StorageEngine
 from ninja_core.security import SSRFError
-from ninja_introspect.engine import IntrospectionEngine, _detect_provider
+from ninja_introspect.cache import IntrospectionCache
+from ninja_introspect.engine import _SCHEME_PROVIDER_MAP, IntrospectionEngine, _detect_provider
 from ninja_introspect.providers.base import IntrospectionProvider, IntrospectionResult
 from ninja_introspect.providers.graph import GraphProvider
 from ninja_introspect.providers.mongo import MongoProvider
@@ -45,6 +47,10 @@ class TestDetectProvider:
         with patch("ninja_core.security.socket.getaddrinfo", side_effect=OSError):
             assert isinstance(_detect_provider("mongodb+srv://host/db"), MongoProvider)
 
+    def test_mongo_schemes_map_to_mongo_provider(self):
+        assert _SCHEME_PROVIDER_MAP["mongodb"] is MongoProvider
+        assert _SCHEME_PROVIDER_MAP["mongodb+srv"] is MongoProvider
+
     def test_neo4j(self):
         assert isinstance(
             _detect_provider("neo4j://localhost:7687", allow_private_hosts=True),
@@ -203,3 +209,150 @@ async def test_engine_multiple_sources(sqlite_url):
     storage_engines = {e.storage_engine for e in schema.entities}
     assert StorageEngine.SQL in storage_engines
     assert StorageEngine.MONGO in storage_engines
+
+
+async def test_engine_introspects_sources_concurrently():
+    """Each provider waits for the other to start, so a sequential run would time out."""
+    started = {"a://db": asyncio.Event(), "b://db": asyncio.Event()}
+
+    class WaitingProvider(IntrospectionProvider):
+        def __init__(self, name: str, other: str) -> None:
+            self.name = name
+            self.other = other
+
+        async def introspect(self, connection_string: str) -> IntrospectionResult:
+            started[connection_string].set()
+            await asyncio.wait_for(started[self.other].wait(), timeout=1)
+            return IntrospectionResult(
+                entities=[
+                    EntitySchema(
+                        name=self.name,
+                        storage_engine=StorageEngine.SQL,
+                        fields=[FieldSchema(name="id", field_type=FieldType.INTEGER, primary_key=True)],
+                    )
+                ]
+            )
+
+    engine = IntrospectionEngine(project_name="concurrent")
+    schema = await engine.run(
+        ["a://db", "b://db"],
+        providers={"a://db": WaitingProvider("Alpha", "b://db"), "b://db": WaitingProvider("Beta", "a://db")},
+    )
+
+    assert [e.name for e in schema.entities] == ["Alpha", "Beta"]
+
+
+class _VersionedProvider(IntrospectionProvider):
+    """Counts introspections and reports a settable schema version."""
+
+    def __init__(self, version: str | None) -> None:
+        self.version = version
+        self.calls = 0
+
+    async def schema_version(self, connection_string: str) -> str | None:
+        return self.version
+
+    async def introspect(self, connection_string: str) -> IntrospectionResult:
+        self.calls += 1
+        return IntrospectionResult(
+            entities=[
+                EntitySchema(
+                    name=f"Entity{self.calls}",
+                    storage_engine=StorageEngine.SQL,
+                    fields=[FieldSchema(name="id", field_type=FieldType.INTEGER, primary_key=True)],
+                )
+            ]
+        )
+
+
+class TestIntrospectionCache:
+    async def test_reuses_result_while_version_unchanged(self):
+        provider = _VersionedProvider("v1")
+        engine = IntrospectionEngine(project_name="cached", cache=IntrospectionCache())
+
+        first = await engine.run(["custom://db"], providers={"custom://db": provider})
+        second = await engine.run(["custom://db"], providers={"custom://db": provider})
+
+        assert provider.calls == 1
+        assert [e.name for e in second.entities] == [e.name for e in first.entities]
+
+    async def test_version_change_reintrospects(self):
+        provider = _VersionedProvider("v1")
+        engine = IntrospectionEngine(project_name="cached", cache=IntrospectionCache())
+
+        await engine.run(["custom://db"], providers={"custom://db": provider})
+        provider.version = "v2"
+        schema = await engine.run(["custom://db"], providers={"custom://db": provider})
+
+        assert provider.calls == 2
+        assert schema.entities[0].name == "Entity2"
+
+    async def test_unversioned_provider_is_not_cached(self):
+        provider = _VersionedProvider(None)
+        cache = IntrospectionCache()
+        engine = IntrospectionEngine(project_name="cached", cache=cache)
+
+        await engine.run(["custom://db"], providers={"custom://db": provider})
+        await engine.run(["custom://db"], providers={"custom://db": provider})
+
+        assert provider.calls == 2
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        cache = IntrospectionCache(max_entries=2)
+        a, b, c = IntrospectionResult(), IntrospectionResult(), IntrospectionResult()
+        cache.set("a", "v", a)
+        cache.set("b", "v", b)
+        assert cache.get("a", "v") is a
+        cache.set("c", "v", c)
+
+        assert cache.get("b", "v") is None
+        assert cache.get("a", "v") is a
+        assert cache.get("c", "v") is c
+
+
+async def test_engine_closes_only_providers_it_created():
+    class ClosingProvider(IntrospectionProvider):
+        closed = False
+
+        async def introspect(self, connection_string: str) -> IntrospectionResult:
+            return IntrospectionResult()
+
+        async def aclose(self) -> None:
+            self.closed = True
+
+    detected = ClosingProvider()
+    supplied = ClosingProvider()
+    engine = IntrospectionEngine(project_name="closing")
+    with patch("ninja_introspect.engine._detect_provider", return_value=detected):
+        await engine.run(["detected://db", "supplied://db"], providers={"supplied://db": supplied})
+
+    assert detected.closed
+    assert not supplied.closed
+
+
+async def test_engine_stops_other_sources_before_closing_on_failure():
+    events: list[str] = []
+
+    class FailingProvider(IntrospectionProvider):
+        async def introspect(self, connection_string: str) -> IntrospectionResult:
+            raise RuntimeError("connection refused")
+
+    class SlowProvider(IntrospectionProvider):
+        async def introspect(self, connection_string: str) -> IntrospectionResult:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                events.append("cancelled")
+                raise
+            return IntrospectionResult()
+
+        async def aclose(self) -> None:
+            events.append("closed")
+
+    engine = IntrospectionEngine(project_name="failing")
+    with patch("ninja_introspect.engine._detect_provider", return_value=SlowProvider()):
+        with pytest.raises(RuntimeError, match="connection refused"):
+            await engine.run(["slow://db", "failing://db"], providers={"failing://db": FailingProvider()})
+
+    assert events == ["cancelled", "closed"]
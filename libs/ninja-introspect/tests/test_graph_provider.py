@@ -4,9 +4,16 @@ from __future__ import annotations
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from neo4j.exceptions import ClientError
 from ninja_core.schema.entity import FieldType, StorageEngine
 from ninja_core.schema.relationship import RelationshipType
-from ninja_introspect.providers.graph import GraphProvider, _python_type_to_field_type
+from ninja_introspect.providers.graph import (
+    GraphProvider,
+    _merge_neo4j_types,
+    _neo4j_type_to_field_type,
+    _node_type_fields,
+    _python_type_to_field_type,
+)
 
 
 class TestPythonTypeToFieldType:
@@ -26,6 +33,86 @@ class TestPythonTypeToFieldType:
         assert _python_type_to_field_type("hello") == FieldType.STRING
 
 
+class TestNeo4jTypeToFieldType:
+    def test_scalar(self):
+        assert _neo4j_type_to_field_type("Long") == FieldType.INTEGER
+        assert _neo4j_type_to_field_type("DateTime") == FieldType.DATETIME
+
+    def test_array(self):
+        assert _neo4j_type_to_field_type("StringArray") == FieldType.ARRAY
+
+    def test_unknown_defaults_to_string(self):
+        assert _neo4j_type_to_field_type("Duration") == FieldType.STRING
+
+
+class TestMergeNeo4jTypes:
+    def test_single_type(self):
+        assert _merge_neo4j_types(["Long"]) == FieldType.INTEGER
+
+    def test_numbers_widen_to_float(self):
+        assert _merge_neo4j_types(["Long", "Double"]) == FieldType.FLOAT
+
+    def test_mixed_types_fall_back_to_string(self):
+        assert _merge_neo4j_types(["Long", "Boolean"]) == FieldType.STRING
+
+    def test_no_types_default_to_string(self):
+        assert _merge_neo4j_types([]) == FieldType.STRING
+
+
+def _node_type_row(node_type: str, labels: list[str], prop: str | None, types: list[str] | None, mandatory: bool):
+    return {
+        "nodeType": node_type,
+        "nodeLabels": labels,
+        "propertyName": prop,
+        "propertyTypes": types,
+        "mandatory": mandatory,
+    }
+
+
+class TestNodeTypeFields:
+    """Merging of ``db.schema.nodeTypeProperties()`` rows into per-label fields."""
+
+    ROWS = [
+        # (:Person) nodes
+        _node_type_row(":`Person`", ["Person"], "name", ["String"], True),
+        _node_type_row(":`Person`", ["Person"], "score", ["Long"], True),
+        # (:Person:Employee) nodes: no nickname, score also stored as a float
+        _node_type_row(":`Person`:`Employee`", ["Person", "Employee"], "name", ["String"], True),
+        _node_type_row(":`Person`:`Employee`", ["Person", "Employee"], "score", ["Long", "Double"], True),
+        _node_type_row(":`Person`:`Employee`", ["Person", "Employee"], "salary", ["Double"], False),
+        _node_type_row(":`Person`", ["Person"], "nickname", ["String"], True),
+        # (:Tag) nodes without properties
+        _node_type_row(":`Tag`", ["Tag"], None, None, False),
+    ]
+
+    def _fields(self) -> dict[str, dict[str, tuple[FieldType, bool]]]:
+        return {
+            label: {f.name: (f.field_type, f.nullable) for f in fields}
+            for label, fields in _node_type_fields(self.ROWS).items()
+        }
+
+    def test_labels_merged_across_node_types(self):
+        fields = _node_type_fields(self.ROWS)
+        assert list(fields) == ["Employee", "Person"]
+        assert [f.name for f in fields["Person"]] == ["name", "nickname", "salary", "score"]
+        assert [f.name for f in fields["Employee"]] == ["name", "salary", "score"]
+
+    def test_nullable_unless_mandatory_in_every_node_type(self):
+        person = self._fields()["Person"]
+        assert person["name"] == (FieldType.STRING, False)
+        assert person["nickname"] == (FieldType.STRING, True)  # missing from :Person:Employee
+        assert person["salary"] == (FieldType.FLOAT, True)  # not mandatory, one node type only
+        assert self._fields()["Employee"]["salary"] == (FieldType.FLOAT, True)  # not mandatory
+
+    def test_multi_typed_property_widened(self):
+        fields = self._fields()
+        assert fields["Person"]["score"] == (FieldType.FLOAT, False)
+        assert fields["Employee"]["score"] == (FieldType.FLOAT, False)
+
+    def test_rows_without_property_skipped(self):
+        assert "Tag" not in _node_type_fields(self.ROWS)
+
+
 class _AsyncIterator:
     """Helper to make a list async-iterable (for mocking Neo4j results)."""
 
@@ -49,27 +136,53 @@ def _make_record(data: dict):
     return record
 
 
-def _make_mock_driver(labels: list[str], nodes: dict[str, list[dict]], rels: list[dict]):
-    """Create a mock Neo4j async driver."""
+def _make_mock_driver(
+    labels: list[str],
+    nodes: dict[str, list[dict]],
+    rels: list[dict],
+    node_type_properties: list[dict] | None = None,
+    queries: list[str] | None = None,
+):
+    """Create a mock Neo4j async driver.
+
+    ``db.schema.nodeTypeProperties()`` fails unless *node_type_properties* rows
+    are given, so the fallback to sampling can be exercised.
+    """
     driver = MagicMock()
 
     session = MagicMock()
 
     async def mock_run(query, **kwargs):
+        if queries is not None:
+            queries.append(query)
         result = MagicMock()
-        if "db.labels" in query:
+        if "db.schema.nodeTypeProperties" in query:
+            if node_type_properties is None:
+                raise ClientError("There is no procedure with the name `db.schema.nodeTypeProperties`")
+            records = [_make_record(r) for r in node_type_properties]
+            result.__aiter__ = lambda self, r=records: _AsyncIterator(r).__aiter__()
+            result.__anext__ = lambda self, r=records: _AsyncIterator(r).__anext__()
+        elif "db.labels" in query:
             records = [_make_record({"label": lbl}) for lbl in labels]
             result.__aiter__ = lambda self: _AsyncIterator(records).__aiter__()
             result.__anext__ = lambda self: _AsyncIterator(records).__anext__()
-        elif "properties(n)" in query:
-            # Extract label from query
-            label = None
-            for lbl in labels:
-                if f"`{lbl}`" in query:
-                    label = lbl
-                    break
-            docs = nodes.get(label, [])
-            records = [_make_record({"props": doc}) for doc in docs]
+        elif "keys(n)" in query:
+            # One UNION ALL branch per sampled label, each aggregating its sample per property key
+            records = []
+            for param, lbl in kwargs.items():
+                if not param.startswith("label"):
+                    continue
+                docs = nodes.get(lbl, [])[: kwargs["limit"]]
+                seen: dict[str, int] = {}
+                samples: dict[str, object] = {}
+                for doc in docs:
+                    for key, value in doc.items():
+                        seen[key] = seen.get(key, 0) + 1
+                        samples.setdefault(key, value)
+                records += [
+                    _make_record({"label": lbl, "total": len(docs), "key": k, "seen": n, "sample": samples[k]})
+                    for k, n in seen.items()
+                ]
             result.__aiter__ = lambda self, r=records: _AsyncIterator(r).__aiter__()
             result.__anext__ = lambda self, r=records: _AsyncIterator(r).__anext__()
         elif "MATCH (a)-[r]->(b)" in query:
@@ -179,3 +292,94 @@ async def test_field_types_inferred(mock_neo4j):
     assert fields_by_name["price"].field_type == FieldType.FLOAT
     assert fields_by_name["active"].field_type == FieldType.BOOLEAN
     assert fields_by_name["tags"].field_type == FieldType.ARRAY
+
+
+@patch("ninja_introspect.providers.graph.AsyncGraphDatabase")
+async def test_schema_procedure_replaces_label_sampling(mock_neo4j):
+    queries: list[str] = []
+    mock_driver = _make_mock_driver(labels=["Person"], nodes={}, rels=[], node_type_properties=[], queries=queries)
+    mock_neo4j.driver.return_value = mock_driver
+
+    result = await GraphProvider(use_schema_procedure=True).introspect("bolt://localhost:7687")
+
+    assert result.entities == []
+    assert not any("db.labels" in q or "keys(n)" in q for q in queries)
+
+
+@patch("ninja_introspect.providers.graph.AsyncGraphDatabase")
+async def test_label_sampling_is_the_default(mock_neo4j):
+    queries: list[str] = []
+    mock_driver = _make_mock_driver(labels=["Person"], nodes={}, rels=[], node_type_properties=[], queries=queries)
+    mock_neo4j.driver.return_value = mock_driver
+
+    await GraphProvider().introspect("bolt://localhost:7687")
+
+    assert not any("db.schema.nodeTypeProperties" in q for q in queries)
+    assert any("keys(n)" in q for q in queries)
+
+
+@patch("ninja_introspect.providers.graph.AsyncGraphDatabase")
+async def test_schema_procedure_falls_back_to_sampling(mock_neo4j):
+    queries: list[str] = []
+    mock_driver = _make_mock_driver(labels=["Person"], nodes={}, rels=[], queries=queries)
+    mock_neo4j.driver.return_value = mock_driver
+
+    await GraphProvider(use_schema_procedure=True).introspect("bolt://localhost:7687")
+
+    assert any("db.schema.nodeTypeProperties" in q for q in queries)
+    assert any("keys(n)" in q for q in queries)
+
+
+@patch("ninja_introspect.providers.graph.AsyncGraphDatabase")
+async def test_label_sampling_uses_one_query(mock_neo4j):
+    queries: list[str] = []
+    mock_driver = _make_mock_driver(labels=["B", "A", "C"], nodes={}, rels=[], queries=queries)
+    mock_neo4j.driver.return_value = mock_driver
+
+    await GraphProvider().introspect("bolt://localhost:7687")
+
+    sampling = [q for q in queries if "keys(n)" in q]
+    assert len(sampling) == 1
+    assert sampling[0].count("UNION ALL") == 2
+
+
+@patch("ninja_introspect.providers.graph.AsyncGraphDatabase")
+async def test_schema_version_tracks_labels(mock_neo4j):
+    provider = GraphProvider()
+
+    mock_neo4j.driver.return_value = _make_mock_driver(labels=["Person"], nodes={}, rels=[])
+    first = await provider.schema_version("bolt://localhost:7687")
+    second = await provider.schema_version("bolt://localhost:7687")
+    await provider.aclose()
+    mock_neo4j.driver.return_value = _make_mock_driver(labels=["Person", "Company"], nodes={}, rels=[])
+    changed = await provider.schema_version("bolt://localhost:7687")
+
+    assert first == second
+    assert changed != first
+
+
+@patch("ninja_introspect.providers.graph.AsyncGraphDatabase")
+async def test_driver_reused_until_aclose(mock_neo4j):
+    mock_driver = _make_mock_driver(labels=[], nodes={}, rels=[])
+    mock_neo4j.driver.return_value = mock_driver
+    provider = GraphProvider()
+
+    await provider.schema_version("bolt://localhost:7687")
+    await provider.introspect("bolt://localhost:7687")
+    mock_driver.close.assert_not_awaited()
+    await provider.aclose()
+
+    assert mock_neo4j.driver.call_count == 1
+    mock_driver.close.assert_awaited_once()
+
+
+@patch("ninja_introspect.providers.graph.AsyncGraphDatabase")
+async def test_async_with_closes_driver(mock_neo4j):
+    mock_driver = _make_mock_driver(labels=[], nodes={}, rels=[])
+    mock_neo4j.driver.return_value = mock_driver
+
+    async with GraphProvider() as provider:
+        await provider.introspect("bolt://localhost:7687")
+        mock_driver.close.assert_not_awaited()
+
+    mock_driver.close.assert_awaited_once()
@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
 from ninja_core.schema.entity import FieldType, StorageEngine
-from ninja_introspect.providers.mongo import MongoProvider, _infer_field_type, _merge_field_info
+from ninja_introspect.providers.mongo import (
+    MongoProvider,
+    _collection_to_pascal,
+    _infer_field_type,
+    _merge_field_info,
+)
 
 
 class TestInferFieldType:
@@ -35,6 +42,11 @@ class TestInferFieldType:
         assert _infer_field_type(None) == FieldType.STRING
 
 
+def test_collection_to_pascal():
+    assert _collection_to_pascal("order_items") == "OrderItems"
+    assert _collection_to_pascal("audit-log") == "AuditLog"
+
+
 class TestMergeFieldInfo:
     def test_first_doc(self):
         info: dict = {}
@@ -57,6 +69,14 @@ class TestMergeFieldInfo:
         _merge_field_info(info, {"x": 3})
         assert info["x"]["seen"] == 3
 
+    def test_type_upgraded_from_null_first_value(self):
+        info: dict = {}
+        _merge_field_info(info, {"x": None})
+        _merge_field_info(info, {"x": 5})
+        _merge_field_info(info, {"x": "text"})
+        assert info["x"]["type"] == FieldType.INTEGER
+        assert info["x"]["nullable"] is True
+
 
 def _make_mock_client(db_name: str, collections: dict[str, list[dict]]):
     """Create a mock Motor client with the given collections and documents."""
@@ -93,6 +113,7 @@ def _make_collection_mock(collections: dict[str, list[dict]], name: str):
     mock_cursor = MagicMock()
     mock_cursor.to_list = AsyncMock(return_value=docs)
     mock_coll.find.return_value.limit.return_value = mock_cursor
+    mock_coll.aggregate.return_value = mock_cursor
     return mock_coll
 
 
@@ -168,3 +189,64 @@ async def test_filters_system_collections(mock_motor_cls):
     entity_names = {e.name for e in result.entities}
     assert "Users" in entity_names
     assert "SystemProfile" not in entity_names
+
+
+@patch("ninja_introspect.providers.mongo.AsyncIOMotorClient")
+async def test_collections_sampled_concurrently_up_to_limit(mock_motor_cls):
+    mock_motor_cls.return_value = _make_mock_client("testdb", {f"c{i}": [] for i in range(5)})
+    provider = MongoProvider(max_concurrency=2)
+    in_flight = peak = 0
+
+    async def fake_introspect_collection(db, collection_name):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return None
+
+    with patch.object(provider, "_introspect_collection", side_effect=fake_introspect_collection):
+        result = await provider.introspect("mongodb://localhost:27017/testdb")
+
+    assert result.entities == []
+    assert peak == 2
+
+
+@pytest.mark.parametrize("max_concurrency", [0, -1])
+def test_max_concurrency_must_be_positive(max_concurrency):
+    with pytest.raises(ValueError, match="max_concurrency"):
+        MongoProvider(max_concurrency=max_concurrency)
+
+
+async def test_sampling_uses_sample_stage_by_default():
+    coll = _make_collection_mock({"users": []}, "users")
+    db = {"users": coll}
+
+    await MongoProvider(sample_size=7)._introspect_collection(db, "users")
+
+    coll.aggregate.assert_called_once_with([{"$sample": {"size": 7}}])
+    coll.find.assert_not_called()
+
+
+async def test_sampling_can_read_natural_order():
+    coll = _make_collection_mock({"users": []}, "users")
+    db = {"users": coll}
+
+    await MongoProvider(sample_size=7, use_sample_stage=False)._introspect_collection(db, "users")
+
+    coll.find.return_value.limit.assert_called_once_with(7)
+    coll.aggregate.assert_not_called()
+
+
+@patch("ninja_introspect.providers.mongo.AsyncIOMotorClient")
+async def test_async_with_closes_reused_client(mock_motor_cls):
+    mock_client = _make_mock_client("testdb", {})
+    mock_motor_cls.return_value = mock_client
+
+    async with MongoProvider() as provider:
+        await provider.introspect("mongodb://localhost:27017/testdb")
+        await provider.introspect("mongodb://localhost:27017/testdb")
+        mock_client.close.assert_not_called()
+
+    assert mock_motor_cls.call_count == 1
+    mock_client.close.assert_called_once()